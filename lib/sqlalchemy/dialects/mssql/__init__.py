@@ -29,6 +29,7 @@ from .base import NCHAR
 from .base import NTEXT
 from .base import NUMERIC
 from .base import NVARCHAR
+from .base import openjson_values
 from .base import REAL
 from .base import ROWVERSION
 from .base import SMALLDATETIME
@@ -84,5 +85,6 @@ __all__ = (
     "SQL_VARIANT",
     "XML",
     "dialect",
+    "openjson_values",
     "try_cast",
 )
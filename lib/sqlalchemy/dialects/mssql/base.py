@@ -1649,6 +1649,55 @@ ischema_names = {
 }
 
 
+def openjson_values(values, type_=None):
+    r"""Produce a SELECT of a list of values sent to SQL Server as a single
+    JSON-encoded bound parameter, which is expanded into rows using the
+    ``OPENJSON`` function.
+
+    The construct is used to compare a column to a list of values that
+    is too large to be sent as individual bound parameters, given SQL
+    Server's limit of 2100 parameters per statement::
+
+        from sqlalchemy.dialects.mssql import openjson_values
+
+        stmt = select(user_table).where(
+            user_table.c.id.in_(openjson_values(user_ids, Integer))
+        )
+
+    The above statement renders as::
+
+        SELECT user_table.id, user_table.name FROM user_table
+        WHERE user_table.id IN (
+            SELECT CAST(anon_1.value AS INTEGER) AS value
+            FROM openjson(?) AS anon_1
+        )
+
+    The list is serialized using the :class:`_mssql.JSON` datatype, so each
+    value must be serializable by the dialect's JSON serializer; the
+    construct is intended for lists of integer or string values.  SQL
+    Server 2016 or greater is required.
+
+    .. versionadded:: 2.1
+
+    :param values: sequence of values.
+
+    :param type\_: optional datatype that each value is CAST to; when
+     omitted, values are returned by ``OPENJSON`` as ``NVARCHAR(max)``.
+
+    .. seealso::
+
+        :ref:`mssql_pyodbc_openjson_executemany`
+
+    """
+    rows = func.openjson(
+        expression.bindparam(None, list(values), type_=JSON)
+    ).table_valued("value")
+    value = rows.c.value
+    if type_ is not None:
+        value = expression.cast(value, type_)
+    return expression.select(value)
+
+
 class MSTypeCompiler(compiler.GenericTypeCompiler):
     def _extend(self, spec, type_, length=None):
         """Extend a string-type declaration with standard SQL
@@ -141,6 +141,8 @@ class MySQLDialect_aiomysql(MySQLDialect_pymysql):
     is_async = True
     has_terminate = True
 
+    supports_load_data_local_infile = False
+
     @classmethod
     def import_dbapi(cls):
         return AsyncAdapt_aiomysql_dbapi(
@@ -142,6 +142,8 @@ class MySQLDialect_asyncmy(MySQLDialect_pymysql):
     is_async = True
     has_terminate = True
 
+    supports_load_data_local_infile = False
+
     @classmethod
     def import_dbapi(cls):
         return AsyncAdapt_asyncmy_dbapi(__import__("asyncmy"))
@@ -51,6 +51,7 @@ class MySQLDialect_cymysql(MySQLDialect_mysqldb):
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
     supports_unicode_statements = True
+    supports_load_data_local_infile = False
 
     colspecs = util.update_copy(MySQLDialect.colspecs, {BIT: _cymysqlBIT})
 
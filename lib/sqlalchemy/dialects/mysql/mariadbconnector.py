@@ -111,6 +111,7 @@ class MySQLDialect_mariadbconnector(MySQLDialect):
     # is_mariadb = True
 
     supports_unicode_statements = True
+    supports_load_data_local_infile = True
     encoding = "utf8mb4"
     convert_unicode = True
     supports_sane_rowcount = True
@@ -113,6 +113,8 @@ class MySQLDialect_mysqldb(MySQLDialect):
 
     supports_native_decimal = True
 
+    supports_load_data_local_infile = True
+
     default_paramstyle = "format"
     execution_ctx_cls = MySQLExecutionContext_mysqldb
     statement_compiler = MySQLCompiler_mysqldb
@@ -75,9 +75,46 @@ The solution is similar to :ref:`pysqlite_serializable`. This is achieved by the
    with the SQLite driver,
    as this function necessarily will also alter the ".isolation_level" setting.
 
+.. _aiosqlite_thread_hops:
+
+Statement Execution and the Worker Thread
+-----------------------------------------
+
+aiosqlite runs each ``sqlite3`` connection within a dedicated worker thread,
+and each call made to its connection or cursor objects is an individual job
+passed to that thread, the result of which is awaited by the event loop.  As
+the round trip between the event loop and the worker thread typically costs
+more than executing a small query, the aiosqlite dialect invokes the
+``sqlite3`` cursor directly within the worker thread, so that creating the
+cursor, executing the statement and fetching all of its rows, or executing
+the statement for all sets of parameters in the case of ``executemany()``,
+takes place in a single job.  Server side cursors, which fetch rows on
+demand, continue to use aiosqlite's cursor.
+
+As each connection has only the one worker thread, statements are executed
+concurrently only across multiple connections.  For a file database, a pool
+that retains connections, such as :class:`.AsyncAdaptedQueuePool`, keeps a
+set of connections and their worker threads available to concurrent tasks,
+rather than starting a new thread for each checkout as is the case with the
+default :class:`.NullPool`::
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///myfile.db",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=5,
+    )
+
+.. versionchanged:: 2.1 Non server side cursors of the aiosqlite dialect
+   execute statements and fetch their rows within a single job of the
+   aiosqlite worker thread.
+
 """  # noqa
 
 import asyncio
+import collections
 from functools import partial
 
 from .base import SQLiteExecutionContext
@@ -90,7 +127,87 @@ from ...util.concurrency import await_
 
 
 class AsyncAdapt_aiosqlite_cursor(AsyncAdapt_dbapi_cursor):
-    __slots__ = ()
+    # the cursor is a plain sqlite3 cursor, which is created and invoked
+    # within the aiosqlite worker thread, so that each execution is a
+    # single job for that thread rather than one for each method call
+    __slots__ = ("_arraysize",)
+
+    def __init__(self, adapt_connection):
+        self._adapt_connection = adapt_connection
+        self._connection = adapt_connection._connection
+        self._cursor = None
+        self._rows = collections.deque()
+        self._arraysize = 1
+
+    @property
+    def description(self):
+        if self._cursor is None:
+            return None
+        return self._cursor.description
+
+    @property
+    def rowcount(self):
+        if self._cursor is None:
+            return -1
+        return self._cursor.rowcount
+
+    @property
+    def arraysize(self):
+        # rows are fetched in full within the worker thread, so arraysize
+        # only applies to fetchmany() from the buffered rows and isn't
+        # passed along to the sqlite3 cursor
+        return self._arraysize
+
+    @arraysize.setter
+    def arraysize(self, value):
+        self._arraysize = value
+
+    @property
+    def lastrowid(self):
+        if self._cursor is None:
+            return None
+        return self._cursor.lastrowid
+
+    def _sqlite_cursor(self):
+        if self._cursor is None:
+            self._cursor = self._connection._conn.cursor()
+        return self._cursor
+
+    def _execute_and_fetch(self, operation, parameters):
+        cursor = self._sqlite_cursor()
+        if parameters is None:
+            cursor.execute(operation)
+        else:
+            cursor.execute(operation, parameters)
+
+        if cursor.description:
+            return cursor.fetchall()
+        else:
+            return None
+
+    def _executemany(self, operation, seq_of_parameters):
+        self._sqlite_cursor().executemany(operation, seq_of_parameters)
+
+    async def _execute_async(self, operation, parameters):
+        async with self._adapt_connection._execute_mutex:
+            rows = await self._adapt_connection._run_in_thread(
+                self._execute_and_fetch, operation, parameters
+            )
+            if rows is not None:
+                self._rows = collections.deque(rows)
+
+    async def _executemany_async(self, operation, seq_of_parameters):
+        async with self._adapt_connection._execute_mutex:
+            await self._adapt_connection._run_in_thread(
+                self._executemany, operation, seq_of_parameters
+            )
+
+    def nextset(self):
+        # sqlite3 doesn't support multiple result sets
+        return None
+
+    def setinputsizes(self, *inputsizes):
+        pass
 
 
 class AsyncAdapt_aiosqlite_ss_cursor(AsyncAdapt_dbapi_ss_cursor):
@@ -117,16 +234,25 @@ class AsyncAdapt_aiosqlite_connection(AsyncAdapt_dbapi_connection):
         def set_iso(connection, value):
             connection.isolation_level = value
 
-        function = partial(set_iso, self._connection._conn, value)
-        future = asyncio.get_event_loop().create_future()
-
-        self._connection._tx.put_nowait((future, function))
-
         try:
-            return await_(future)
+            return await_(
+                self._run_in_thread(set_iso, self._connection._conn, value)
+            )
         except Exception as error:
             self._handle_exception(error)
 
+    async def _run_in_thread(self, fn, *args):
+        # run a function as a single job of aiosqlite's worker thread,
+        # which owns the sqlite3 connection, using aiosqlite's queue
+        # directly.  the thread is no longer running once the connection
+        # is closed, so don't queue a job that would never complete
+        if self._connection._connection is None:
+            raise ValueError("Connection closed")
+
+        future = asyncio.get_event_loop().create_future()
+        self._connection._tx.put_nowait((future, partial(fn, *args)))
+        return await future
+
     def create_function(self, *args, **kw):
         try:
             await_(self._connection.create_function(*args, **kw))
@@ -297,6 +297,48 @@ Note that :class:`.SingletonThreadPool` should be configured for the number
 of threads that are to be used; beyond that number, connections will be
 closed out in a non deterministic way.
 
+.. _pysqlite_serialize_writes:
+
+Serializing Writers for File Databases
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+SQLite allows only one write transaction against a database file at a time.
+When several pooled connections attempt to write concurrently, all but one
+of them wait on SQLite's file lock, polling it until the ``timeout`` given to
+``sqlite3.connect()`` expires, after which ``database is locked`` is raised.
+In `WAL mode <https://sqlite.org/wal.html>`_, readers aren't blocked by the
+writer, so the pool may serve many concurrent readers, while writers
+continue to contend with each other for the lock.
+
+The ``serialize_writes`` dialect parameter instead queues writers within
+the :class:`_engine.Engine`.  A connection that executes an INSERT, UPDATE,
+DELETE or DDL statement first waits on a lock held by the dialect, which it
+then keeps until its transaction is committed or rolled back, including
+the transaction of an ORM :class:`_orm.Session` flush.  Statements that
+read only, as well as connections that haven't written in their current
+transaction, proceed without waiting::
+
+    from sqlalchemy import create_engine, event
+
+    engine = create_engine(
+        "sqlite:///myfile.db", serialize_writes=True, pool_size=20
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_wal(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA journal_mode=WAL")
+
+Writes are detected from the compiled form of the statement, so statements
+which write that are invoked using :meth:`_engine.Connection.exec_driver_sql`
+or :func:`_sql.text` aren't serialized.  As a given thread can't wait for a
+write that it has itself begun, a connection that attempts to write while
+another connection in the same thread holds the lock raises
+:class:`.InvalidRequestError` rather than waiting.  The lock is local to the
+:class:`_engine.Engine`, and doesn't coordinate with other engines or
+processes that write to the same file.
+
+.. versionadded:: 2.1
+
 
 Dealing with Mixed String / Binary Columns
 ------------------------------------------------------
@@ -445,9 +487,11 @@ connection when it is created. That is accomplished with an event listener::
 
 """  # noqa
 
+import contextlib
 import math
 import os
 import re
+import threading
 
 from .base import DATE
 from .base import DATETIME
@@ -503,6 +547,20 @@ class SQLiteDialect_pysqlite(SQLiteDialect):
 
     driver = "pysqlite"
 
+    _write_lock = None
+    _writer = None
+    _writer_thread = None
+
+    def __init__(self, serialize_writes=False, **kwargs):
+        super().__init__(**kwargs)
+        if serialize_writes:
+            if self.is_async:
+                raise exc.ArgumentError(
+                    "serialize_writes is not supported by the %s driver"
+                    % self.driver
+                )
+            self._write_lock = threading.Lock()
+
     @classmethod
     def import_dbapi(cls):
         from sqlite3 import dbapi2 as sqlite
@@ -645,6 +703,90 @@ class SQLiteDialect_pysqlite(SQLiteDialect):
             e, self.dbapi.ProgrammingError
         ) and "Cannot operate on a closed database." in str(e)
 
+    def _serializes(self, context):
+        return (
+            self._write_lock is not None
+            and context is not None
+            and (
+                context.isinsert
+                or context.isupdate
+                or context.isdelete
+                or context.isddl
+            )
+        )
+
+    @contextlib.contextmanager
+    def _serialized_write(self, dbapi_connection):
+        if self._writer is not dbapi_connection:
+            if self._writer_thread == threading.get_ident():
+                raise exc.InvalidRequestError(
+                    "Can't write on this connection while another "
+                    "connection in the same thread has an uncommitted "
+                    "write transaction; the engine's serialize_writes "
+                    "lock would never be released"
+                )
+            self._write_lock.acquire()
+            self._writer = dbapi_connection
+            self._writer_thread = threading.get_ident()
+        try:
+            yield
+        finally:
+            # keep the lock for the rest of the transaction, if the driver
+            # began one
+            if not dbapi_connection.in_transaction:
+                self._release_writer(dbapi_connection)
+
+    def _release_writer(self, dbapi_connection):
+        if self._writer is dbapi_connection:
+            self._writer = self._writer_thread = None
+            self._write_lock.release()
+
+    def do_execute(self, cursor, statement, parameters, context=None):
+        if self._serializes(context):
+            with self._serialized_write(cursor.connection):
+                cursor.execute(statement, parameters)
+        else:
+            cursor.execute(statement, parameters)
+
+    def do_execute_no_params(self, cursor, statement, context=None):
+        if self._serializes(context):
+            with self._serialized_write(cursor.connection):
+                cursor.execute(statement)
+        else:
+            cursor.execute(statement)
+
+    def do_executemany(self, cursor, statement, parameters, context=None):
+        if self._serializes(context):
+            with self._serialized_write(cursor.connection):
+                cursor.executemany(statement, parameters)
+        else:
+            cursor.executemany(statement, parameters)
+
+    def do_commit(self, dbapi_connection):
+        dbapi_connection.commit()
+        if self._write_lock is not None:
+            self._release_writer(
+                getattr(dbapi_connection, "dbapi_connection", dbapi_connection)
+            )
+
+    def do_rollback(self, dbapi_connection):
+        try:
+            dbapi_connection.rollback()
+        finally:
+            if self._write_lock is not None:
+                self._release_writer(
+                    getattr(
+                        dbapi_connection, "dbapi_connection", dbapi_connection
+                    )
+                )
+
+    def do_close(self, dbapi_connection):
+        try:
+            dbapi_connection.close()
+        finally:
+            if self._write_lock is not None:
+                self._release_writer(dbapi_connection)
+
 
 dialect = SQLiteDialect_pysqlite
 
@@ -10,7 +10,9 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import sys
+import threading
 import typing
 from typing import Any
 from typing import Callable
@@ -79,6 +81,7 @@ if typing.TYPE_CHECKING:
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import HasSchemaAttr
     from ..sql.schema import SchemaItem
+    from ..sql.selectable import TableClause
     from ..sql.selectable import TypedReturnsRows
 
 
@@ -88,6 +91,16 @@ _EMPTY_EXECUTION_OPTS: _ExecuteOptions = util.EMPTY_DICT
 NO_OPTIONS: Mapping[str, Any] = util.EMPTY_DICT
 
 
+def _pages(iterable: Iterable[_T], page_size: int) -> Iterator[List[_T]]:
+    """Consume ``iterable`` in lists of at most ``page_size`` elements."""
+    iterator = iter(iterable)
+    while True:
+        page = list(itertools.islice(iterator, page_size))
+        if not page:
+            return
+        yield page
+
+
 class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
     """Provides high-level functionality for a wrapped DB-API connection.
 
@@ -1438,6 +1451,79 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 execution_options or NO_OPTIONS,
             )
 
+    def execute_stream(
+        self,
+        statement: Executable,
+        parameters: Iterable[_CoreSingleExecuteParams],
+        *,
+        execution_options: Optional[CoreExecuteOptionsParameter] = None,
+        page_size: Optional[int] = None,
+    ) -> int:
+        r"""Execute a DML statement such as :func:`_sql.insert` for each
+        parameter dictionary in an iterable, consuming the iterable one
+        page at a time.
+
+        E.g.::
+
+            def rows_from_csv(filename):
+                with open(filename) as file_:
+                    for row in csv.DictReader(file_):
+                        yield row
+
+            with engine.begin() as conn:
+                conn.execute_stream(table.insert(), rows_from_csv("data.csv"))
+
+        Unlike :meth:`_engine.Connection.execute`, which requires a list of
+        all parameter dictionaries to be present up front, the iterable
+        given here may be a generator; each page of parameter dictionaries is
+        executed using :meth:`_engine.Connection.execute` before the next
+        page is read, so that only one page is held in memory at a time.
+        All pages are executed within the current transaction of this
+        :class:`_engine.Connection`.
+
+        :param statement: an :func:`_sql.insert`, :func:`_sql.update` or
+         :func:`_sql.delete` construct, which may not include RETURNING.
+
+        :param parameters: an iterable of parameter dictionaries.
+
+        :param execution_options: optional dictionary of execution options,
+         which will be associated with each execution.
+
+        :param page_size: number of parameter dictionaries to execute at a
+         time.  Defaults to the ``insertmanyvalues_page_size`` in effect for
+         the statement, so that each page is sent as a single INSERT
+         statement when :ref:`insertmanyvalues <engine_insertmanyvalues>` is
+         in use.
+
+        :return: the number of parameter dictionaries executed.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :meth:`_engine.Engine.bulk_load`
+
+        """
+        if not statement.is_dml or statement._returning:  # type: ignore
+            raise exc.ArgumentError(
+                "execute_stream() accepts only INSERT, UPDATE or DELETE "
+                "statements without RETURNING"
+            )
+
+        if page_size is None:
+            page_size = self._execution_options.merge_with(
+                statement._execution_options, execution_options
+            ).get(
+                "insertmanyvalues_page_size",
+                self.dialect.insertmanyvalues_page_size,
+            )
+
+        count = 0
+        for page in _pages(parameters, page_size):
+            self.execute(statement, page, execution_options=execution_options)
+            count += len(page)
+        return count
+
     def _execute_function(
         self,
         func: FunctionElement[Any],
@@ -3254,6 +3340,118 @@ class Engine(
             with conn.begin():
                 yield conn
 
+    def bulk_load(
+        self,
+        table: TableClause,
+        rows: Iterable[Mapping[str, Any]],
+        *,
+        workers: int = 1,
+        page_size: Optional[int] = None,
+    ) -> int:
+        """INSERT a potentially large iterable of rows into a table, in
+        pages that are each committed separately, optionally using
+        multiple connections at once.
+
+        E.g.::
+
+            engine.bulk_load(
+                my_table,
+                ({"id": i, "data": f"row {i}"} for i in range(1000000)),
+                workers=4,
+            )
+
+        The rows are consumed from the given iterable one page at a time,
+        where each page is INSERTed using :meth:`_engine.Connection.execute`
+        with an :func:`_sql.insert` construct against the table, making use
+        of :ref:`insertmanyvalues <engine_insertmanyvalues>` where supported
+        by the dialect, and then committed.  When ``workers`` is greater than
+        one, that number of threads each procure a
+        :class:`_engine.Connection` from the connection pool and INSERT
+        pages concurrently, so the pool should allow at least that many
+        connections to be checked out at once.
+
+        As each page is committed independently, this method is intended for
+        bulk loading scenarios only; the order in which rows are INSERTed is
+        not deterministic when more than one worker is used, and if an error
+        is raised, pages that were already committed remain in the database.
+        When a page fails, no further pages are started and the error is
+        raised once all workers have finished.
+
+        :param table: the :class:`_schema.Table` or other
+         :class:`_sql.TableClause` to INSERT into.
+
+        :param rows: an iterable of dictionaries, each of which contains
+         the same keys, which are the names of columns in the table.
+
+        :param workers: number of connections to use concurrently.
+         Defaults to one, which INSERTs all pages from the calling thread.
+
+        :param page_size: number of rows in each page.  Defaults to the
+         :paramref:`_sa.create_engine.insertmanyvalues_page_size` of the
+         engine, so that each page is sent as a single INSERT statement
+         when insertmanyvalues is in use.
+
+        :return: the number of rows INSERTed.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`engine_insertmanyvalues`
+
+        """
+        if workers < 1:
+            raise exc.ArgumentError("workers must be at least 1")
+
+        if page_size is None:
+            page_size = self.get_execution_options().get(
+                "insertmanyvalues_page_size",
+                self.dialect.insertmanyvalues_page_size,
+            )
+
+        stmt = table.insert()
+        pages = _pages(rows, page_size)
+        mutex = threading.Lock()
+        failed = False
+
+        def next_page() -> List[Mapping[str, Any]]:
+            # the page generator is shared among workers and may not
+            # be advanced from more than one thread at a time
+            with mutex:
+                if failed:
+                    return []
+                return next(pages, [])
+
+        def load() -> int:
+            nonlocal failed
+
+            count = 0
+            try:
+                with self.connect() as conn:
+                    for page in iter(next_page, []):
+                        with conn.begin():
+                            conn.execute(stmt, page)
+                        count += len(page)
+                return count
+            except BaseException:
+                failed = True
+                raise
+
+        if workers == 1:
+            return load()
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(load) for _ in range(workers)]
+
+        for future in futures:
+            exception = future.exception()
+            if exception is not None:
+                raise exception
+
+        return sum(future.result() for future in futures)
+
     def _run_ddl_visitor(
         self,
         visitorcallable: Type[Union[SchemaGenerator, SchemaDropper]],
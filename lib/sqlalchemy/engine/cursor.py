@@ -30,6 +30,8 @@ from typing import Tuple
 from typing import TYPE_CHECKING
 from typing import Union
 
+from .result import _fused_row_getter
+from .result import _use_fused_row_getter
 from .result import IteratorResult
 from .result import MergedResult
 from .result import Result
@@ -1534,13 +1536,20 @@ class CursorResult(Result[Unpack[_Ts]]):
 
             metadata = self._init_metadata(context, cursor_description)
 
+            processors = metadata._effective_processors
+
             _make_row: Any
-            _make_row = functools.partial(
-                Row,
-                metadata,
-                metadata._effective_processors,
-                metadata._key_to_index,
-            )
+            if processors and _use_fused_row_getter:
+                _make_row = _fused_row_getter(
+                    Row, metadata, processors, metadata._key_to_index
+                )
+            else:
+                _make_row = functools.partial(
+                    Row,
+                    metadata,
+                    processors,
+                    metadata._key_to_index,
+                )
 
             if context._num_sentinel_cols:
                 sentinel_filter = operator.itemgetter(
@@ -91,6 +91,7 @@ if typing.TYPE_CHECKING:
     from ..pool import Pool
     from ..pool import PoolProxiedConnection
     from ..sql import Executable
+    from ..sql.compiler import _InsertManyValuesBatch
     from ..sql.compiler import Compiled
     from ..sql.compiler import Linting
     from ..sql.compiler import ResultColumnsEntry
@@ -242,6 +243,7 @@ class DefaultDialect(Dialect):
 
     insertmanyvalues_page_size: int = 1000
     insertmanyvalues_max_parameters = 32700
+    insertmanyvalues_max_statement_size: Optional[int] = None
 
     supports_is_distinct_from = True
 
@@ -825,6 +827,7 @@ class DefaultDialect(Dialect):
             sort_by_parameter_order,
             schema_translate_map,
         ):
+            context.insertmanyvalues_batch = imv_batch
             yield imv_batch
 
             if is_returning:
@@ -1252,6 +1255,7 @@ class DefaultExecutionContext(ExecutionContext):
     _empty_dict_params = cast("Mapping[str, Any]", util.EMPTY_DICT)
 
     _insertmanyvalues_rows: Optional[List[Tuple[Any, ...]]] = None
+    insertmanyvalues_batch: Optional[_InsertManyValuesBatch] = None
     _num_sentinel_cols: int = 0
 
     @classmethod
@@ -84,6 +84,12 @@ class CacheStats(Enum):
     NO_DIALECT_SUPPORT = 4
 
 
+# cache statuses of statements which are held in the compiled cache
+_CACHED_STATEMENT_STATS = frozenset(
+    [CacheStats.CACHE_HIT, CacheStats.CACHE_MISS]
+)
+
+
 class ExecuteStyle(Enum):
     """indicates the :term:`DBAPI` cursor method that will be used to invoke
     a statement."""
@@ -933,6 +939,23 @@ class Dialect(EventTarget):
     page size based on number of parameters total in the statement.
 
 
+    """
+
+    insertmanyvalues_max_statement_size: Optional[int]
+    """Approximate maximum size, in characters, of an individual
+    INSERT..VALUES() statement for :attr:`.ExecuteStyle.INSERTMANYVALUES`
+    executions, including the size of its parameter values.
+
+    When set, the number of rows in each batch is further limited so that
+    the rendered statement plus an estimate of the size of its parameters
+    stays within this size, so that batches of wide rows are split into
+    smaller statements while batches of narrow rows use the full
+    :attr:`.Dialect.insertmanyvalues_page_size`.  Defaults to ``None``
+    for no limit; the MySQL and MariaDB dialects set it from the server's
+    ``max_allowed_packet`` setting.
+
+    .. versionadded:: 2.1
+
     """
 
     preexecute_autoincrement_sequences: bool
@@ -2990,6 +3013,19 @@ class ExecutionContext:
     execution_options: _ExecuteOptions
     """Execution options associated with the current statement execution"""
 
+    insertmanyvalues_batch: Optional[_InsertManyValuesBatch]
+    """For an :attr:`.ExecuteStyle.INSERTMANYVALUES` execution, the batch
+    currently being executed, else ``None``.
+
+    Within the :meth:`.ConnectionEvents.before_cursor_execute` and
+    :meth:`.ConnectionEvents.after_cursor_execute` events, this indicates
+    the page size chosen for the current batch as ``current_batch_size``,
+    as well as ``batchnum`` and ``total_batches``.
+
+    .. versionadded:: 2.1
+
+    """
+
     @classmethod
     def _init_ddl(
         cls,
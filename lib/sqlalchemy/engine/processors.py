@@ -15,12 +15,17 @@ They all share one common characteristic: None is passed through unchanged.
 from __future__ import annotations
 
 import datetime
+from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import Optional
 from typing import Pattern
+from typing import Sequence
 from typing import TypeVar
 from typing import Union
 
+from ._processors_cy import _is_compiled
 from ._processors_cy import int_to_boolean as int_to_boolean  # noqa: F401
 from ._processors_cy import str_to_date as str_to_date  # noqa: F401
 from ._processors_cy import str_to_datetime as str_to_datetime  # noqa: F401
@@ -80,3 +85,63 @@ def str_to_datetime_processor_factory(
                 return type_(*list(map(int, m.groups(0))))
 
     return process
+
+
+_value_converters: Dict[Callable[[Any], Any], Callable[[Any], Any]] = {
+    int_to_boolean: bool,
+    to_str: str,
+    to_float: float,
+    str_to_datetime: datetime.datetime.fromisoformat,
+    str_to_time: datetime.time.fromisoformat,
+    str_to_date: datetime.date.fromisoformat,
+}
+
+
+def to_column_processor(
+    processor: Callable[[Any], Any],
+) -> Callable[[Sequence[Any]], Iterable[Any]]:
+    """Return a function that applies the given result processor to a
+    column of values, i.e. the same position taken from each row of a
+    batch.
+
+    For the processors in this module, a column that contains no ``None``
+    is converted by mapping the underlying conversion directly over it,
+    skipping the per-value ``None`` check; other processors are mapped
+    over the column as is.
+
+    """
+    convert_column: Optional[Callable[[Sequence[Any]], Iterable[Any]]]
+
+    if processor in _value_converters:
+        converter = _value_converters[processor]
+
+        def convert_column(column: Sequence[Any]) -> Iterable[Any]:
+            return map(converter, column)
+
+    elif (
+        isinstance(processor, to_decimal_processor_factory)
+        and not _is_compiled()
+    ):
+        type_, format_ = processor.type_, processor.format_
+
+        def convert_column(column: Sequence[Any]) -> Iterable[Any]:
+            return map(type_, map(format_.__mod__, column))
+
+    else:
+        convert_column = None
+
+    if convert_column is None:
+
+        def process(column: Sequence[Any]) -> Iterable[Any]:
+            return map(processor, column)
+
+    else:
+        fixed_convert_column = convert_column
+
+        def process(column: Sequence[Any]) -> Iterable[Any]:
+            if None in column:
+                return map(processor, column)
+            else:
+                return fixed_convert_column(column)
+
+    return process
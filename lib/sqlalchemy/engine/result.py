@@ -33,7 +33,9 @@ from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
 
+from . import _row_cy
 from ._util_cy import tuplegetter as tuplegetter
+from .processors import to_column_processor
 from .row import Row
 from .row import RowMapping
 from .. import exc
@@ -43,6 +45,7 @@ from ..sql.base import HasMemoized
 from ..sql.base import InPlaceGenerative
 from ..util import deprecated
 from ..util import HasMemoized_ro_memoized_attribute
+from ..util import langhelpers
 from ..util import NONE_SET
 from ..util.typing import Literal
 from ..util.typing import Self
@@ -86,6 +89,165 @@ _TupleGetterType = Callable[[Sequence[Any]], Sequence[Any]]
 _UniqueFilterType = Callable[[Any], Any]
 _UniqueFilterStateType = Tuple[Set[Any], Optional[_UniqueFilterType]]
 
+_FusedRowShapeType = Tuple[Tuple[int, bool], ...]
+
+# when the row extension is compiled, processors are applied to each row
+# within the compiled Row constructor; otherwise rows are created using a
+# generated function that applies all processors in one pass
+_use_fused_row_getter = not _row_cy._is_compiled()
+
+_fused_row_factories: util.LRUCache[
+    _FusedRowShapeType, Callable[..., Callable[[Any], Any]]
+] = util.LRUCache(250)
+
+
+def _fused_row_getter(
+    process_row: Callable[..., Any],
+    metadata: ResultMetaData,
+    processors: _ProcessorsType,
+    key_to_index: Dict[_KeyType, int],
+    source_indexes: Optional[Sequence[int]] = None,
+) -> Callable[[Any], Any]:
+    """Return a function that creates a row from a raw DBAPI row, with
+    the given processors applied.
+
+    The processors are applied inline by a function generated for the
+    "shape" of the result, that is, the position of each column within the
+    raw row and whether or not it has a processor.  Columns without a
+    processor are passed through as is, and when ``source_indexes`` is
+    given, the raw row is also reduced to those positions in the same
+    pass.  The generated functions are cached per shape and shared among
+    all results of that shape.
+
+    """
+    if source_indexes is None:
+        source_indexes = range(len(processors))
+
+    shape = tuple(
+        (index, proc is not None)
+        for index, proc in zip(source_indexes, processors)
+    )
+
+    factory = _fused_row_factories.get(shape)
+    if factory is None:
+        factory = _fused_row_factories[shape] = _generate_fused_row_factory(
+            shape
+        )
+
+    return factory(
+        process_row,
+        metadata,
+        key_to_index,
+        *[proc for proc in processors if proc is not None],
+    )
+
+
+def _generate_fused_row_factory(
+    shape: _FusedRowShapeType,
+) -> Callable[..., Callable[[Any], Any]]:
+    proc_names: List[str] = []
+    elements: List[str] = []
+    for index, has_proc in shape:
+        if has_proc:
+            proc_name = f"proc_{len(proc_names)}"
+            proc_names.append(proc_name)
+            elements.append(f"{proc_name}(raw[{index}])")
+        else:
+            elements.append(f"raw[{index}]")
+
+    args = ", ".join(["process_row", "metadata", "key_to_index"] + proc_names)
+    data = "".join(f"{element}, " for element in elements)
+
+    meth_text = (
+        f"def make_row_factory({args}):\n"
+        f"    def make_row(raw):\n"
+        f"        return process_row(\n"
+        f"            metadata, None, key_to_index, ({data})\n"
+        f"        )\n"
+        f"    return make_row\n"
+    )
+    return langhelpers._exec_code_in_env(meth_text, {}, "make_row_factory")
+
+
+def _fused_getters_apply(
+    real_result: Result[Unpack[TupleAny]],
+    metadata: ResultMetaData,
+    processors: Optional[_ProcessorsType],
+    tf: Optional[_TupleGetterType],
+) -> bool:
+    """Return True if rows for the given result may be created using
+    :func:`._fused_row_getter` and :func:`._column_rows_getter`, given
+    the effective processors and tuple filter of its metadata."""
+
+    if not processors or not _use_fused_row_getter:
+        return False
+    return not real_result._source_supports_scalars and (
+        not tf or metadata._translated_indexes is not None
+    )
+
+
+# batches smaller than this are processed row by row, as splitting
+# a handful of rows into columns and back costs more than it saves
+_column_processing_threshold = 20
+
+
+def _column_rows_getter(
+    process_row: Callable[..., Any],
+    metadata: ResultMetaData,
+    processors: _ProcessorsType,
+    key_to_index: Dict[_KeyType, int],
+    make_row: Callable[[Any], Any],
+    source_indexes: Optional[Sequence[int]] = None,
+) -> Callable[[List[Any]], List[Any]]:
+    """Return a function that creates rows from a batch of raw DBAPI rows,
+    applying each processor to its column across the whole batch.
+
+    The batch is split into columns, each column that has a processor is
+    converted using :func:`.to_column_processor`, and the rows
+    are then assembled from the converted columns.  Batches smaller than
+    ``_column_processing_threshold`` are passed to ``make_row`` one row
+    at a time.
+
+    """
+    if source_indexes is None:
+        source_indexes = range(len(processors))
+
+    plan = [
+        (
+            index,
+            (to_column_processor(proc) if proc is not None else None),
+        )
+        for index, proc in zip(source_indexes, processors)
+    ]
+
+    make_plain_row = functools.partial(
+        process_row, metadata, None, key_to_index
+    )
+    threshold = _column_processing_threshold
+
+    def make_rows(rows: List[Any]) -> List[Any]:
+        if len(rows) < threshold:
+            return [make_row(row) for row in rows]
+
+        columns = list(zip(*rows))
+        return list(
+            map(
+                make_plain_row,
+                zip(
+                    *[
+                        (
+                            process_column(columns[index])
+                            if process_column is not None
+                            else columns[index]
+                        )
+                        for index, process_column in plan
+                    ]
+                ),
+            )
+        )
+
+    return make_rows
+
 
 class ResultMetaData:
     """Base for metadata about result rows."""
@@ -474,7 +636,21 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
         processors = metadata._effective_processors
         tf = metadata._tuplefilter
 
-        if tf and not real_result._source_supports_scalars:
+        if _fused_getters_apply(real_result, metadata, processors, tf):
+            assert processors is not None
+            if tf:
+                make_row = _fused_row_getter(
+                    process_row,
+                    metadata,
+                    tf(processors),
+                    key_to_index,
+                    metadata._translated_indexes,
+                )
+            else:
+                make_row = _fused_row_getter(
+                    process_row, metadata, processors, key_to_index
+                )
+        elif tf and not real_result._source_supports_scalars:
             if processors:
                 processors = tf(processors)
 
@@ -488,7 +664,7 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                 return _make_row_orig(fixed_tf(row))
 
         else:
-            make_row = functools.partial(  # type: ignore
+            make_row = functools.partial(
                 process_row, metadata, processors, key_to_index
             )
 
@@ -501,6 +677,50 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
 
         return make_row
 
+    @HasMemoized_ro_memoized_attribute
+    def _rows_getter(self) -> Optional[Callable[[List[Any]], List[Any]]]:
+        make_row = self._row_getter
+        if make_row is None:
+            return None
+
+        real_result: Result[Unpack[TupleAny]] = (
+            self._real_result
+            if self._real_result
+            else cast("Result[Unpack[TupleAny]]", self)
+        )
+
+        metadata = self._metadata
+        processors = metadata._effective_processors
+        tf = metadata._tuplefilter
+
+        if (
+            _fused_getters_apply(real_result, metadata, processors, tf)
+            and not real_result._row_logging_fn
+        ):
+            assert processors is not None
+            if tf:
+                return _column_rows_getter(
+                    Row,
+                    metadata,
+                    tf(processors),
+                    metadata._key_to_index,
+                    make_row,
+                    metadata._translated_indexes,
+                )
+            else:
+                return _column_rows_getter(
+                    Row,
+                    metadata,
+                    processors,
+                    metadata._key_to_index,
+                    make_row,
+                )
+
+        def make_rows(rows: List[Any]) -> List[_R]:
+            return [make_row(row) for row in rows]
+
+        return make_rows
+
     @HasMemoized_ro_memoized_attribute
     def _iterator_getter(self) -> Callable[..., Iterator[_R]]:
         make_row = self._row_getter
@@ -537,20 +757,20 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
         return iterrows
 
     def _raw_all_rows(self) -> List[_R]:
-        make_row = self._row_getter
-        assert make_row is not None
+        make_rows = self._rows_getter
+        assert make_rows is not None
         rows = self._fetchall_impl()
-        return [make_row(row) for row in rows]
+        return make_rows(rows)
 
     def _allrows(self) -> List[_R]:
         post_creational_filter = self._post_creational_filter
 
-        make_row = self._row_getter
+        make_rows = self._rows_getter
 
         rows = self._fetchall_impl()
         made_rows: List[_InterimRowType[_R]]
-        if make_row:
-            made_rows = [make_row(row) for row in rows]
+        if make_rows:
+            made_rows = make_rows(rows)
         else:
             made_rows = rows  # type: ignore
 
@@ -627,7 +847,7 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
 
     @HasMemoized_ro_memoized_attribute
     def _manyrow_getter(self) -> Callable[..., List[_R]]:
-        make_row = self._row_getter
+        make_rows = self._rows_getter
 
         post_creational_filter = self._post_creational_filter
 
@@ -635,13 +855,13 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
             uniques, strategy = self._unique_strategy
 
             def filterrows(
-                make_row: Optional[Callable[..., _R]],
+                make_rows: Optional[Callable[[List[Any]], List[_R]]],
                 rows: List[Any],
                 strategy: Optional[Callable[[List[Any]], Any]],
                 uniques: Set[Any],
             ) -> List[_R]:
-                if make_row:
-                    rows = [make_row(row) for row in rows]
+                if make_rows:
+                    rows = make_rows(rows)
 
                 if strategy:
                     made_rows = (
@@ -678,9 +898,9 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                     else:
                         rows = _manyrows(num)
                         num = len(rows)
-                        assert make_row is not None
+                        assert make_rows is not None
                         collect.extend(
-                            filterrows(make_row, rows, strategy, uniques)
+                            filterrows(make_rows, rows, strategy, uniques)
                         )
                         num_required = num - len(collect)
                 else:
@@ -694,7 +914,7 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                         break
 
                     collect.extend(
-                        filterrows(make_row, rows, strategy, uniques)
+                        filterrows(make_rows, rows, strategy, uniques)
                     )
                     num_required = num - len(collect)
 
@@ -716,8 +936,8 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                     num = real_result._yield_per
 
                 rows: List[_InterimRowType[Any]] = self._fetchmany_impl(num)
-                if make_row:
-                    rows = [make_row(row) for row in rows]
+                if make_rows:
+                    rows = make_rows(rows)
                 if post_creational_filter:
                     rows = [post_creational_filter(row) for row in rows]
                 return rows  # type: ignore
@@ -0,0 +1,59 @@
+# event/_attr_cy.py
+# Copyright (C) 2010-2024 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+"""Listener invocation functions for the listener collections in
+:mod:`sqlalchemy.event.attr`.
+
+These are assigned directly as the ``__call__`` and ``__bool__`` methods of
+those collections, so that when compiled, firing an event and checking
+for the presence of listeners doesn't incur a Python-level frame.
+
+"""
+from __future__ import annotations
+
+from typing import Any
+
+# START GENERATED CYTHON IMPORT
+# This section is automatically generated by the script tools/cython_imports.py
+try:
+    # NOTE: the cython compiler needs this "import cython" in the file, it
+    # can't be only "from sqlalchemy.util import cython" with the fallback
+    # in that module
+    import cython
+except ModuleNotFoundError:
+    from sqlalchemy.util import cython
+
+
+def _is_compiled() -> bool:
+    """Utility function to indicate if this module is compiled or not."""
+    return cython.compiled  # type: ignore[no-any-return]
+
+
+# END GENERATED CYTHON IMPORT
+
+
+def _empty_listener_call(self: Any, *args: Any, **kw: Any) -> None:
+    """Execute this event."""
+
+    for fn in self.parent_listeners:
+        fn(*args, **kw)
+
+
+def _empty_listener_bool(self: Any) -> bool:
+    return bool(self.parent_listeners)
+
+
+def _compound_listener_call(self: Any, *args: Any, **kw: Any) -> None:
+    """Execute this event."""
+
+    for fn in self.parent_listeners:
+        fn(*args, **kw)
+    for fn in self.listeners:
+        fn(*args, **kw)
+
+
+def _compound_listener_bool(self: Any) -> bool:
+    return bool(self.listeners or self.parent_listeners)
@@ -55,6 +55,7 @@ from typing import TypeVar
 from typing import Union
 import weakref
 
+from . import _attr_cy
 from . import legacy
 from . import registry
 from .registry import _ET
@@ -371,11 +372,7 @@ class _EmptyListener(_InstanceLevelDispatch[_ET]):
     def clear(self, *args: Any, **kw: Any) -> NoReturn:
         self._needs_modify(*args, **kw)
 
-    def __call__(self, *args: Any, **kw: Any) -> None:
-        """Execute this event."""
-
-        for fn in self.parent_listeners:
-            fn(*args, **kw)
+    __call__ = _attr_cy._empty_listener_call
 
     def __contains__(self, item: Any) -> bool:
         return item in self.parent_listeners
@@ -386,8 +383,7 @@ class _EmptyListener(_InstanceLevelDispatch[_ET]):
     def __iter__(self) -> Iterator[_ListenerFnType]:
         return iter(self.parent_listeners)
 
-    def __bool__(self) -> bool:
-        return bool(self.parent_listeners)
+    __bool__ = _attr_cy._empty_listener_bool
 
 
 class _MutexProtocol(Protocol):
@@ -488,13 +484,7 @@ class _CompoundListener(_InstanceLevelDispatch[_ET]):
         else:
             self(*args, **kw)
 
-    def __call__(self, *args: Any, **kw: Any) -> None:
-        """Execute this event."""
-
-        for fn in self.parent_listeners:
-            fn(*args, **kw)
-        for fn in self.listeners:
-            fn(*args, **kw)
+    __call__ = _attr_cy._compound_listener_call
 
     def __contains__(self, item: Any) -> bool:
         return item in self.parent_listeners or item in self.listeners
@@ -505,8 +495,7 @@ class _CompoundListener(_InstanceLevelDispatch[_ET]):
     def __iter__(self) -> Iterator[_ListenerFnType]:
         return chain(self.parent_listeners, self.listeners)
 
-    def __bool__(self) -> bool:
-        return bool(self.listeners or self.parent_listeners)
+    __bool__ = _attr_cy._compound_listener_bool
 
 
 class _ListenerCollection(_CompoundListener[_ET]):
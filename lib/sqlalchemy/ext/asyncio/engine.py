@@ -13,6 +13,7 @@ from typing import AsyncIterator
 from typing import Callable
 from typing import Dict
 from typing import Generator
+from typing import Iterable
 from typing import NoReturn
 from typing import Optional
 from typing import overload
@@ -667,6 +668,32 @@ class AsyncConnection(
         )
         return await _ensure_sync_result(result, self.execute)
 
+    async def execute_stream(
+        self,
+        statement: Executable,
+        parameters: Iterable[_CoreSingleExecuteParams],
+        *,
+        execution_options: Optional[CoreExecuteOptionsParameter] = None,
+        page_size: Optional[int] = None,
+    ) -> int:
+        r"""Execute a DML statement for each parameter dictionary in an
+        iterable, consuming the iterable one page at a time.
+
+        This is the asyncio equivalent of
+        :meth:`_engine.Connection.execute_stream`; see that method for
+        details.
+
+        .. versionadded:: 2.1
+
+        """
+        return await greenlet_spawn(
+            self._proxied.execute_stream,
+            statement,
+            parameters,
+            execution_options=execution_options,
+            page_size=page_size,
+        )
+
     @overload
     async def scalar(
         self,
@@ -79,6 +79,7 @@ from .events import MapperEvents as MapperEvents
 from .events import QueryEvents as QueryEvents
 from .events import SessionEvents as SessionEvents
 from .identity import IdentityMap as IdentityMap
+from .identity import LRUInstanceDict as LRUInstanceDict
 from .instrumentation import ClassManager as ClassManager
 from .interfaces import EXT_CONTINUE as EXT_CONTINUE
 from .interfaces import EXT_SKIP as EXT_SKIP
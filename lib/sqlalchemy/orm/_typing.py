@@ -89,6 +89,7 @@ _ORMCOLEXPR = TypeVar("_ORMCOLEXPR", bound=ColumnElement[Any])
 class _OrmKnownExecutionOptions(_CoreKnownExecutionOptions, total=False):
     populate_existing: bool
     autoflush: bool
+    readonly: bool
     synchronize_session: SynchronizeSessionArgument
     dml_strategy: DMLStrategyArgument
     is_delete_using: bool
@@ -130,6 +130,18 @@ _AllPendingType = Sequence[
 
 _UNKNOWN_ATTR_KEY = object()
 
+# incremented whenever attribute event listeners or active history are
+# established; a ScalarAttributeImpl which has found that it has neither
+# stores the generation at which it did so, allowing
+# InstrumentedAttribute.__set__ to bypass ScalarAttributeImpl.set() for
+# as long as the generation is unchanged
+_simple_set_generation = 0
+
+
+def _invalidate_simple_set() -> None:
+    global _simple_set_generation
+    _simple_set_generation += 1
+
 
 @inspection._self_inspects
 class QueryableAttribute(
@@ -534,12 +546,40 @@ class InstrumentedAttribute(QueryableAttribute[_T_co]):
         return super().__doc__
 
     def __set__(self, instance: object, value: Any) -> None:
-        self.impl.set(
-            instance_state(instance), instance_dict(instance), value, None
-        )
+        impl = self.impl
+        try:
+            state = instance_state(instance)
+        except AttributeError as err:
+            raise self._no_state_for_modify(instance) from err
+        if impl._simple_set_generation == _simple_set_generation:
+            # no set listeners or active history; inline of
+            # ScalarAttributeImpl.set()
+            dict_ = instance_dict(instance)
+            key = impl.key
+            state._modified_event(dict_, impl, dict_.get(key, NO_VALUE))
+            dict_[key] = value
+        else:
+            impl.set(state, instance_dict(instance), value, None)
 
     def __delete__(self, instance: object) -> None:
-        self.impl.delete(instance_state(instance), instance_dict(instance))
+        try:
+            state = instance_state(instance)
+        except AttributeError as err:
+            raise self._no_state_for_modify(instance) from err
+        self.impl.delete(state, instance_dict(instance))
+
+    def _no_state_for_modify(
+        self, instance: object
+    ) -> orm_exc.UnmappedInstanceError:
+        err: orm_exc.UnmappedInstanceError = orm_exc.UnmappedInstanceError(
+            instance,
+            "Can't modify attribute '%s' on %s object; it has no ORM "
+            "instance state.  Objects loaded using the 'readonly' execution "
+            "option are not managed by the ORM and can't be modified "
+            "through mapped attributes."
+            % (self.key, orm_exc._safe_cls_name(type(instance))),
+        )
+        return err
 
     @overload
     def __get__(
@@ -826,6 +866,8 @@ class AttributeImpl:
 
     _is_has_collection_adapter = False
 
+    _simple_set_generation = -1
+
     _replace_token: AttributeEventToken
     _remove_token: AttributeEventToken
     _append_token: AttributeEventToken
@@ -940,6 +982,7 @@ class AttributeImpl:
 
     def _set_active_history(self, value):
         self.dispatch._active_history = value
+        _invalidate_simple_set()
 
     active_history = property(_get_active_history, _set_active_history)
 
@@ -1111,7 +1154,7 @@ class AttributeImpl:
         if (
             self.accepts_scalar_loader
             and self.load_on_unexpire
-            and key in state.expired_attributes
+            and key in state._expired_attributes
         ):
             return state._load_expired(state, passive)
         elif key in state.callables:
@@ -1211,7 +1254,12 @@ class ScalarAttributeImpl(AttributeImpl):
     collection = False
     dynamic = False
 
-    __slots__ = "_replace_token", "_append_token", "_remove_token"
+    __slots__ = (
+        "_replace_token",
+        "_append_token",
+        "_remove_token",
+        "_simple_set_generation",
+    )
 
     def __init__(self, *arg, **kw):
         super().__init__(*arg, **kw)
@@ -1219,6 +1267,7 @@ class ScalarAttributeImpl(AttributeImpl):
             self, OP_REPLACE
         )
         self._remove_token = AttributeEventToken(self, OP_REMOVE)
+        self._simple_set_generation = -1
 
     def delete(self, state: InstanceState[Any], dict_: _InstanceDict) -> None:
         if self.dispatch._active_history:
@@ -1235,7 +1284,7 @@ class ScalarAttributeImpl(AttributeImpl):
             existing is NO_VALUE
             and old is NO_VALUE
             and not state.expired
-            and self.key not in state.expired_attributes
+            and self.key not in state._expired_attributes
         ):
             raise AttributeError("%s object does not have a value" % self)
 
@@ -1268,6 +1317,8 @@ class ScalarAttributeImpl(AttributeImpl):
         check_old: Optional[object] = None,
         pop: bool = False,
     ) -> None:
+        generation = _simple_set_generation
+
         if self.dispatch._active_history:
             old = self.get(state, dict_, PASSIVE_RETURN_NO_VALUE)
         else:
@@ -1277,6 +1328,8 @@ class ScalarAttributeImpl(AttributeImpl):
             value = self.fire_replace_event(
                 state, dict_, value, old, initiator
             )
+        elif not self.dispatch._active_history:
+            self._simple_set_generation = generation
         state._modified_event(dict_, self, old)
         dict_[self.key] = value
 
@@ -127,6 +127,7 @@ class QueryContext:
         "post_load_paths",
         "identity_token",
         "yield_per",
+        "readonly",
         "loaders_require_buffering",
         "loaders_require_uniquing",
     )
@@ -148,6 +149,7 @@ class QueryContext:
         _legacy_uniquing = False
         _sa_top_level_orm_context = None
         _is_user_refresh = False
+        _readonly = False
 
     def __init__(
         self,
@@ -216,6 +218,7 @@ class QueryContext:
         self.refresh_state = load_options._refresh_state
         self.yield_per = load_options._yield_per
         self.identity_token = load_options._identity_token
+        self.readonly = load_options._readonly
 
     def _get_top_level_context(self) -> QueryContext:
         return self.top_level_context or self
@@ -503,6 +506,7 @@ class ORMCompileState(AbstractORMCompileState):
                 "autoflush",
                 "yield_per",
                 "identity_token",
+                "readonly",
                 "sa_top_level_orm_context",
             },
             execution_options,
@@ -1143,6 +1143,7 @@ class registry:
     _dependents: Set[_RegistryType]
     _dependencies: Set[_RegistryType]
     _new_mappers: bool
+    incremental_configure: bool
 
     def __init__(
         self,
@@ -1151,6 +1152,7 @@ class registry:
         class_registry: Optional[clsregistry._ClsRegistryType] = None,
         type_annotation_map: Optional[_TypeAnnotationMapType] = None,
         constructor: Callable[..., None] = _declarative_constructor,
+        incremental_configure: bool = False,
     ):
         r"""Construct a new :class:`_orm.registry`
 
@@ -1189,6 +1191,23 @@ class registry:
 
               :ref:`orm_declarative_mapped_column_type_map`
 
+        :param incremental_configure: when ``True``, the automatic mapper
+          configuration step which takes place when a mapped class is first
+          used will configure only those mappers which are reachable from
+          that class, i.e. the mappers it refers to via
+          :func:`_orm.relationship`, those within the same inheritance
+          hierarchy, and those which establish a backref onto any of these,
+          rather than all mappers in the registry.  Applications with a very
+          large number of mapped classes, of which a particular process uses
+          only a few, may use this to reduce the time spent on the first
+          use of a mapped class.  The
+          :meth:`_orm.MapperEvents.before_configured` and
+          :meth:`_orm.MapperEvents.after_configured` events are invoked for
+          each such partial configuration.  The :meth:`_orm.registry.configure`
+          method and the :func:`_orm.configure_mappers` function continue to
+          configure all mappers in the registry.
+
+          .. versionadded:: 2.1
 
         """
         lcl_metadata = metadata or MetaData()
@@ -1201,6 +1220,7 @@ class registry:
         self._non_primary_mappers = weakref.WeakKeyDictionary()
         self.metadata = lcl_metadata
         self.constructor = constructor
+        self.incremental_configure = incremental_configure
         self.type_annotation_map = {}
         if type_annotation_map is not None:
             self.update_type_annotation_map(type_annotation_map)
@@ -25,6 +25,7 @@ from typing import TypeVar
 from typing import Union
 import weakref
 
+from . import attributes
 from . import instrumentation
 from . import interfaces
 from . import mapperlib
@@ -2566,6 +2567,10 @@ class AttributeEvents(event.Events[QueryableAttribute[Any]]):
                 if active_history:
                     mgr[target.key].dispatch._active_history = True
 
+        # ensure attributes which had no listeners re-check for them
+        # on next set
+        attributes._invalidate_simple_set()
+
     def append(
         self,
         target: _O,
@@ -23,6 +23,7 @@ import weakref
 
 from . import util as orm_util
 from .. import exc as sa_exc
+from .. import util
 
 if TYPE_CHECKING:
     from ._typing import _IdentityKeyType
@@ -291,6 +292,110 @@ class WeakInstanceDict(IdentityMap):
                     self._manage_removed_state(state)
 
 
+class LRUInstanceDict(WeakInstanceDict):
+    """A :class:`.WeakInstanceDict` which additionally maintains strong
+    references to the most recently used objects in the map.
+
+    Objects in the :class:`.Session` identity map are normally referenced
+    weakly, and are garbage collected once the application no longer
+    refers to them.  Long running batch processes which repeatedly
+    encounter the same rows may instead select this identity map using
+    :paramref:`_orm.Session.identity_map_cls`, so that up to ``size``
+    recently added or retrieved objects remain present in the identity map
+    regardless of other references to them.  Objects which fall out of the
+    most-recently-used set revert to being weakly referenced.
+
+    E.g.::
+
+        from functools import partial
+
+        from sqlalchemy.orm import LRUInstanceDict
+
+        session = Session(
+            engine, identity_map_cls=partial(LRUInstanceDict, size=10000)
+        )
+
+    The :attr:`.LRUInstanceDict.hits` and :attr:`.LRUInstanceDict.misses`
+    counters track lookups by identity, such as those performed when
+    loading rows and by :meth:`_orm.Session.get`, so that the size may be
+    tuned against the memory used.
+
+    .. versionadded:: 2.1
+
+    """
+
+    size: int
+    """The number of objects to be strongly referenced."""
+
+    hits: int
+    """Number of identity lookups which located an object."""
+
+    misses: int
+    """Number of identity lookups which did not locate an object."""
+
+    _strong_refs: util.LRUCache[_IdentityKeyType[Any], object]
+
+    def __init__(self, size: int = 1000, threshold: float = 0.5) -> None:
+        super().__init__()
+        self.size = size
+        self._strong_refs = util.LRUCache(size, threshold)
+        self.hits = self.misses = 0
+
+    def reset_stats(self) -> None:
+        """Reset the :attr:`.LRUInstanceDict.hits` and
+        :attr:`.LRUInstanceDict.misses` counters."""
+        self.hits = self.misses = 0
+
+    def _kill(self) -> None:
+        super()._kill()
+        self._strong_refs.clear()
+
+    def _manage_incoming_state(self, state: InstanceState[Any]) -> None:
+        super()._manage_incoming_state(state)
+        assert state.key is not None
+        obj = state.obj()
+        if obj is not None:
+            self._strong_refs[state.key] = obj
+
+    def _manage_removed_state(self, state: InstanceState[Any]) -> None:
+        super()._manage_removed_state(state)
+        key = state.key
+        assert key is not None
+        if self._strong_refs.get(key) is state.obj():
+            self._strong_refs.pop(key, None)
+
+    def _add_unpresent(
+        self, state: InstanceState[Any], key: _IdentityKeyType[Any]
+    ) -> None:
+        self._dict[key] = state
+        state._instance_dict = self._wr
+        self._strong_refs[key] = state.obj()
+
+    def fast_get_state(
+        self, key: _IdentityKeyType[_O]
+    ) -> Optional[InstanceState[_O]]:
+        state = self._dict.get(key)
+        if state is not None:
+            obj = state.obj()
+            if obj is not None:
+                self.hits += 1
+                self._strong_refs[key] = obj
+                return state
+        self.misses += 1
+        return state
+
+    def get(
+        self, key: _IdentityKeyType[_O], default: Optional[_O] = None
+    ) -> Optional[_O]:
+        o = super().get(key)
+        if o is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._strong_refs[key] = o
+        return o
+
+
 def _killed(state: InstanceState[Any], key: _IdentityKeyType[Any]) -> NoReturn:
     # external function to avoid creating cycles when assigned to
     # the IdentityMap
@@ -1143,7 +1143,11 @@ def _instance_processor(
             if isnew and (
                 propagated_loader_options or not effective_populate_existing
             ):
-                state.load_options = propagated_loader_options
+                # load_options defaults to an empty tuple at the class
+                # level; only populate the per-state __dict__ when there
+                # are options to propagate
+                if propagated_loader_options:
+                    state.load_options = propagated_loader_options
                 state.load_path = load_path
 
             _populate_full(
@@ -1228,6 +1232,19 @@ def _instance_processor(
 
         return instance
 
+    if context.readonly and not refresh_state:
+        instance_processor = _readonly_instance_processor(
+            mapper,
+            populators,
+            instance_dict,
+            identity_class,
+            identity_token,
+            primary_key_getter,
+            is_not_primary_key,
+        )
+    else:
+        instance_processor = _instance
+
     if mapper.polymorphic_map and not _polymorphic_from and not refresh_state:
         # if we are doing polymorphic, dispatch to a different _instance()
         # method specific to the subclass mapper
@@ -1242,8 +1259,8 @@ def _instance_processor(
             else:
                 return None
 
-        _instance = _decorate_polymorphic_switch(
-            _instance,
+        instance_processor = _decorate_polymorphic_switch(
+            instance_processor,
             context,
             query_entity,
             mapper,
@@ -1254,6 +1271,50 @@ def _instance_processor(
             ensure_no_pk,
         )
 
+    return instance_processor
+
+
+def _readonly_instance_processor(
+    mapper,
+    populators,
+    instance_dict,
+    identity_class,
+    identity_token,
+    primary_key_getter,
+    is_not_primary_key,
+):
+    """Produce a row processor for the "readonly" execution option.
+
+    Instances are created without an :class:`.InstanceState` and are
+    populated directly from the row's column values.  They are not
+    placed in the identity map, and no loader callables, events or
+    eager loaders are established for them.
+
+    In place of the identity map, instances are uniqued against their
+    identity key for the lifespan of the processor, i.e. a single
+    result, so that rows repeated by joins produce the same object.
+
+    """
+    class_ = mapper.class_
+    new_instance = class_.__new__
+    quick_populators = populators["quick"]
+    seen = {}
+
+    def _instance(row):
+        identitykey = (identity_class, primary_key_getter(row), identity_token)
+        if is_not_primary_key(identitykey[1]):
+            return None
+
+        instance = seen.get(identitykey)
+        if instance is not None:
+            return instance
+
+        instance = seen[identitykey] = new_instance(class_)
+        dict_ = instance_dict(instance)
+        for key, getter in quick_populators:
+            dict_[key] = getter(row)
+        return instance
+
     return _instance
 
 
@@ -1347,11 +1408,11 @@ def _populate_full(
             for key, set_callable in populators["expire"]:
                 dict_.pop(key, None)
                 if set_callable:
-                    state.expired_attributes.add(key)
+                    state._expired_attributes_for_write().add(key)
         else:
             for key, set_callable in populators["expire"]:
                 if set_callable:
-                    state.expired_attributes.add(key)
+                    state._expired_attributes_for_write().add(key)
 
         for key, populator in populators["new"]:
             populator(state, dict_, row)
@@ -1408,7 +1469,7 @@ def _populate_partial(
             if key in to_load:
                 dict_.pop(key, None)
                 if set_callable:
-                    state.expired_attributes.add(key)
+                    state._expired_attributes_for_write().add(key)
         for key, populator in populators["new"]:
             if key in to_load:
                 populator(state, dict_, row)
@@ -1652,7 +1713,7 @@ def load_scalar_attributes(mapper, state, attribute_names, passive):
         pk_attrs = [
             mapper._columntoproperty[col].key for col in mapper.primary_key
         ]
-        if state.expired_attributes.intersection(pk_attrs):
+        if state._expired_attributes.intersection(pk_attrs):
             raise sa_exc.InvalidRequestError(
                 "Instance %s cannot be refreshed - it's not "
                 " persistent and does not "
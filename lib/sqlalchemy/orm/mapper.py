@@ -151,6 +151,18 @@ def _unconfigured_mappers() -> Iterator[Mapper[Any]]:
 
 _already_compiling = False
 
+# incremented each time a new mapper is constructed; used by
+# registry.incremental_configure to detect that a mapper which had its
+# reachable mappers configured may have new mappers to consider
+_new_mapper_generation = 0
+
+# relationship edges between unconfigured mappers, keyed to the
+# _new_mapper_generation for which they were collected; see
+# _reachable_unconfigured_mappers()
+_reachability_graph: Optional[
+    Tuple[int, Dict[Mapper[Any], List[Mapper[Any]]]]
+] = None
+
 
 # a constant returned by _get_attr_by_column to indicate
 # this mapper is not handling an attribute for a particular
@@ -189,6 +201,7 @@ class Mapper(
     _dispose_called = False
     _configure_failed: Any = False
     _ready_for_configure = False
+    _reachable_configured_generation = -1
 
     @util.deprecated_params(
         non_primary=(
@@ -853,6 +866,9 @@ class Mapper(
             self._configure_properties()
             self._configure_polymorphic_setter()
             self._configure_pks()
+            global _new_mapper_generation, _reachability_graph
+            _new_mapper_generation += 1
+            _reachability_graph = None
             self.registry._flag_new_mapper(self)
             self._log("constructed")
             self._expire_memoizations()
@@ -2387,7 +2403,14 @@ class Mapper(
     )
     def _check_configure(self) -> None:
         if self.registry._new_mappers:
-            _configure_registries({self.registry}, cascade=True)
+            if not self.registry.incremental_configure:
+                _configure_registries({self.registry}, cascade=True)
+            elif (
+                self._reachable_configured_generation != _new_mapper_generation
+            ):
+                _configure_registries(
+                    {self.registry}, cascade=True, from_mapper=self
+                )
 
     def _post_configure_properties(self) -> None:
         """Call the ``init()`` method on all ``MapperProperties``
@@ -4176,7 +4199,9 @@ def configure_mappers() -> None:
 
 
 def _configure_registries(
-    registries: Set[_RegistryType], cascade: bool
+    registries: Set[_RegistryType],
+    cascade: bool,
+    from_mapper: Optional[Mapper[Any]] = None,
 ) -> None:
     for reg in registries:
         if reg._new_mappers:
@@ -4197,30 +4222,132 @@ def _configure_registries(
             else:
                 return
 
+            mappers: Optional[Set[Mapper[Any]]]
+            if from_mapper is not None:
+                generation = _new_mapper_generation
+                mappers = _reachable_unconfigured_mappers(from_mapper)
+                if not mappers:
+                    from_mapper._reachable_configured_generation = generation
+                    return
+            else:
+                mappers = None
+
             Mapper.dispatch._for_class(Mapper).before_configured()  # type: ignore # noqa: E501
             # initialize properties on all mappers
             # note that _mapper_registry is unordered, which
             # may randomly conceal/reveal issues related to
             # the order of mapper compilation
 
-            _do_configure_registries(registries, cascade)
+            _do_configure_registries(registries, cascade, mappers)
+
+            if from_mapper is not None and all(
+                mapper.configured for mapper in mappers  # type: ignore
+            ):
+                from_mapper._reachable_configured_generation = generation
         finally:
             _already_compiling = False
     Mapper.dispatch._for_class(Mapper).after_configured()  # type: ignore
 
 
+def _reachable_unconfigured_mappers(
+    from_mapper: Mapper[Any],
+) -> Set[Mapper[Any]]:
+    """Return the not-yet-configured mappers which are reachable from the
+    given mapper, for use by :paramref:`_orm.registry.incremental_configure`.
+
+    Mappers are reachable via relationship targets, via inheritance in
+    either direction, and via relationships on other mappers that
+    establish a backref onto a reachable mapper.
+
+    """
+
+    global _reachability_graph
+
+    if (
+        _reachability_graph is None
+        or _reachability_graph[0] != _new_mapper_generation
+    ):
+        _reachability_graph = (
+            _new_mapper_generation,
+            _unconfigured_relationship_graph(),
+        )
+    graph = _reachability_graph[1]
+
+    seen: Set[Mapper[Any]] = set()
+    todo = [from_mapper]
+    while todo:
+        mapper = todo.pop()
+        if mapper in seen:
+            continue
+        seen.add(mapper)
+
+        todo.extend(mapper.iterate_to_root())
+        todo.extend(mapper.self_and_descendants)
+        todo.extend(graph.get(mapper, ()))
+        if mapper.configured:
+            # configured mappers aren't part of the graph; their
+            # relationship targets are already resolved
+            for prop in mapper._props.values():
+                if prop._is_relationship:
+                    todo.append(prop.entity.mapper)
+
+    return {
+        mapper
+        for mapper in seen
+        if not mapper.configured and mapper._ready_for_configure
+    }
+
+
+def _unconfigured_relationship_graph() -> Dict[Mapper[Any], List[Mapper[Any]]]:
+    """Collect the relationship edges of all not-yet-configured mappers.
+
+    Each mapper links to its relationship targets, and each backref
+    target links back to the mapper establishing the backref.  This
+    resolves the target of every relationship involved, so it's run once
+    per :data:`._new_mapper_generation` rather than for each
+    :func:`._reachable_unconfigured_mappers` call.
+
+    """
+    graph: Dict[Mapper[Any], List[Mapper[Any]]] = {}
+    for mapper in _unconfigured_mappers():
+        edges = graph.setdefault(mapper, [])
+        for prop in mapper._props.values():
+            if not prop._is_relationship:
+                continue
+            try:
+                prop._setup_entity()
+            except (sa_exc.ArgumentError, sa_exc.InvalidRequestError):
+                # target can't be resolved yet; this mapper will
+                # report the error when it is itself configured
+                continue
+            target = prop.entity.mapper
+            edges.append(target)
+            if prop.backref:
+                graph.setdefault(target, []).append(mapper)
+    return graph
+
+
 @util.preload_module("sqlalchemy.orm.decl_api")
 def _do_configure_registries(
-    registries: Set[_RegistryType], cascade: bool
+    registries: Set[_RegistryType],
+    cascade: bool,
+    mappers: Optional[Set[Mapper[Any]]] = None,
 ) -> None:
     registry = util.preloaded.orm_decl_api.registry
 
+    if mappers is not None:
+        registries = registries.union(mapper.registry for mapper in mappers)
+
     orig = set(registries)
 
     for reg in registry._recurse_with_dependencies(registries):
         has_skip = False
 
         for mapper in reg._mappers_to_configure():
+            if mappers is not None and mapper not in mappers:
+                has_skip = True
+                continue
+
             run_configure = None
 
             for fn in mapper.dispatch.before_mapper_configured:
@@ -4264,8 +4391,12 @@ def _do_configure_registries(
 
 @util.preload_module("sqlalchemy.orm.decl_api")
 def _dispose_registries(registries: Set[_RegistryType], cascade: bool) -> None:
+    global _reachability_graph
     registry = util.preloaded.orm_decl_api.registry
 
+    # collected edges may refer to mappers being disposed
+    _reachability_graph = None
+
     orig = set(registries)
 
     for reg in registry._recurse_with_dependents(registries):
@@ -476,9 +476,16 @@ def _collect_update_commands(
             has_all_defaults = True
         else:
             params = {}
-            for propkey in set(propkey_to_col).intersection(
-                state.committed_state
-            ):
+
+            # committed_state holds only those attribute keys which were
+            # modified since the last flush; iterate it directly rather
+            # than intersecting against every column of the table, so
+            # that the cost here is proportional to the number of changes
+            # rather than to the width of the table
+            committed_state = state.committed_state
+            for propkey in committed_state:
+                if propkey not in propkey_to_col:
+                    continue
                 value = state_dict[propkey]
                 col = propkey_to_col[propkey]
 
@@ -494,7 +501,7 @@ def _collect_update_commands(
                 # objects for __eq__()
                 elif (
                     state.manager[propkey].impl.is_equal(
-                        value, state.committed_state[propkey]
+                        value, committed_state[propkey]
                     )
                     is not True
                 ):
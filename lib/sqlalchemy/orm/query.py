@@ -1733,6 +1733,7 @@ class Query(
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         populate_existing: bool = False,
         autoflush: bool = False,
+        readonly: bool = False,
         preserve_rowcount: bool = False,
         **opt: Any,
     ) -> Self: ...
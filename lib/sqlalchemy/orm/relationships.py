@@ -80,10 +80,8 @@ from ..sql import roles
 from ..sql import visitors
 from ..sql._typing import _ColumnExpressionArgument
 from ..sql._typing import _HasClauseElement
-from ..sql.annotation import _safe_annotate
 from ..sql.elements import ColumnClause
 from ..sql.elements import ColumnElement
-from ..sql.util import _deep_annotate
 from ..sql.util import _deep_deannotate
 from ..sql.util import _shallow_annotate
 from ..sql.util import adapt_criterion_to_null
@@ -119,7 +117,6 @@ if typing.TYPE_CHECKING:
     from ..sql._typing import _EquivalentColumnMap
     from ..sql._typing import _InfoType
     from ..sql.annotation import _AnnotationDict
-    from ..sql.annotation import SupportsAnnotations
     from ..sql.elements import BinaryExpression
     from ..sql.elements import BindParameter
     from ..sql.elements import ClauseElement
@@ -3346,39 +3343,38 @@ class JoinCondition:
                 primaryjoin = primaryjoin & single_crit
 
         if extra_criteria:
-
-            def mark_exclude_cols(
-                elem: SupportsAnnotations, annotations: _AnnotationDict
-            ) -> SupportsAnnotations:
-                """note unrelated columns in the "extra criteria" as either
-                should be adapted or not adapted, even though they are not
-                part of our "local" or "remote" side.
-
-                see #9779 for this case, as well as #11010 for a follow up
-
-                """
-
-                parentmapper_for_element = elem._annotations.get(
-                    "parentmapper", None
+            if aliased:
+                # note unrelated expressions in the "extra criteria" as
+                # should not be adapted, even though they are not part of
+                # our "local" or "remote" side.  see #9779 for this case, as
+                # well as #11010 for a follow up.  these are tracked by
+                # identity, rather than by producing an annotated copy of
+                # each criteria.  FROM clauses, including those a subquery
+                # derives from its columns, remain subject to adaptation
+                parent = self.prop.parent
+                mapper = self.prop.mapper
+                secondary_lineage_set = self._secondary_lineage_set
+                exclude_ids = frozenset(
+                    id(elem)
+                    for crit in extra_criteria
+                    for elem in cast(
+                        "Iterator[ClauseElement]", visitors.iterate(crit)
+                    )
+                    if (
+                        not elem._is_from_clause
+                        and elem._annotations.get("parentmapper", None)
+                        is not parent
+                        and elem._annotations.get("parentmapper", None)
+                        is not mapper
+                        and elem not in secondary_lineage_set
+                    )
                 )
-
-                if (
-                    parentmapper_for_element is not self.prop.parent
-                    and parentmapper_for_element is not self.prop.mapper
-                    and elem not in self._secondary_lineage_set
-                ):
-                    return _safe_annotate(elem, annotations)
-                else:
-                    return elem
-
-            extra_criteria = tuple(
-                _deep_annotate(
-                    elem,
-                    {"should_not_adapt": True},
-                    annotate_callable=mark_exclude_cols,
+                local_col_exclude = _ColInAnnotations(
+                    "local", "should_not_adapt", exclude_ids=exclude_ids
+                )
+                remote_col_exclude = _ColInAnnotations(
+                    "remote", "should_not_adapt", exclude_ids=exclude_ids
                 )
-                for elem in extra_criteria
-            )
 
             if secondaryjoin is not None:
                 secondaryjoin = secondaryjoin & sql.and_(*extra_criteria)
@@ -3386,11 +3382,15 @@ class JoinCondition:
                 primaryjoin = primaryjoin & sql.and_(*extra_criteria)
 
         if aliased:
+            if not extra_criteria:
+                local_col_exclude = _local_col_exclude
+                remote_col_exclude = _remote_col_exclude
+
             if secondary is not None:
                 secondary = secondary._anonymous_fromclause(flat=True)
                 primary_aliasizer = ClauseAdapter(
                     secondary,
-                    exclude_fn=_local_col_exclude,
+                    exclude_fn=local_col_exclude,
                 )
                 secondary_aliasizer = ClauseAdapter(
                     dest_selectable, equivalents=self.child_equivalents
@@ -3398,7 +3398,7 @@ class JoinCondition:
                 if source_selectable is not None:
                     primary_aliasizer = ClauseAdapter(
                         secondary,
-                        exclude_fn=_local_col_exclude,
+                        exclude_fn=local_col_exclude,
                     ).chain(
                         ClauseAdapter(
                             source_selectable,
@@ -3410,14 +3410,14 @@ class JoinCondition:
             else:
                 primary_aliasizer = ClauseAdapter(
                     dest_selectable,
-                    exclude_fn=_local_col_exclude,
+                    exclude_fn=local_col_exclude,
                     equivalents=self.child_equivalents,
                 )
                 if source_selectable is not None:
                     primary_aliasizer.chain(
                         ClauseAdapter(
                             source_selectable,
-                            exclude_fn=_remote_col_exclude,
+                            exclude_fn=remote_col_exclude,
                             equivalents=self.parent_equivalents,
                         )
                     )
@@ -3503,13 +3503,17 @@ class _ColInAnnotations:
 
     """
 
-    __slots__ = ("names",)
+    __slots__ = ("names", "exclude_ids")
 
-    def __init__(self, *names: str):
+    def __init__(self, *names: str, exclude_ids: FrozenSet[int] = frozenset()):
         self.names = frozenset(names)
+        self.exclude_ids = exclude_ids
 
     def __call__(self, c: ClauseElement) -> bool:
-        return bool(self.names.intersection(c._annotations))
+        return (
+            bool(self.names.intersection(c._annotations))
+            or id(c) in self.exclude_ids
+        )
 
 
 _local_col_exclude = _ColInAnnotations("local", "should_not_adapt")
@@ -1495,9 +1495,11 @@ class Session(_SessionClassMethods, EventTarget):
     autoflush: bool
     expire_on_commit: bool
     enable_baked_queries: bool
+    parallel_flush: bool
     twophase: bool
     join_transaction_mode: JoinTransactionMode
     _query_cls: Type[Query[Any]]
+    _identity_map_cls: Callable[[], IdentityMap]
     _close_state: _SessionCloseState
 
     def __init__(
@@ -1516,6 +1518,8 @@ class Session(_SessionClassMethods, EventTarget):
         autocommit: Literal[False] = False,
         join_transaction_mode: JoinTransactionMode = "conditional_savepoint",
         close_resets_only: Union[bool, _NoArg] = _NoArg.NO_ARG,
+        parallel_flush: bool = False,
+        identity_map_cls: Optional[Callable[[], IdentityMap]] = None,
     ):
         r"""Construct a new :class:`_orm.Session`.
 
@@ -1737,6 +1741,38 @@ class Session(_SessionClassMethods, EventTarget):
             :ref:`session_closing` - Detail on the semantics of
             :meth:`_orm.Session.close` and :meth:`_orm.Session.reset`.
 
+        :param parallel_flush: Defaults to ``False``.  When ``True``, and
+          the :class:`_orm.Session` is bound to multiple engines using
+          :paramref:`_orm.Session.binds`, the flush process will emit the
+          INSERT, UPDATE and DELETE statements for mappers which don't
+          depend on each other concurrently, for those mappers which are
+          bound to different connections.  Statements for each individual
+          connection continue to be emitted serially and in dependency
+          order.  A worker thread is used per connection for a
+          :class:`_orm.Session`, and an asyncio task per connection for an
+          :class:`_asyncio.AsyncSession`.
+
+          As ORM events such as :meth:`_orm.MapperEvents.before_insert` are
+          then invoked from within these worker threads or tasks, event
+          handlers used with this option must be safe to run concurrently.
+          The option has no effect when the flush involves cycles that
+          are resolved on a per-row basis, or when the
+          :class:`_orm.Session` makes use of a per-instance connection
+          callable, as is the case with the horizontal sharding extension.
+
+          .. versionadded:: 2.1
+
+        :param identity_map_cls: A class or other callable, which will be
+          invoked with no arguments in order to produce the
+          :class:`.IdentityMap` used by :attr:`_orm.Session.identity_map`.
+          A new identity map is produced each time the :class:`_orm.Session`
+          is closed or reset.  Defaults to the weak-referencing identity map
+          used normally.  The :class:`.LRUInstanceDict` class may be passed
+          in order to maintain strong references to a bounded number of
+          recently used objects.
+
+          .. versionadded:: 2.1
+
         """  # noqa
 
         # considering allowing the "autocommit" keyword to still be accepted
@@ -1747,7 +1783,8 @@ class Session(_SessionClassMethods, EventTarget):
             raise sa_exc.ArgumentError(
                 "autocommit=True is no longer supported"
             )
-        self.identity_map = identity.WeakInstanceDict()
+        self._identity_map_cls = identity_map_cls or identity.WeakInstanceDict
+        self.identity_map = self._identity_map_cls()
 
         if not future:
             raise sa_exc.ArgumentError(
@@ -1768,6 +1805,7 @@ class Session(_SessionClassMethods, EventTarget):
         self.autoflush = autoflush
         self.expire_on_commit = expire_on_commit
         self.enable_baked_queries = enable_baked_queries
+        self.parallel_flush = parallel_flush
 
         # the idea is that at some point NO_ARG will warn that in the future
         # the default will switch to close_resets_only=False.
@@ -2602,7 +2640,7 @@ class Session(_SessionClassMethods, EventTarget):
 
         all_states = self.identity_map.all_states() + list(self._new)
         self.identity_map._kill()
-        self.identity_map = identity.WeakInstanceDict()
+        self.identity_map = self._identity_map_cls()
         self._new = {}
         self._deleted = {}
 
@@ -5245,7 +5283,7 @@ def make_transient(instance: object) -> None:
         s._expunge_states([state])
 
     # remove expired state
-    state.expired_attributes.clear()
+    state.__dict__.pop("_expired_attributes", None)
 
     # remove deferred callables
     if state.callables:
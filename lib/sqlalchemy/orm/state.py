@@ -17,6 +17,7 @@ from __future__ import annotations
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
 from typing import Generic
 from typing import Iterable
 from typing import Optional
@@ -137,7 +138,6 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
         "manager",
         "obj",
         "committed_state",
-        "expired_attributes",
     )
 
     manager: ClassManager[_O]
@@ -179,14 +179,11 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
             """default 'weak reference' for _instance_dict"""
             return None
 
-    expired_attributes: Set[str]
-    """The set of keys which are 'expired' to be loaded by
-    the manager's deferred scalar loader, assuming no pending
-    changes.
-
-    See also the ``unmodified`` collection which is intersected
-    against this set when a refresh operation occurs.
-    """
+    _expired_attributes: Union[Set[str], FrozenSet[str]] = util.EMPTY_SET
+    """internal storage for :attr:`.InstanceState.expired_attributes`;
+    an immutable empty set shared among all states until an attribute is
+    expired.  Use :meth:`.InstanceState._expired_attributes_for_write` to
+    add keys to it."""
 
     callables: Dict[str, Callable[[InstanceState[_O], PassiveFlag], Any]]
     """A namespace where a per-state loader callable can be associated.
@@ -208,7 +205,33 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
         self.manager = manager
         self.obj = weakref.ref(obj, self._cleanup)
         self.committed_state = {}
-        self.expired_attributes = set()
+
+    @property
+    def expired_attributes(self) -> Set[str]:
+        """The set of keys which are 'expired' to be loaded by
+        the manager's deferred scalar loader, assuming no pending
+        changes.
+
+        See also the ``unmodified`` collection which is intersected
+        against this set when a refresh operation occurs.
+
+        """
+        return self._expired_attributes_for_write()
+
+    @expired_attributes.setter
+    def expired_attributes(self, value: Set[str]) -> None:
+        self._expired_attributes = value
+
+    def _expired_attributes_for_write(self) -> Set[str]:
+        """Return the per-state expired attributes set, allocating it
+        if no attributes have been expired so far."""
+
+        try:
+            return self.__dict__["_expired_attributes"]  # type: ignore
+        except KeyError:
+            expired_attributes: Set[str] = set()
+            self._expired_attributes = expired_attributes
+            return expired_attributes
 
     @util.memoized_property
     def attrs(self) -> util.ReadOnlyProperties[AttributeState]:
@@ -592,7 +615,7 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
             "instance": self.obj(),
             "class_": self.class_,
             "committed_state": self.committed_state,
-            "expired_attributes": self.expired_attributes,
+            "expired_attributes": set(self._expired_attributes),
         }
         state_dict.update(
             (k, self.__dict__[k])
@@ -605,7 +628,6 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
                 "parents",
                 "load_options",
                 "class_",
-                "expired_attributes",
                 "info",
             )
             if k in self.__dict__
@@ -635,13 +657,8 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
             self.info.update(state_dict["info"])
         if "callables" in state_dict:
             self.callables = state_dict["callables"]
-
-            self.expired_attributes = state_dict["expired_attributes"]
-        else:
-            if "expired_attributes" in state_dict:
-                self.expired_attributes = state_dict["expired_attributes"]
-            else:
-                self.expired_attributes = set()
+        if state_dict.get("expired_attributes"):
+            self._expired_attributes = set(state_dict["expired_attributes"])
 
         self.__dict__.update(
             [
@@ -666,7 +683,8 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
         manager_impl = self.manager[key].impl
         if old is not None and is_collection_impl(manager_impl):
             manager_impl._invalidate_collection(old)
-        self.expired_attributes.discard(key)
+        if self._expired_attributes:
+            self._expired_attributes_for_write().discard(key)
         if self.callables:
             self.callables.pop(key, None)
 
@@ -724,7 +742,7 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
         if "parents" in self.__dict__:
             del self.__dict__["parents"]
 
-        self.expired_attributes.update(
+        self._expired_attributes_for_write().update(
             [impl.key for impl in self.manager._loader_impls]
         )
 
@@ -740,7 +758,7 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
             # again.   For the moment, as of 1.4 we also apply the same
             # treatment relationships now, that is, an instance level lazy
             # loader is reset in the same way as a column loader.
-            for k in self.expired_attributes.intersection(self.callables):
+            for k in self._expired_attributes.intersection(self.callables):
                 del self.callables[k]
 
         for k in self.manager._collection_impl_keys.intersection(dict_):
@@ -773,7 +791,7 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
                 if no_loader and (impl.callable_ or key in callables):
                     continue
 
-                self.expired_attributes.add(key)
+                self._expired_attributes_for_write().add(key)
                 if callables and key in callables:
                     del callables[key]
             old = dict_.pop(key, NO_VALUE)
@@ -802,7 +820,7 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
         if not passive & SQL_OK:
             return PASSIVE_NO_RESULT
 
-        toload = self.expired_attributes.intersection(self.unmodified)
+        toload = self.unmodified.intersection(self._expired_attributes)
         toload = toload.difference(
             attr
             for attr in toload
@@ -815,7 +833,7 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
         # instance state didn't have an identity,
         # the attributes still might be in the callables
         # dict.  ensure they are removed.
-        self.expired_attributes.clear()
+        self.__dict__.pop("_expired_attributes", None)
 
         return ATTR_WAS_SET
 
@@ -958,9 +976,10 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
 
         self.expired = False
 
-        self.expired_attributes.difference_update(
-            set(keys).intersection(dict_)
-        )
+        if self._expired_attributes:
+            self._expired_attributes_for_write().difference_update(
+                set(keys).intersection(dict_)
+            )
 
         # the per-keys commit removes object-level callables,
         # while that of commit_all does not.  it's not clear
@@ -1008,7 +1027,10 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
             if "_pending_mutations" in state_dict:
                 del state_dict["_pending_mutations"]
 
-            state.expired_attributes.difference_update(dict_)
+            if "_expired_attributes" in state_dict:
+                state._expired_attributes_for_write().difference_update(dict_)
+                if not state._expired_attributes:
+                    del state_dict["_expired_attributes"]
 
             if instance_dict and state.modified:
                 instance_dict._modified.discard(state)
@@ -461,10 +461,77 @@ class UOWTransaction:
                 while set_:
                     n = set_.pop()
                     n.execute_aggregate(self, set_)
+        elif (
+            self.session.parallel_flush
+            and not self.session.connection_callable
+        ):
+            self._execute_parallel(postsort_actions)
         else:
             for rec in topological.sort(self.dependencies, postsort_actions):
                 rec.execute(self)
 
+    def _execute_parallel(self, postsort_actions):
+        """Execute postsort actions, running the INSERT/UPDATE/DELETE
+        statements of mutually independent mappers concurrently when they
+        are bound to different connections.
+
+        Used when :paramref:`_orm.Session.parallel_flush` is set.
+
+        """
+        for subset in topological.sort_as_subsets(
+            self.dependencies, postsort_actions
+        ):
+            # actions within a single subset have no dependencies
+            # on each other; SaveUpdateAll / DeleteAll for each connection
+            # can proceed independently.  other actions such as ProcessAll
+            # synchronize attributes in Python and run serially afterwards.
+            by_connection = {}
+            serial = []
+            for rec in subset:
+                if isinstance(rec, (SaveUpdateAll, DeleteAll)):
+                    connection = self.transaction.connection(rec.mapper)
+                    by_connection.setdefault(connection, []).append(rec)
+                else:
+                    serial.append(rec)
+
+            if len(by_connection) > 1:
+                self._run_concurrently(by_connection)
+                for rec in serial:
+                    rec.execute(self)
+            else:
+                for rec in subset:
+                    rec.execute(self)
+
+    def _run_concurrently(self, by_connection):
+        def run(recs):
+            for rec in recs:
+                rec.execute(self)
+
+        groups = list(by_connection.values())
+
+        if any(conn.dialect.is_async for conn in by_connection):
+            import asyncio
+
+            # asyncio session; run each group in its own task, each
+            # of which establishes its own greenlet context
+            async def gather():
+                return await asyncio.gather(
+                    *[util.greenlet_spawn(run, recs) for recs in groups],
+                    return_exceptions=True,
+                )
+
+            results = util.await_(gather())
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                futures = [executor.submit(run, recs) for recs in groups]
+            results = [future.exception() for future in futures]
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
     def finalize_flush_changes(self) -> None:
         """Mark processed objects as clean / deleted after a successful
         flush().
@@ -119,6 +119,7 @@ if typing.TYPE_CHECKING:
     from ..sql.annotation import _SA
     from ..sql.base import ReadOnlyColumnCollection
     from ..sql.elements import BindParameter
+    from ..sql.elements import ClauseElement
     from ..sql.selectable import _ColumnsClauseElement
     from ..sql.selectable import Select
     from ..sql.selectable import Selectable
@@ -1341,6 +1342,23 @@ class _WrapUserEntity:
             return getattr(subject, name)
 
 
+def _refers_to_select(crit: ColumnElement[Any]) -> bool:
+    """Return True if the given criteria embeds a SELECT, or refers to
+    columns of a FROM clause that may be derived from one, such as a
+    subquery.
+
+    """
+    for elem in cast("Iterator[ClauseElement]", visitors.iterate(crit)):
+        if elem._is_select_base or (
+            elem._is_from_clause and not elem._is_table
+        ):
+            return True
+        table = getattr(elem, "table", None)
+        if table is not None and not table._is_table:
+            return True
+    return False
+
+
 class LoaderCriteriaOption(CriteriaOption):
     """Add additional WHERE criteria to the load for all occurrences of
     a particular entity.
@@ -1489,6 +1507,15 @@ class LoaderCriteriaOption(CriteriaOption):
         else:
             crit = self.where_criteria  # type: ignore
         assert isinstance(crit, ColumnElement)
+
+        # the "for_loader_criteria" annotation is only consulted by the
+        # compile state of SELECT constructs embedded within the criteria,
+        # so that the criteria isn't applied to itself recursively.
+        # criteria that refers to no SELECT is returned as is, rather than
+        # producing a deep copy of it for every compilation
+        if not _refers_to_select(crit):
+            return crit
+
         return sql_util._deep_annotate(
             crit,
             {"for_loader_criteria": self},
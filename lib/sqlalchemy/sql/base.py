@@ -1162,6 +1162,7 @@ class Executable(roles.StatementRole):
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         populate_existing: bool = False,
         autoflush: bool = False,
+        readonly: bool = False,
         synchronize_session: SynchronizeSessionArgument = ...,
         dml_strategy: DMLStrategyArgument = ...,
         render_nulls: bool = ...,
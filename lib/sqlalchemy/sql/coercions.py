@@ -9,6 +9,8 @@
 from __future__ import annotations
 
 import collections.abc as collections_abc
+import datetime
+import decimal
 import numbers
 import re
 import typing
@@ -75,6 +77,36 @@ _F = TypeVar("_F", bound=Callable[..., Any])
 _StringOnlyR = TypeVar("_StringOnlyR", bound=roles.StringRole)
 _T = TypeVar("_T", bound=Any)
 
+# resolution paths used by expect(), cached per (role, type of element)
+_RESOLVE_AS_ROLE = 1
+"""the element is a clause element that is already of the target role"""
+
+_RESOLVE_IMPLICIT = 2
+"""the element is a clause element that is implicitly coerced to the
+target role"""
+
+_RESOLVE_LITERAL = 3
+"""the element is a plain Python literal that is coerced to the target
+role"""
+
+_resolution_cache: Dict[Tuple[Any, type], int] = {}
+
+_cacheable_literal_types = frozenset(
+    [
+        type(None),
+        bool,
+        int,
+        float,
+        str,
+        bytes,
+        decimal.Decimal,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+    ]
+)
+
 
 def _is_literal(element):
     """Return whether or not the element is a "literal" in the context
@@ -321,6 +353,48 @@ def expect(
     disable_inspection: bool = False,
     **kw: Any,
 ) -> Any:
+    impl = _impl_lookup[role]
+
+    original_element = element
+
+    # the resolution path for elements of a given type is determined by
+    # the type alone, for clause elements and plain Python literals;
+    # once seen, jump straight to it
+    resolution_key: Optional[Tuple[Type[_SR], Type[Any]]]
+    resolution_key = (role, type(element))
+    resolution = _resolution_cache.get(resolution_key)
+
+    if resolution is not None:
+        if resolution == _RESOLVE_LITERAL:
+            resolved = impl._literal_coercion(element, argname=argname, **kw)
+        else:
+            resolved = element
+
+        if apply_propagate_attrs is not None:
+            if not apply_propagate_attrs._propagate_attrs and getattr(
+                resolved, "_propagate_attrs", None
+            ):
+                apply_propagate_attrs._propagate_attrs = (
+                    resolved._propagate_attrs
+                )
+
+        if resolution == _RESOLVE_AS_ROLE or (
+            resolution == _RESOLVE_LITERAL
+            and impl._role_class in resolved.__class__.__mro__
+        ):
+            if impl._post_coercion:
+                resolved = impl._post_coercion(
+                    resolved,
+                    argname=argname,
+                    original_element=original_element,
+                    **kw,
+                )
+            return resolved
+        else:
+            return impl._implicit_coercions(
+                original_element, resolved, argname=argname, **kw
+            )
+
     if (
         role.allows_lambda
         # note callable() will not invoke a __getattr__() method, whereas
@@ -328,21 +402,21 @@ def expect(
         # we prevent most needless calls to hasattr()  and therefore
         # __getattr__(), which is present on ColumnElement.
         and callable(element)
-        and hasattr(element, "__code__")
     ):
-        return lambdas.LambdaElement(
-            element,
-            role,
-            lambdas.LambdaOptions(**kw),
-            apply_propagate_attrs=apply_propagate_attrs,
-        )
+        if hasattr(element, "__code__"):
+            return lambdas.LambdaElement(
+                element,
+                role,
+                lambdas.LambdaOptions(**kw),
+                apply_propagate_attrs=apply_propagate_attrs,
+            )
+
+        # a callable type is not cached, as whether or not it's a lambda
+        # is determined per instance
+        resolution_key = None
 
     # major case is that we are given a ClauseElement already, skip more
     # elaborate logic up front if possible
-    impl = _impl_lookup[role]
-
-    original_element = element
-
     if not isinstance(
         element,
         (
@@ -396,12 +470,15 @@ def expect(
                     resolved = impl._literal_coercion(
                         element, argname=argname, **kw
                     )
+                    if type(element) in _cacheable_literal_types:
+                        resolution = _RESOLVE_LITERAL
             else:
                 resolved = element
     elif isinstance(element, lambdas.PyWrapper):
         resolved = element._sa__py_wrapper_literal(**kw)
     else:
         resolved = element
+        resolution = _RESOLVE_IMPLICIT
 
     if apply_propagate_attrs is not None:
         if typing.TYPE_CHECKING:
@@ -413,6 +490,11 @@ def expect(
             apply_propagate_attrs._propagate_attrs = resolved._propagate_attrs
 
     if impl._role_class in resolved.__class__.__mro__:
+        if resolution == _RESOLVE_IMPLICIT:
+            resolution = _RESOLVE_AS_ROLE
+        if resolution is not None and resolution_key is not None:
+            _resolution_cache[resolution_key] = resolution
+
         if impl._post_coercion:
             resolved = impl._post_coercion(
                 resolved,
@@ -422,6 +504,9 @@ def expect(
             )
         return resolved
     else:
+        if resolution is not None and resolution_key is not None:
+            _resolution_cache[resolution_key] = resolution
+
         return impl._implicit_coercions(
             original_element, resolved, argname=argname, **kw
         )
@@ -614,6 +614,18 @@ class _InsertManyValuesBatch(NamedTuple):
     is_downgraded: bool
 
 
+def _estimated_parameter_size(value: Any) -> int:
+    """Estimate the size of a parameter value as sent to the database,
+    for the purposes of sizing insertmanyvalues batches."""
+
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    elif value is None:
+        return 4
+    else:
+        return 32
+
+
 class InsertmanyvaluesSentinelOpts(FastIntFlag):
     """bitflag enum indicating styles of PK defaults
     which can work as implicit sentinel columns
@@ -2379,10 +2391,23 @@ class SQLCompiler(Compiled):
         # CTE) and was already visited / compiled. See
         # test_relationship_criteria.py ->
         #    test_selectinload_local_criteria_subquery
+        # the nested element may also have been cloned, e.g. by an
+        # adaptation of the enclosing criteria, in which case the compiled
+        # bindparam is located by its lineage rather than by its key
+        binds_by_lineage = None
         for k in override_binds.translate:
-            if k not in self.binds:
-                continue
-            bp = self.binds[k]
+            if k in self.binds:
+                bp = self.binds[k]
+            else:
+                if binds_by_lineage is None:
+                    binds_by_lineage = {
+                        orig.key: bind
+                        for bind in set(self.binds.values())
+                        for orig in bind._cloned_set
+                    }
+                if k not in binds_by_lineage:
+                    continue
+                bp = binds_by_lineage[k]
 
             # so this would work, just change the value of bp in place.
             # but we dont want to mutate things outside.
@@ -2392,13 +2417,13 @@ class SQLCompiler(Compiled):
             # instead, need to replace bp with new_bp or otherwise accommodate
             # in all internal collections
             new_bp = bp._with_value(
-                override_binds.translate[bp.key],
+                override_binds.translate[k],
                 maintain_key=True,
                 required=False,
             )
 
             name = self.bind_names[bp]
-            self.binds[k] = self.binds[name] = new_bp
+            self.binds[bp.key] = self.binds[name] = new_bp
             self.bind_names[new_bp] = name
             self.bind_names.pop(bp, None)
 
@@ -4413,6 +4438,79 @@ class SQLCompiler(Compiled):
             **kw,
         )
 
+    def _label_select_columns(
+        self,
+        select,
+        compile_state,
+        populate_result_map,
+        asfrom,
+        column_clause_args,
+        need_column_expressions,
+    ):
+        """produce the list of rendered columns present in a select().
+
+        Plain column expressions that need no label and no type-level
+        column expression, which is the case for most columns in a
+        top-level SELECT, are dispatched directly; all others are
+        passed through :meth:`._label_select_column`.
+
+        """
+        label_select_column = self._label_select_column
+
+        # a dialect or third party compiler that overrides
+        # _label_select_column gets every column passed to it
+        simple_columns = (
+            not asfrom
+            and type(self)._label_select_column
+            is SQLCompiler._label_select_column
+        )
+        add_to_result_map = (
+            self._add_to_result_map if populate_result_map else None
+        )
+        dialect = self.dialect
+
+        inner_columns = []
+        for (
+            name,
+            proxy_name,
+            fallback_label_name,
+            column,
+            repeated,
+        ) in compile_state.columns_plus_names:
+            if (
+                simple_columns
+                and name is None
+                and not repeated
+                and column.__visit_name__ == "column"
+                and not column.type.dialect_impl(
+                    dialect
+                )._has_column_expression
+            ):
+                # inlined form of _label_select_column() for an unlabeled
+                # column, which is rendered as is
+                column_clause_args.update(
+                    within_columns_clause=True,
+                    add_to_result_map=add_to_result_map,
+                    include_table=True,
+                )
+                c = column._compiler_dispatch(self, **column_clause_args)
+            else:
+                c = label_select_column(
+                    select,
+                    column,
+                    populate_result_map,
+                    asfrom,
+                    column_clause_args,
+                    name=name,
+                    proxy_name=proxy_name,
+                    fallback_label_name=fallback_label_name,
+                    column_is_repeated=repeated,
+                    need_column_expressions=need_column_expressions,
+                )
+            if c is not None:
+                inner_columns.append(c)
+        return inner_columns
+
     def _label_select_column(
         self,
         select,
@@ -4747,31 +4845,14 @@ class SQLCompiler(Compiled):
 
         text += self.get_select_precolumns(select_stmt, **kwargs)
         # the actual list of columns to print in the SELECT column list.
-        inner_columns = [
-            c
-            for c in [
-                self._label_select_column(
-                    select_stmt,
-                    column,
-                    populate_result_map,
-                    asfrom,
-                    column_clause_args,
-                    name=name,
-                    proxy_name=proxy_name,
-                    fallback_label_name=fallback_label_name,
-                    column_is_repeated=repeated,
-                    need_column_expressions=need_column_expressions,
-                )
-                for (
-                    name,
-                    proxy_name,
-                    fallback_label_name,
-                    column,
-                    repeated,
-                ) in compile_state.columns_plus_names
-            ]
-            if c is not None
-        ]
+        inner_columns = self._label_select_columns(
+            select_stmt,
+            compile_state,
+            populate_result_map,
+            asfrom,
+            column_clause_args,
+            need_column_expressions,
+        )
 
         if populate_result_map and select_wraps_for is not None:
             # if this select was generated from translate_select,
@@ -5380,6 +5461,51 @@ class SQLCompiler(Compiled):
 
         return None
 
+    def _insertmanyvalues_bulk_params(
+        self,
+    ) -> Optional[List[Tuple[ColumnElement[Any], str, str, Optional[str]]]]:
+        """Return the INSERT columns of an insertmanyvalues INSERT for a
+        dialect that sends its rows to the database in bulk rather than in
+        an INSERT..VALUES statement, or None if the statement can't be
+        sent in this way.
+
+        Each column is a tuple of (column, column expression, value,
+        parameter name).  The parameter name is None for columns whose
+        value is a SQL expression without bound parameters, in which case
+        the value is the rendered expression; otherwise the value renders
+        only the bound parameter.
+
+        """
+        imv = self._insertmanyvalues
+
+        if (
+            imv is None
+            or self.effective_returning
+            or imv.is_default_expr
+            or imv.includes_upsert_behaviors
+            or self.statement._prefixes  # type: ignore[union-attr]
+            or self.schema_translate_map
+        ):
+            return None
+
+        columns: List[Tuple[ColumnElement[Any], str, str, Optional[str]]] = []
+        for col, col_expr, value, names in imv.insert_crud_params:
+            names = list(names)
+            if not names:
+                # SQL expressions that embed bound parameters, such as
+                # expanding or post compile parameters, are rendered per row
+                if "__[" in value:
+                    return None
+                columns.append((col, col_expr, value, None))
+            elif len(names) == 1 and value == self.bindtemplate % {
+                "name": self.escaped_bind_names.get(names[0], names[0])
+            }:
+                columns.append((col, col_expr, value, names[0]))
+            else:
+                return None
+
+        return columns
+
     def _deliver_insertmanyvalues_batches(
         self,
         statement: str,
@@ -5498,9 +5624,6 @@ class SQLCompiler(Compiled):
 
         processed_setinputsizes: Optional[_GenericSetInputSizesType] = None
         batchnum = 1
-        total_batches = lenparams // batch_size + (
-            1 if lenparams % batch_size else 0
-        )
 
         insert_crud_params = imv.insert_crud_params
         assert insert_crud_params is not None
@@ -5593,7 +5716,36 @@ class SQLCompiler(Compiled):
                     rf"{escaped}\d+", "%s", executemany_values_w_comma
                 )
 
+        # Use optional insertmanyvalues_max_statement_size to further
+        # shrink individual batches so that the statement along with its
+        # parameters is no larger than this size.  Currently used by MySQL,
+        # which limits statements to the max_allowed_packet size.
+        max_statement_size = self.dialect.insertmanyvalues_max_statement_size
+        batch_sizes: Optional[List[int]]
+        if max_statement_size:
+            if self.positional:
+                values_clause_size = len(executemany_values_w_comma)
+            else:
+                values_clause_size = len(formatted_values_clause) + 2
+
+            batch_sizes = self._insertmanyvalues_batch_sizes(
+                parameters,
+                batch_size,
+                max_statement_size,
+                len(statement),
+                values_clause_size,
+            )
+            total_batches = len(batch_sizes)
+        else:
+            batch_sizes = None
+            total_batches = lenparams // batch_size + (
+                1 if lenparams % batch_size else 0
+            )
+
         while batches:
+            if batch_sizes:
+                batch_size = batch_sizes[batchnum - 1]
+
             batch = batches[0:batch_size]
             compiled_batch = compiled_batches[0:batch_size]
 
@@ -5727,6 +5879,52 @@ class SQLCompiler(Compiled):
             )
             batchnum += 1
 
+    def _insertmanyvalues_batch_sizes(
+        self,
+        parameters: _DBAPIMultiExecuteParams,
+        page_size: int,
+        max_statement_size: int,
+        statement_size: int,
+        values_clause_size: int,
+    ) -> List[int]:
+        """Return the number of rows for each batch of an insertmanyvalues
+        execution, limited both by ``page_size`` and by an estimate of the
+        size of each statement along with its parameters.
+
+        A single row that is larger than ``max_statement_size`` on its own
+        is still sent as a batch of one.
+
+        """
+        batch_sizes = []
+        current_rows = 0
+        current_size = statement_size
+        estimate = _estimated_parameter_size
+
+        values: Iterable[Any]
+        for param in parameters:
+            if self.positional:
+                values = cast("Sequence[Any]", param)
+            else:
+                values = cast("Mapping[str, Any]", param).values()
+
+            row_size = values_clause_size + sum(map(estimate, values))
+
+            if current_rows and (
+                current_rows == page_size
+                or current_size + row_size > max_statement_size
+            ):
+                batch_sizes.append(current_rows)
+                current_rows = 0
+                current_size = statement_size
+
+            current_rows += 1
+            current_size += row_size
+
+        if current_rows:
+            batch_sizes.append(current_rows)
+
+        return batch_sizes
+
     def visit_insert(
         self, insert_stmt, visited_bindparam=None, visiting_cte=None, **kw
     ):
@@ -55,6 +55,7 @@ _LambdaCacheType = MutableMapping[
     Tuple[Any, ...], Union["NonAnalyzedFunction", "AnalyzedFunction"]
 ]
 _BoundParameterGetter = Callable[..., Any]
+_BoundParameterExtractor = Tuple[str, Optional[int], "BindParameter[Any]"]
 
 _closure_per_cache_key: _LambdaCacheType = util.LRUCache(1000)
 
@@ -303,13 +304,32 @@ class LambdaElement(elements.ClauseElement):
             while lambda_element is not None:
                 rec = lambda_element._rec
                 if rec.bindparam_trackers:
-                    tracker_instrumented_fn = rec.tracker_instrumented_fn
-                    for tracker in rec.bindparam_trackers:
-                        tracker(
-                            lambda_element.fn,
-                            tracker_instrumented_fn,
-                            bindparams,
-                        )
+                    extractors = rec.bindparam_extractors
+                    if extractors is not None:
+                        # inlined form of the bindparam trackers, for the
+                        # case where each bound value is located directly
+                        # in a closure cell or global
+                        current_fn = lambda_element.fn
+                        current_closure = current_fn.__closure__
+                        for name, closure_index, param in extractors:
+                            if closure_index is None:
+                                value = current_fn.__globals__[name]
+                            else:
+                                assert current_closure is not None
+                                value = current_closure[
+                                    closure_index
+                                ].cell_contents
+                            bindparams.append(
+                                param._with_value(value, maintain_key=True)
+                            )
+                    else:
+                        tracker_instrumented_fn = rec.tracker_instrumented_fn
+                        for tracker in rec.bindparam_trackers:
+                            tracker(
+                                lambda_element.fn,
+                                tracker_instrumented_fn,
+                                bindparams,
+                            )
                 lambda_element = lambda_element.parent_lambda
 
         return rec
@@ -608,7 +628,7 @@ class StatementLambdaElement(
 
     @property
     def _proxied(self) -> Any:
-        return self._rec_expected_expr
+        return self._rec.expected_expr
 
     @property
     def _with_options(self):
@@ -1089,6 +1109,7 @@ class NonAnalyzedFunction:
 
     closure_bindparams: Optional[List[BindParameter[Any]]] = None
     bindparam_trackers: Optional[List[_BoundParameterGetter]] = None
+    bindparam_extractors: Optional[Tuple[_BoundParameterExtractor, ...]] = None
 
     is_sequence = False
 
@@ -1110,6 +1131,7 @@ class AnalyzedFunction:
         "tracker_instrumented_fn",
         "expr",
         "bindparam_trackers",
+        "bindparam_extractors",
         "expected_expr",
         "is_sequence",
         "propagate_attrs",
@@ -1119,6 +1141,7 @@ class AnalyzedFunction:
     closure_bindparams: Optional[List[BindParameter[Any]]]
     expected_expr: Union[ClauseElement, List[ClauseElement]]
     bindparam_trackers: Optional[List[_BoundParameterGetter]]
+    bindparam_extractors: Optional[Tuple[_BoundParameterExtractor, ...]]
 
     def __init__(
         self,
@@ -1136,6 +1159,8 @@ class AnalyzedFunction:
 
         self._coerce_expression(lambda_element, apply_propagate_attrs)
 
+        self._setup_bindparam_extractors(lambda_element)
+
     def _instrument_and_run_function(self, lambda_element):
         analyzed_code = self.analyzed_code
 
@@ -1204,6 +1229,46 @@ class AnalyzedFunction:
             # variable.
             self.expr = lambda_element._invoke_user_fn(tracker_instrumented_fn)
 
+    def _setup_bindparam_extractors(self, lambda_element):
+        """Locate the bound parameter generated by each :class:`.PyWrapper`
+        in the instrumented function.
+
+        When each bound value is the direct contents of a closure cell or
+        global, as opposed to an attribute or index of one, the new values
+        for a lambda that refers to the same code can be copied into
+        these parameters directly, without running the more general
+        bindparam trackers.
+
+        """
+        self.bindparam_extractors = None
+
+        # deferred lambdas run the instrumented function again at compile
+        # time, which may establish new parameters
+        if not self.bindparam_trackers or isinstance(
+            lambda_element, DeferredLambdaElement
+        ):
+            return
+
+        tracker_instrumented_fn = self.tracker_instrumented_fn
+
+        extractors = []
+        for name, closure_index in self.analyzed_code.build_py_wrappers:
+            if closure_index is None:
+                wrapper = tracker_instrumented_fn.__globals__[name]
+            else:
+                wrapper = tracker_instrumented_fn.__closure__[
+                    closure_index
+                ].cell_contents
+
+            if object.__getattribute__(wrapper, "_bind_paths"):
+                return
+
+            param = object.__getattribute__(wrapper, "_param")
+            if param is not None:
+                extractors.append((name, closure_index, param))
+
+        self.bindparam_extractors = tuple(extractors)
+
     def _coerce_expression(self, lambda_element, apply_propagate_attrs):
         """Run the tracker-generated expression through coercion rules.
 
@@ -18,6 +18,7 @@ def _all_cython_modules():
     from ..engine import _processors_cy
     from ..engine import _row_cy
     from ..engine import _util_cy as engine_util
+    from ..event import _attr_cy
     from ..sql import _util_cy as sql_util
 
     return (
@@ -26,6 +27,7 @@ def _all_cython_modules():
         _processors_cy,
         _row_cy,
         engine_util,
+        _attr_cy,
         sql_util,
     )
 
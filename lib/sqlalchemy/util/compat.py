@@ -13,7 +13,6 @@ from __future__ import annotations
 import base64
 import dataclasses
 import hashlib
-from importlib import metadata as importlib_metadata
 import inspect
 import operator
 import platform
@@ -143,6 +142,10 @@ else:
 
 
 def importlib_metadata_get(group):
+    # importlib.metadata is expensive to import and is only needed
+    # when plugins are looked up, so import it on first use
+    from importlib import metadata as importlib_metadata
+
     ep = importlib_metadata.entry_points()
     if typing.TYPE_CHECKING or hasattr(ep, "select"):
         return ep.select(group=group)
@@ -8,7 +8,7 @@
 
 from __future__ import annotations
 
-import asyncio
+import collections.abc
 import sys
 from typing import Any
 from typing import Awaitable
@@ -26,15 +26,48 @@ from .typing import Self
 from .typing import TypeGuard
 from .. import exc
 
+if TYPE_CHECKING:
+    import asyncio
+
 _T = TypeVar("_T")
 
 
+class _asyncio_shim_cls:
+    """Late import shim for asyncio.
+
+    asyncio is imported on first attribute access only, as it is
+    comparatively expensive to import and isn't needed by applications
+    that don't use it.
+
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, key: str) -> Any:
+        import asyncio
+
+        return getattr(asyncio, key)
+
+
+if not TYPE_CHECKING:
+    lazy_asyncio = _asyncio_shim_cls()
+else:
+    lazy_asyncio = asyncio
+
+
 def is_exit_exception(e: BaseException) -> bool:
     # note asyncio.CancelledError is already BaseException
     # so was an exit exception in any case
-    return not isinstance(e, Exception) or isinstance(
-        e, (asyncio.TimeoutError, asyncio.CancelledError)
-    )
+    if not isinstance(e, Exception):
+        return True
+    elif py311:
+        # asyncio.TimeoutError is the builtin TimeoutError
+        return isinstance(e, TimeoutError)
+    else:
+        # asyncio.TimeoutError can't have been raised if asyncio
+        # was never imported
+        asyncio = sys.modules.get("asyncio")
+        return asyncio is not None and isinstance(e, asyncio.TimeoutError)
 
 
 _ERROR_MESSAGE = (
@@ -127,7 +160,9 @@ if TYPE_CHECKING:
     ) -> TypeGuard[Coroutine[Any, Any, _T_co]]: ...
 
 else:
-    iscoroutine = asyncio.iscoroutine
+
+    def iscoroutine(awaitable):
+        return isinstance(awaitable, collections.abc.Coroutine)
 
 
 def _safe_cancel_awaitable(awaitable: Awaitable[Any]) -> None:
@@ -227,7 +262,7 @@ class AsyncAdaptedLock:
     def mutex(self) -> asyncio.Lock:
         # there should not be a race here for coroutines creating the
         # new lock as we are not using await, so therefore no concurrency
-        return asyncio.Lock()
+        return lazy_asyncio.Lock()
 
     def __enter__(self) -> bool:
         # await is used to acquire the lock only after the first calling
@@ -239,7 +274,10 @@ class AsyncAdaptedLock:
 
 
 if not TYPE_CHECKING and py311:
-    _Runner = asyncio.Runner
+
+    def _Runner():
+        return lazy_asyncio.Runner()
+
 else:
 
     class _Runner:
@@ -282,7 +320,7 @@ else:
             if self._loop is False:
                 raise RuntimeError("Runner is closed")
             if self._loop is None:
-                self._loop = asyncio.new_event_loop()
+                self._loop = lazy_asyncio.new_event_loop()
 
 
 class _AsyncUtil:
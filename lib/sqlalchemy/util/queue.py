@@ -20,7 +20,6 @@ condition.
 """
 from __future__ import annotations
 
-import asyncio
 from collections import deque
 import threading
 from time import time as _time
@@ -28,11 +27,15 @@ from typing import Any
 from typing import Deque
 from typing import Generic
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import TypeVar
 
 from .concurrency import await_
+from .concurrency import lazy_asyncio
 from .langhelpers import memoized_property
 
+if TYPE_CHECKING:
+    import asyncio
 
 _T = TypeVar("_T", bound=Any)
 __all__ = ["Empty", "Full", "Queue"]
@@ -260,15 +263,15 @@ class AsyncAdaptedQueue(QueueCommon[_T]):
         queue: asyncio.Queue[_T]
 
         if self.use_lifo:
-            queue = asyncio.LifoQueue(maxsize=self.maxsize)
+            queue = lazy_asyncio.LifoQueue(maxsize=self.maxsize)
         else:
-            queue = asyncio.Queue(maxsize=self.maxsize)
+            queue = lazy_asyncio.Queue(maxsize=self.maxsize)
         return queue
 
     def put_nowait(self, item: _T) -> None:
         try:
             self._queue.put_nowait(item)
-        except asyncio.QueueFull as err:
+        except lazy_asyncio.QueueFull as err:
             raise Full() from err
 
     def put(
@@ -279,16 +282,16 @@ class AsyncAdaptedQueue(QueueCommon[_T]):
 
         try:
             if timeout is not None:
-                await_(asyncio.wait_for(self._queue.put(item), timeout))
+                await_(lazy_asyncio.wait_for(self._queue.put(item), timeout))
             else:
                 await_(self._queue.put(item))
-        except (asyncio.QueueFull, asyncio.TimeoutError) as err:
+        except (lazy_asyncio.QueueFull, lazy_asyncio.TimeoutError) as err:
             raise Full() from err
 
     def get_nowait(self) -> _T:
         try:
             return self._queue.get_nowait()
-        except asyncio.QueueEmpty as err:
+        except lazy_asyncio.QueueEmpty as err:
             raise Empty() from err
 
     def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
@@ -297,8 +300,10 @@ class AsyncAdaptedQueue(QueueCommon[_T]):
 
         try:
             if timeout is not None:
-                return await_(asyncio.wait_for(self._queue.get(), timeout))
+                return await_(
+                    lazy_asyncio.wait_for(self._queue.get(), timeout)
+                )
             else:
                 return await_(self._queue.get())
-        except (asyncio.QueueEmpty, asyncio.TimeoutError) as err:
+        except (lazy_asyncio.QueueEmpty, lazy_asyncio.TimeoutError) as err:
             raise Empty() from err
@@ -35,6 +35,7 @@ CYTHON_MODULES = (
     "engine._processors_cy",
     "engine._row_cy",
     "engine._util_cy",
+    "event._attr_cy",
     "sql._util_cy",
     "util._collections_cy",
     "util._immutabledict_cy",
@@ -1,14 +1,18 @@
+from sqlalchemy import bindparam
 from sqlalchemy import Column
 from sqlalchemy import Integer
+from sqlalchemy import lambda_stmt
 from sqlalchemy import MetaData
 from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy.engine import default
+from sqlalchemy.ext import baked
 from sqlalchemy.sql.selectable import LABEL_STYLE_TABLENAME_PLUS_COL
 from sqlalchemy.testing import AssertsExecutionResults
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import profiling
+from sqlalchemy.testing.fixtures import fixture_session
 
 
 t1 = t2 = None
@@ -104,3 +108,113 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
             s.compile(dialect=self.dialect)
 
         go()
+
+    def test_select_construction(self):
+        def go():
+            select(t1.c.c1, t1.c.c2).where(
+                t1.c.c1 == 5, t1.c.c2 == "some value"
+            ).where(t1.c.c1.in_([1, 2, 3])).order_by(t1.c.c2, t1.c.c1)
+
+        go()
+        profiling.function_call_count(variance=0.15)(go)()
+
+    def test_insert_construction(self):
+        def go():
+            t1.insert().values(c1=5, c2="some value")
+
+        go()
+        profiling.function_call_count(variance=0.15)(go)()
+
+    def test_update_construction(self):
+        def go():
+            t1.update().values(c2="some value").where(t1.c.c1 == 5)
+
+        go()
+        profiling.function_call_count(variance=0.15)(go)()
+
+
+class CachedStatementTest(fixtures.MappedTest):
+    """compare the overhead of repeatedly invoking the same statement,
+    present in the compiled cache, with a new parameter, when produced
+    with :func:`_sql.select`, :func:`_sql.lambda_stmt` and the baked
+    query extension.
+
+    """
+
+    __requires__ = ("python_profiling_backend",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "parent",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data1", String(20)),
+            Column("data2", String(20)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Parent = cls.classes.Parent
+        parent = cls.tables.parent
+
+        cls.mapper_registry.map_imperatively(Parent, parent)
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.parent.insert(),
+            [
+                {"id": i, "data1": "d1 %d" % i, "data2": "d2 %d" % i}
+                for i in range(10)
+            ],
+        )
+
+    def test_select(self):
+        Parent = self.classes.Parent
+        sess = fixture_session()
+
+        def go():
+            for i in range(10):
+                sess.execute(
+                    select(Parent.data1, Parent.data2).where(Parent.id == i)
+                ).all()
+
+        go()
+        profiling.function_call_count()(go)()
+
+    def test_lambda_stmt(self):
+        Parent = self.classes.Parent
+        sess = fixture_session()
+
+        def go():
+            for i in range(10):
+                sess.execute(
+                    lambda_stmt(
+                        lambda: select(Parent.data1, Parent.data2).where(
+                            Parent.id == i
+                        )
+                    )
+                ).all()
+
+        go()
+        profiling.function_call_count()(go)()
+
+    def test_baked(self):
+        Parent = self.classes.Parent
+        sess = fixture_session()
+        bakery = baked.bakery()
+
+        def go():
+            for i in range(10):
+                bq = bakery(lambda s: s.query(Parent.data1, Parent.data2))
+                bq += lambda q: q.filter(Parent.id == bindparam("id"))
+                bq(sess).params(id=i).all()
+
+        go()
+        profiling.function_call_count()(go)()
@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 import sqlalchemy
 from sqlalchemy import Column
 from sqlalchemy import Enum
@@ -377,3 +381,56 @@ class CCLookupTest(fixtures.RemoveORMEventsGlobally, fixtures.TestBase):
             select(a1.x1, a1.x2, a1.x3, a1.x4)
 
         go()
+
+
+class ImportTest(fixtures.TestBase):
+    """guard against import time regressions, by ensuring modules which
+    are expensive to import and aren't needed for basic use are not
+    pulled in by importing sqlalchemy."""
+
+    __requires__ = ("cpython",)
+
+    def _modules_imported(self, stmt, modules):
+        code = (
+            f"import sys; {stmt}; "
+            f"print(','.join(m for m in {modules!r} if m in sys.modules))"
+        )
+        parts = list(sys.path)
+        if os.environ.get("PYTHONPATH"):
+            parts.append(os.environ["PYTHONPATH"])
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(parts)},
+            capture_output=True,
+            text=True,
+        )
+        eq_(proc.returncode, 0, proc.stderr)
+        return [m for m in proc.stdout.strip().split(",") if m]
+
+    @testing.combinations(
+        ("import sqlalchemy",),
+        ("import sqlalchemy.orm",),
+        argnames="stmt",
+    )
+    def test_no_expensive_imports(self, stmt):
+        eq_(
+            self._modules_imported(
+                stmt,
+                (
+                    "asyncio",
+                    "concurrent.futures",
+                    "importlib.metadata",
+                    "greenlet",
+                    "sqlalchemy.ext.asyncio",
+                ),
+            ),
+            [],
+        )
+
+    def test_core_does_not_import_orm(self):
+        eq_(
+            self._modules_imported(
+                "import sqlalchemy", ("sqlalchemy.orm", "sqlalchemy.ext")
+            ),
+            [],
+        )
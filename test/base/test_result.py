@@ -8,6 +8,7 @@ from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing.assertions import expect_deprecated
@@ -282,6 +283,85 @@ class ResultTupleTest(fixtures.TestBase):
         with expect_raises(AssertionError):
             result.Row(parent, [None, str], parent._key_to_index, data)
 
+    @testing.combinations(
+        ([str, float, int, str.upper], None, ("1", 99.0, 42, "FOO")),
+        ([None, str, None, str.upper], None, (1, "99", "42", "FOO")),
+        ([None, None, int, None], None, (1, 99, 42, "foo")),
+        ([str.upper, None], [3, 0], ("FOO", 1)),
+        ([int], [2], (42,)),
+        argnames="processors, source_indexes, expected",
+    )
+    def test_fused_processors(self, processors, source_indexes, expected):
+        parent = result.SimpleResultMetaData(["a", "b", "c", "d"])
+        data = (1, 99, "42", "foo")
+
+        make_row = result._fused_row_getter(
+            result.Row,
+            parent,
+            processors,
+            parent._key_to_index,
+            source_indexes,
+        )
+        row = make_row(data)
+        is_true(isinstance(row, result.Row))
+        eq_(row._to_tuple_instance(), expected)
+
+    def test_fused_processors_shape_is_cached(self):
+        parent = result.SimpleResultMetaData(["a", "b"])
+
+        make_row_one = result._fused_row_getter(
+            result.Row, parent, [None, str], parent._key_to_index
+        )
+        make_row_two = result._fused_row_getter(
+            result.Row, parent, [None, float], parent._key_to_index
+        )
+
+        # the same generated code serves both shapes, with the processors
+        # of each
+        is_(make_row_one.__code__, make_row_two.__code__)
+        eq_(make_row_one((1, 2))._to_tuple_instance(), (1, "2"))
+        eq_(make_row_two((1, 2))._to_tuple_instance(), (1, 2.0))
+
+    @testing.combinations(
+        ([str, float, int, str.upper], None, ("1", 99.0, 42, "FOO")),
+        ([None, str, None, str.upper], None, (1, "99", "42", "FOO")),
+        ([str.upper, None], [3, 0], ("FOO", 1)),
+        argnames="processors, source_indexes, expected",
+    )
+    @testing.variation("batch", ["small", "large"])
+    def test_column_processors(
+        self, processors, source_indexes, expected, batch
+    ):
+        parent = result.SimpleResultMetaData(["a", "b", "c", "d"])
+        data = (1, 99, "42", "foo")
+
+        make_row = result._fused_row_getter(
+            result.Row,
+            parent,
+            processors,
+            parent._key_to_index,
+            source_indexes,
+        )
+        make_rows = result._column_rows_getter(
+            result.Row,
+            parent,
+            processors,
+            parent._key_to_index,
+            make_row,
+            source_indexes,
+        )
+
+        if batch.small:
+            num = result._column_processing_threshold - 1
+        else:
+            num = result._column_processing_threshold * 3
+
+        rows = make_rows([data] * num)
+        eq_(len(rows), num)
+        for row in rows:
+            is_true(isinstance(row, result.Row))
+            eq_(row._to_tuple_instance(), expected)
+
     def test_tuplegetter(self):
         data = list(range(10, 20))
         eq_(result.tuplegetter(1)(data), [11])
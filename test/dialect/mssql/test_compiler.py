@@ -1595,6 +1595,36 @@ class CompileTest(fixtures.TestBase, AssertsCompiledSQL):
             "SELECT TRY_CAST (t1.id AS INTEGER) AS id FROM t1",
         )
 
+    @testing.variation("use_type", [True, False])
+    def test_openjson_values(self, use_type):
+        t1 = Table("t1", MetaData(), Column("id", Integer, primary_key=True))
+
+        stmt = select(t1).where(
+            t1.c.id.in_(
+                mssql.openjson_values(
+                    range(5000), Integer if use_type else None
+                )
+            )
+        )
+
+        self.assert_compile(
+            stmt,
+            "SELECT t1.id FROM t1 WHERE t1.id IN "
+            "(SELECT %s FROM openjson(:param_1) AS anon_1)"
+            % (
+                "CAST(anon_1.value AS INTEGER) AS value"
+                if use_type
+                else "anon_1.value"
+            ),
+            checkparams={"param_1": list(range(5000))},
+        )
+
+        compiled = stmt.compile(dialect=mssql.pyodbc.dialect())
+        eq_(
+            compiled._bind_processors["param_1"](list(range(3))),
+            "[0, 1, 2]",
+        )
+
     @testing.combinations(
         ("no_persisted", "", "ignore"),
         ("persisted_none", "", None),
@@ -1,32 +1,44 @@
+import datetime
 from decimal import Decimal
 import re
 from unittest.mock import Mock
+import uuid
 
 from sqlalchemy import Column
+from sqlalchemy import DateTime
 from sqlalchemy import event
 from sqlalchemy import exc
+from sqlalchemy import Float
+from sqlalchemy import func
 from sqlalchemy import inspect
 from sqlalchemy import Integer
+from sqlalchemy import LargeBinary
+from sqlalchemy import MetaData
 from sqlalchemy import Numeric
 from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy.dialects.mssql import base
+from sqlalchemy.dialects.mssql import openjson_values
 from sqlalchemy.dialects.mssql import pymssql
 from sqlalchemy.dialects.mssql import pyodbc
+from sqlalchemy.engine import default
 from sqlalchemy.engine import url
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.sqltypes import NullType
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import assert_warnings
+from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import mock
 
 
@@ -620,6 +632,250 @@ class FastExecutemanyTest(fixtures.TestBase):
                 eq_(canary.mock_calls, [])
 
 
+class OpenJSONExecutemanyTest(fixtures.TestBase):
+    @testing.fixture
+    def openjson_table(self):
+        return Table(
+            "some_table",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            Column("bin", LargeBinary),
+            Column("ts", DateTime),
+            Column("amount", Numeric(10, 2)),
+            Column("created", DateTime, default=func.now()),
+        )
+
+    def _compile(
+        self,
+        stmt,
+        dialect,
+        column_keys=("id", "data", "bin", "ts", "amount"),
+    ):
+        return stmt.compile(
+            dialect=dialect,
+            column_keys=list(column_keys),
+            for_executemany=True,
+        )
+
+    @testing.combinations(
+        (None, None),
+        ("plain", "plain"),
+        (True, True),
+        (12, 12),
+        (1.5, 1.5),
+        (b"\x00\x01\xff", "AAH/"),
+        (bytearray(b"ab"), "YWI="),
+        (Decimal("1E+2"), "100"),
+        (
+            datetime.datetime(2024, 5, 1, 12, 30, 5, 123456),
+            "2024-05-01T12:30:05.123456",
+        ),
+        (datetime.date(2024, 5, 1), "2024-05-01"),
+        (datetime.time(12, 30, 5), "12:30:05"),
+        (
+            uuid.UUID("ba5cf7ea-8f3b-4c1e-9a4e-7b9c0c3f1d2e"),
+            "ba5cf7ea-8f3b-4c1e-9a4e-7b9c0c3f1d2e",
+        ),
+        argnames="value, expected",
+    )
+    def test_openjson_value(self, value, expected):
+        eq_(pyodbc._openjson_value(value), expected)
+
+    @testing.variation("paramstyle", ["qmark", "named"])
+    def test_deliver_openjson(self, openjson_table, paramstyle):
+        dialect = pyodbc.dialect(
+            use_openjson_executemany=True, paramstyle=paramstyle.name
+        )
+        compiled = self._compile(openjson_table.insert(), dialect)
+        context = Mock(
+            compiled=compiled,
+            compiled_parameters=[
+                {
+                    "id": 1,
+                    "data": 'd1 "quoted"',
+                    "bin": b"ab",
+                    "ts": datetime.datetime(2024, 5, 1, 12, 30, 5),
+                    "amount": Decimal("5.25"),
+                },
+                {
+                    "id": 2,
+                    "data": None,
+                    "bin": None,
+                    "ts": None,
+                    "amount": None,
+                },
+            ],
+        )
+
+        batches = list(
+            dialect._deliver_insertmanyvalues_batches(
+                None, None, compiled.string, [], None, context
+            )
+        )
+        eq_(len(batches), 1)
+        batch = batches[0]
+
+        eq_(
+            batch.replaced_statement,
+            "INSERT INTO some_table (id, data, bin, ts, amount, created) "
+            "SELECT p0, p1, p2, p3, p4, CURRENT_TIMESTAMP "
+            "FROM OPENJSON(CAST(%s AS NVARCHAR(max))) "
+            "WITH (p0 INTEGER '$[0]', p1 VARCHAR(50) '$[1]', "
+            "p2 VARBINARY(max) '$[2]', p3 DATETIME2 '$[3]', "
+            "p4 NUMERIC(10, 2) '$[4]')"
+            % ("?" if paramstyle.qmark else ":rows"),
+        )
+
+        rows = (
+            '[[1,"d1 \\"quoted\\"","YWI=","2024-05-01T12:30:05","5.25"],'
+            "[2,null,null,null,null]]"
+        )
+        eq_(
+            batch.replaced_parameters,
+            (rows,) if paramstyle.qmark else {"rows": rows},
+        )
+        eq_(batch.current_batch_size, 2)
+        eq_(batch.total_batches, 1)
+
+    @testing.combinations(
+        float("nan"), float("inf"), float("-inf"), argnames="value"
+    )
+    def test_openjson_non_finite_float(self, value):
+        t = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("data", Float),
+        )
+        dialect = pyodbc.dialect(use_openjson_executemany=True)
+        compiled = self._compile(t.insert(), dialect, ("id", "data"))
+        context = Mock(
+            compiled=compiled,
+            compiled_parameters=[
+                {"id": 1, "data": 1.5},
+                {"id": 2, "data": value},
+            ],
+        )
+
+        # NaN and infinity can't be sent as JSON, so the rows are sent as
+        # INSERT..VALUES by insertmanyvalues
+        with mock.patch.object(
+            default.DefaultDialect,
+            "_deliver_insertmanyvalues_batches",
+            return_value=iter(["imv batch"]),
+        ) as imv:
+            batches = list(
+                dialect._deliver_insertmanyvalues_batches(
+                    None, None, compiled.string, [], None, context
+                )
+            )
+        eq_(batches, ["imv batch"])
+        eq_(len(imv.mock_calls), 1)
+
+    def test_openjson_no_ddl_type(self):
+        t = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("data", NullType()),
+        )
+        dialect = pyodbc.dialect(use_openjson_executemany=True)
+        compiled = self._compile(t.insert(), dialect, ("id", "data"))
+
+        is_(dialect._openjson_insert_columns(compiled), None)
+
+    def test_openjson_fast_executemany_exclusive(self):
+        with expect_raises_message(
+            exc.ArgumentError,
+            "fast_executemany and use_openjson_executemany can't be used "
+            "together",
+        ):
+            pyodbc.dialect(
+                fast_executemany=True, use_openjson_executemany=True
+            )
+
+
+class OpenJSONExecutemanyBackendTest(fixtures.TablesTest):
+    __only_on__ = "mssql+pyodbc"
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "openjson_data",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("data", String(50)),
+            Column("bin", LargeBinary),
+            Column("ts", DateTime),
+            Column("created", DateTime, default=func.now()),
+        )
+
+    def test_openjson_executemany(self, testing_engine):
+        if testing.db.dialect.server_version_info < (13,):
+            config.skip_test("OPENJSON requires SQL Server 2016")
+
+        engine = testing_engine(options={"use_openjson_executemany": True})
+        openjson_data = self.tables.openjson_data
+
+        statements = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            statements.append(statement)
+
+        def row(i):
+            return {
+                "id": i,
+                "data": "data '%d'" % i if i % 5 else None,
+                "bin": b"\x00\x01%d" % i,
+                "ts": datetime.datetime(2024, 5, 1, 12, i % 60, 5, 123000),
+            }
+
+        # more parameters than a single statement would allow
+        with engine.begin() as conn:
+            conn.execute(openjson_data.insert(), [row(i) for i in range(1000)])
+
+        eq_(len(statements), 1)
+        is_(statements[0].startswith("INSERT INTO openjson_data"), True)
+
+        with engine.connect() as conn:
+            eq_(
+                conn.execute(
+                    select(
+                        openjson_data.c.id,
+                        openjson_data.c.data,
+                        openjson_data.c.bin,
+                        openjson_data.c.ts,
+                    ).order_by(openjson_data.c.id)
+                )
+                .mappings()
+                .all(),
+                [row(i) for i in range(1000)],
+            )
+            eq_(
+                conn.scalar(
+                    select(func.count()).where(
+                        openjson_data.c.created.is_(None)
+                    )
+                ),
+                0,
+            )
+            eq_(
+                conn.scalars(
+                    select(openjson_data.c.id)
+                    .where(
+                        openjson_data.c.id.in_(
+                            openjson_values(range(0, 5000, 2), Integer)
+                        )
+                    )
+                    .order_by(openjson_data.c.id)
+                ).all(),
+                list(range(0, 1000, 2)),
+            )
+
+
 class VersionDetectionTest(fixtures.TestBase):
     @testing.fixture
     def mock_conn_scalar(self):
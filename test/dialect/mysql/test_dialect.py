@@ -1,21 +1,30 @@
 import datetime
+import decimal
+import os
+import re
 
 from sqlalchemy import bindparam
+from sqlalchemy import Boolean
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import func
 from sqlalchemy import Integer
+from sqlalchemy import LargeBinary
 from sqlalchemy import MetaData
 from sqlalchemy import select
+from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects.mysql import base as mysql_base
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
@@ -152,12 +161,17 @@ class BackendDialectTest(
                 [
                     "SHOW VARIABLES LIKE 'sql_mode'",
                     "SHOW VARIABLES LIKE 'lower_case_table_names'",
+                    "SHOW VARIABLES LIKE 'max_allowed_packet'",
                 ],
             )
         else:
             eq_(
                 fetches,
-                ["SELECT @@sql_mode", "SELECT @@lower_case_table_names"],
+                [
+                    "SELECT @@sql_mode",
+                    "SELECT @@lower_case_table_names",
+                    "SELECT @@max_allowed_packet",
+                ],
             )
 
     def test_autocommit_isolation_level(self):
@@ -627,3 +641,193 @@ class ExecutionTest(fixtures.TestBase):
     def test_sysdate(self, connection):
         d = connection.execute(func.sysdate()).scalar()
         assert isinstance(d, datetime.datetime)
+
+
+class LoadDataLocalInfileTest(fixtures.TestBase):
+    @testing.fixture
+    def load_data_table(self):
+        return Table(
+            "some_table",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            Column("flag", Boolean),
+            Column("created", DateTime, default=func.now()),
+            Column("counter", Integer, default=5),
+        )
+
+    def _compile(self, stmt, dialect, column_keys=("id", "data", "flag")):
+        return stmt.compile(
+            dialect=dialect,
+            column_keys=list(column_keys),
+            for_executemany=True,
+        )
+
+    @testing.combinations(
+        (None, b"\\N"),
+        ("plain", b"plain"),
+        ("tab\there\nnewline\\", b"tab\\there\\nnewline\\\\"),
+        ("r\xe9sum\xe9", "r\xe9sum\xe9".encode("utf-8")),
+        (b"\x00\x01\t\\", b"\\0\x01\\t\\\\"),
+        (True, b"1"),
+        (False, b"0"),
+        (12, b"12"),
+        (decimal.Decimal("1E+2"), b"100"),
+        (1.5, b"1.5"),
+        (datetime.datetime(2024, 5, 1, 12, 30, 5), b"2024-05-01 12:30:05"),
+        (datetime.date(2024, 5, 1), b"2024-05-01"),
+        (datetime.timedelta(hours=-26, seconds=5), b"-25:59:55.000000"),
+        argnames="value, expected",
+    )
+    def test_load_data_value(self, value, expected):
+        eq_(mysql_base._load_data_value(value), expected)
+
+    @testing.combinations(
+        "mysqldb", "pymysql", "mariadbconnector", argnames="driver_name"
+    )
+    def test_deliver_load_data(self, load_data_table, driver_name):
+        dialect = getattr(mysql, driver_name).dialect(
+            use_load_data_local_infile=True
+        )
+        compiled = self._compile(load_data_table.insert(), dialect)
+        context = mock.Mock(
+            compiled=compiled,
+            compiled_parameters=[
+                {"id": 1, "data": "d1\tx", "flag": True, "counter": 5},
+                {"id": 2, "data": None, "flag": False, "counter": 5},
+            ],
+        )
+
+        batches = dialect._deliver_insertmanyvalues_batches(
+            None, None, compiled.string, [], None, context
+        )
+        batch = next(batches)
+        path = re.match(
+            r"LOAD DATA LOCAL INFILE '(.+?)' ", batch.replaced_statement
+        ).group(1)
+
+        eq_(
+            batch.replaced_statement,
+            f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE some_table "
+            "CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' "
+            "ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' "
+            "(id, data, flag, counter) SET created = now()",
+        )
+        eq_(batch.replaced_parameters, ())
+        eq_(batch.current_batch_size, 2)
+        with open(path, "rb") as file_:
+            eq_(file_.read(), b"1\td1\\tx\t1\t5\n2\t\\N\t0\t5\n")
+
+        eq_(list(batches), [])
+        is_(os.path.exists(path), False)
+
+    def test_load_data_binary_not_eligible(self):
+        t = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("data", LargeBinary),
+        )
+        dialect = mysql.mysqldb.dialect(use_load_data_local_infile=True)
+        compiled = self._compile(t.insert(), dialect, ("id", "data"))
+
+        is_(dialect._load_data_local_infile_columns(compiled), None)
+
+    def test_load_data_not_eligible(self, load_data_table):
+        dialect = mysql.mysqldb.dialect(use_load_data_local_infile=True)
+        compiled = self._compile(
+            load_data_table.insert().prefix_with("IGNORE"), dialect
+        )
+
+        is_(dialect._load_data_local_infile_columns(compiled), None)
+
+    def test_load_data_option(self, load_data_table):
+        dialect = mysql.mysqldb.dialect()
+        compiled = self._compile(load_data_table.insert(), dialect)
+        is_(compiled._insertmanyvalues, None)
+
+        dialect = mysql.mysqldb.dialect(use_load_data_local_infile=True)
+        compiled = self._compile(load_data_table.insert(), dialect)
+        is_(compiled._insertmanyvalues is not None, True)
+
+    @testing.combinations("aiomysql", "asyncmy", argnames="driver_name")
+    def test_load_data_not_supported(self, driver_name):
+        with expect_raises_message(
+            exc.ArgumentError,
+            "use_load_data_local_infile is not supported by the "
+            f"{driver_name} driver",
+        ):
+            getattr(mysql, driver_name).dialect(
+                use_load_data_local_infile=True
+            )
+
+
+class LoadDataLocalInfileBackendTest(fixtures.TablesTest):
+    __only_on__ = (
+        "mysql+mysqldb",
+        "mysql+pymysql",
+        "mariadb+mysqldb",
+        "mariadb+pymysql",
+        "mariadb+mariadbconnector",
+    )
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "load_data",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("data", String(50)),
+            Column("created", DateTime, default=func.now()),
+        )
+
+    def test_load_data(self, testing_engine, connection):
+        if not connection.exec_driver_sql("SELECT @@local_infile").scalar():
+            config.skip_test("server doesn't allow LOAD DATA LOCAL")
+
+        engine = testing_engine(
+            options={
+                "use_load_data_local_infile": True,
+                "connect_args": {"local_infile": True},
+            }
+        )
+        load_data = self.tables.load_data
+
+        statements = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            statements.append(statement)
+
+        with engine.begin() as conn:
+            result = conn.execute(
+                load_data.insert(),
+                [
+                    {"id": i, "data": "data\t%d" % i if i % 5 else None}
+                    for i in range(1, 101)
+                ],
+            )
+            eq_(result.rowcount, 100)
+
+        eq_(len(statements), 1)
+        is_(statements[0].startswith("LOAD DATA LOCAL INFILE"), True)
+
+        with engine.connect() as conn:
+            eq_(
+                conn.execute(
+                    select(load_data.c.id, load_data.c.data).order_by(
+                        load_data.c.id
+                    )
+                ).all(),
+                [
+                    (i, "data\t%d" % i if i % 5 else None)
+                    for i in range(1, 101)
+                ],
+            )
+            eq_(
+                conn.scalar(
+                    select(func.count()).where(load_data.c.created.is_(None))
+                ),
+                0,
+            )
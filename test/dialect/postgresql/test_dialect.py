@@ -1,6 +1,7 @@
 import asyncio
 import dataclasses
 import datetime
+import decimal
 import logging
 import logging.handlers
 import re
@@ -18,6 +19,7 @@ from sqlalchemy import extract
 from sqlalchemy import func
 from sqlalchemy import Integer
 from sqlalchemy import literal
+from sqlalchemy import literal_column
 from sqlalchemy import MetaData
 from sqlalchemy import Numeric
 from sqlalchemy import schema
@@ -29,6 +31,7 @@ from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy import text
 from sqlalchemy import TypeDecorator
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import asyncpg as asyncpg_dialect
 from sqlalchemy.dialects.postgresql import base as postgresql
 from sqlalchemy.dialects.postgresql import HSTORE
@@ -41,6 +44,7 @@ from sqlalchemy.dialects.postgresql.psycopg2 import (
     EXECUTEMANY_VALUES_PLUS_BATCH,
 )
 from sqlalchemy.engine import url
+from sqlalchemy.engine.interfaces import CacheStats
 from sqlalchemy.sql.selectable import LABEL_STYLE_TABLENAME_PLUS_COL
 from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
@@ -58,6 +62,7 @@ from sqlalchemy.testing.assertions import eq_
 from sqlalchemy.testing.assertions import eq_regex
 from sqlalchemy.testing.assertions import expect_raises
 from sqlalchemy.testing.assertions import ne_
+from sqlalchemy.testing.util import gc_collect
 
 
 def _fk_expected(
@@ -178,6 +183,198 @@ class DialectTest(fixtures.TestBase):
         with expect_raises(dataclasses.FrozenInstanceError):
             r1.lower = 8  # type: ignore
 
+    @testing.combinations(
+        (CacheStats.CACHE_HIT, False, True),
+        (CacheStats.CACHE_MISS, False, True),
+        (CacheStats.CACHING_DISABLED, False, False),
+        (CacheStats.NO_CACHE_KEY, False, False),
+        (CacheStats.NO_DIALECT_SUPPORT, False, False),
+        (CacheStats.CACHE_HIT, True, None),
+        argnames="cache_hit, server_side, prepare",
+    )
+    @testing.variation("prepare_cached_statements", [True, False])
+    def test_psycopg_prepare_cached_statements(
+        self, cache_hit, server_side, prepare, prepare_cached_statements
+    ):
+        dialect = psycopg_dialect.PGDialect_psycopg(
+            prepare_cached_statements=bool(prepare_cached_statements)
+        )
+        cursor = mock.Mock()
+        context = mock.Mock(cache_hit=cache_hit, _is_server_side=server_side)
+
+        dialect.do_execute(cursor, "some statement", {"x": 5}, context)
+
+        if prepare_cached_statements and prepare is not None:
+            eq_(
+                cursor.mock_calls,
+                [
+                    mock.call.execute(
+                        "some statement", {"x": 5}, prepare=prepare
+                    )
+                ],
+            )
+        else:
+            eq_(
+                cursor.mock_calls,
+                [mock.call.execute("some statement", {"x": 5})],
+            )
+
+    @testing.variation("set_cache_size", [True, False])
+    def test_psycopg_prepared_statement_cache_size(self, set_cache_size):
+        dialect = psycopg_dialect.PGDialect_psycopg(
+            prepared_statement_cache_size=250 if set_cache_size else None
+        )
+        conn = mock.Mock(prepared_max=100)
+
+        dialect.on_connect()(conn)
+
+        eq_(conn.prepared_max, 250 if set_cache_size else 100)
+
+    @testing.combinations(
+        ((Integer, Numeric(10, 2), DateTime, String), True),
+        ((Integer, postgresql.UUID, postgresql.INTERVAL), True),
+        ((Integer, JSONB), False),
+        ((Integer, HSTORE), False),
+        ((String, postgresql.CITEXT), False),
+        ((Integer, postgresql.ENUM("a", "b", name="e")), False),
+        ((Integer, ARRAY(Integer)), False),
+        ((String, postgresql.INET), False),
+        ((String, postgresql.MONEY), False),
+        ((String, postgresql.TSVECTOR), False),
+        argnames="types, binary",
+    )
+    @testing.variation("binary_results", [True, False])
+    def test_psycopg_binary_results(self, types, binary, binary_results):
+        dialect = psycopg_dialect.PGDialect_psycopg(
+            binary_results=bool(binary_results)
+        )
+        stmt = select(
+            *[
+                literal_column("x%d" % i, type_)
+                for i, type_ in enumerate(types)
+            ]
+        )
+        compiled = stmt.compile(dialect=dialect)
+        cursor = mock.Mock()
+        context = mock.Mock(compiled=compiled, _is_server_side=False)
+
+        dialect.do_execute(cursor, "some statement", {"x": 5}, context)
+        dialect.do_execute(cursor, "some statement", {"x": 5}, context)
+
+        if binary_results and binary:
+            expected = mock.call.execute(
+                "some statement", {"x": 5}, binary=True
+            )
+        else:
+            expected = mock.call.execute("some statement", {"x": 5})
+        eq_(cursor.mock_calls, [expected, expected])
+
+    def test_psycopg_binary_results_no_result_columns(self):
+        dialect = psycopg_dialect.PGDialect_psycopg(binary_results=True)
+        cursor = mock.Mock()
+        context = mock.Mock(compiled=None, _is_server_side=False)
+
+        dialect.do_execute(cursor, "some statement", {"x": 5}, context)
+
+        eq_(
+            cursor.mock_calls,
+            [mock.call.execute("some statement", {"x": 5})],
+        )
+
+    def _asyncpg_adapt_connection(self, **kw):
+        prepared = []
+
+        async def prepare(operation, name=None):
+            stmt = mock.Mock(operation=operation)
+            prepared.append(stmt)
+            return stmt
+
+        adapt_connection = asyncpg_dialect.AsyncAdapt_asyncpg_connection(
+            mock.Mock(), mock.Mock(prepare=prepare), **kw
+        )
+        return adapt_connection, prepared
+
+    def test_asyncpg_prepared_statement_cache_by_compiled(self):
+        dialect = asyncpg_dialect.PGDialect_asyncpg()
+        adapt_connection, prepared = self._asyncpg_adapt_connection(
+            prepared_statement_cache_size=1
+        )
+
+        c1 = select(literal(5, Integer)).compile(dialect=dialect)
+        c2 = select(literal("x", String)).compile(dialect=dialect)
+
+        def go(operation, compiled=None):
+            stmt, _ = asyncio.run(
+                adapt_connection._prepare(operation, 0, compiled)
+            )
+            return stmt
+
+        # compiled statements stay prepared regardless of the size of
+        # the string keyed cache
+        s1 = go(c1.string, c1)
+        s2 = go(c2.string, c2)
+        go("select 1")
+        go("select 2")
+        is_(go(c1.string, c1), s1)
+        is_(go(c2.string, c2), s2)
+
+        # a statement string that's not the compiled string uses the
+        # string keyed cache
+        go("select 3", c1)
+        eq_(
+            [stmt.operation for stmt in prepared],
+            [c1.string, c2.string, "select 1", "select 2", "select 3"],
+        )
+        eq_(adapt_connection.prepared_statement_cache_hits, 2)
+        eq_(adapt_connection.prepared_statement_cache_misses, 5)
+
+        # discarding the compiled object releases its prepared statement
+        del c1
+        gc_collect()
+        eq_(len(adapt_connection._compiled_prepared_statement_cache), 1)
+
+    def test_asyncpg_prepared_statement_cache_disabled(self):
+        dialect = asyncpg_dialect.PGDialect_asyncpg()
+        adapt_connection, prepared = self._asyncpg_adapt_connection(
+            prepared_statement_cache_size=0
+        )
+        c1 = select(literal(5, Integer)).compile(dialect=dialect)
+
+        for i in range(2):
+            asyncio.run(adapt_connection._prepare(c1.string, 0, c1))
+
+        eq_(len(prepared), 2)
+        eq_(adapt_connection.prepared_statement_cache_hits, 0)
+        eq_(adapt_connection.prepared_statement_cache_misses, 0)
+
+    @testing.combinations(
+        (CacheStats.CACHE_HIT, True),
+        (CacheStats.CACHE_MISS, True),
+        (CacheStats.CACHING_DISABLED, False),
+        (CacheStats.NO_CACHE_KEY, False),
+        argnames="cache_hit, keyed",
+    )
+    @testing.variation("by_compiled", [True, False])
+    def test_asyncpg_prepared_statement_key(
+        self, cache_hit, keyed, by_compiled
+    ):
+        dialect = asyncpg_dialect.PGDialect_asyncpg(
+            prepared_statement_cache_by_compiled=bool(by_compiled)
+        )
+        context = asyncpg_dialect.PGExecutionContext_asyncpg()
+        context.dialect = dialect
+        context.isddl = False
+        context.compiled = compiled = mock.Mock()
+        context.cache_hit = cache_hit
+        context.cursor = mock.Mock()
+
+        context.pre_exec()
+
+        if by_compiled and keyed:
+            is_(context.cursor._prepared_statement_key, compiled)
+        else:
+            is_(context.cursor._prepared_statement_key, None)
+
     @testing.only_on("postgresql+asyncpg")
     def test_asyncpg_terminate_catch(self):
         """test for #11005"""
@@ -1708,6 +1905,51 @@ class Psycopg3Test(fixtures.TestBase):
                     with engine.begin() as conn:
                         eq_(conn.scalar(s), {"key": "value", "x": "q"})
 
+    def test_prepare_cached_statements(self, testing_engine):
+        engine = testing_engine(options={"prepare_cached_statements": True})
+
+        def prepared_count(conn):
+            return conn.exec_driver_sql(
+                "select count(*) from pg_prepared_statements"
+            ).scalar()
+
+        with engine.connect() as conn:
+            start = prepared_count(conn)
+
+            stmt = select(literal(5, Integer) + 10)
+            eq_(conn.scalar(stmt), 15)
+            eq_(conn.scalar(stmt), 15)
+
+            # the cached statement is prepared, the ad hoc statements
+            # that count prepared statements are not
+            eq_(prepared_count(conn), start + 1)
+
+            for i in range(10):
+                conn.exec_driver_sql("select %d" % i).all()
+            eq_(prepared_count(conn), start + 1)
+
+    def test_binary_results(self, testing_engine):
+        engine = testing_engine(options={"binary_results": True})
+
+        stmt = select(
+            literal(5, Integer),
+            literal(decimal.Decimal("10.25"), Numeric(10, 2)),
+            literal(datetime.datetime(2024, 5, 10, 12, 15), DateTime),
+            literal("some string", String),
+        )
+        with engine.connect() as conn:
+            eq_(
+                conn.execute(stmt).all(),
+                [
+                    (
+                        5,
+                        decimal.Decimal("10.25"),
+                        datetime.datetime(2024, 5, 10, 12, 15),
+                        "some string",
+                    )
+                ],
+            )
+
     def test_get_dialect(self):
         u = url.URL.create("postgresql://")
         d = psycopg_dialect.PGDialect_psycopg.get_dialect_cls(u)
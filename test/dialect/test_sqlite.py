@@ -3,6 +3,9 @@
 import datetime
 import json
 import os
+import sqlite3
+import threading
+import time
 
 from sqlalchemy import and_
 from sqlalchemy import bindparam
@@ -45,11 +48,13 @@ from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import AssertsExecutionResults
+from sqlalchemy.testing import async_test
 from sqlalchemy.testing import combinations
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import eq_ignore_whitespace
 from sqlalchemy.testing import expect_raises
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
@@ -61,6 +66,7 @@ from sqlalchemy.types import DateTime
 from sqlalchemy.types import Integer
 from sqlalchemy.types import String
 from sqlalchemy.types import Time
+from sqlalchemy.util import greenlet_spawn
 
 
 def exec_sql(engine, sql, *args, **kwargs):
@@ -786,6 +792,247 @@ class DialectTest(
         )
 
 
+class SerializeWritesTest(fixtures.TestBase):
+    __only_on__ = "sqlite+pysqlite"
+    __backend__ = True
+
+    @testing.fixture
+    def serialized_engine(self):
+        db_file = "serialize_writes.db"
+        engine = create_engine(
+            "sqlite:///%s" % db_file,
+            serialize_writes=True,
+            connect_args={"timeout": 0},
+        )
+
+        @event.listens_for(engine, "connect")
+        def set_wal(dbapi_connection, connection_record):
+            dbapi_connection.execute("PRAGMA journal_mode=WAL")
+
+        metadata = MetaData()
+        Table("t", metadata, Column("x", Integer))
+        metadata.create_all(engine)
+
+        yield engine
+
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_file + suffix):
+                os.remove(db_file + suffix)
+
+    @testing.variation("end", ["commit", "rollback", "close"])
+    def test_lock_held_for_transaction(self, serialized_engine, end):
+        t = table("t", column("x"))
+        lock = serialized_engine.dialect._write_lock
+
+        conn = serialized_engine.connect()
+        conn.execute(select(t)).all()
+        is_(lock.locked(), False)
+
+        conn.execute(t.insert(), {"x": 1})
+        is_(lock.locked(), True)
+        conn.execute(t.update().values(x=2))
+        is_(lock.locked(), True)
+
+        # readers don't wait for the writer
+        with serialized_engine.connect() as reader:
+            eq_(reader.execute(select(t)).all(), [])
+
+        if end.commit:
+            conn.commit()
+        elif end.rollback:
+            conn.rollback()
+        is_(lock.locked(), bool(end.close))
+        conn.close()
+        is_(lock.locked(), False)
+
+    def test_autocommit_releases(self, serialized_engine):
+        t = table("t", column("x"))
+        lock = serialized_engine.dialect._write_lock
+
+        with serialized_engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            conn.execute(t.insert(), [{"x": 1}, {"x": 2}])
+            is_(lock.locked(), False)
+
+    def test_same_thread_second_writer(self, serialized_engine):
+        t = table("t", column("x"))
+
+        with serialized_engine.begin() as c1:
+            c1.execute(t.insert(), {"x": 1})
+
+            with serialized_engine.connect() as c2:
+                eq_(c2.scalar(select(func.count()).select_from(t)), 0)
+                with expect_raises_message(
+                    exc.InvalidRequestError,
+                    "Can't write on this connection while another",
+                ):
+                    c2.execute(t.insert(), {"x": 2})
+
+    def test_concurrent_writers(self, serialized_engine):
+        t = table("t", column("x"))
+        errors = []
+
+        def write(x):
+            try:
+                with serialized_engine.begin() as conn:
+                    conn.execute(t.insert(), {"x": x})
+                    time.sleep(0.01)
+                    conn.execute(t.update().where(t.c.x == x), {"x": -x})
+            except Exception as err:
+                errors.append(err)
+
+        threads = [
+            threading.Thread(target=write, args=(i,)) for i in range(1, 6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        eq_(errors, [])
+        with serialized_engine.connect() as conn:
+            eq_(
+                sorted(conn.scalars(select(t.c.x))),
+                [-5, -4, -3, -2, -1],
+            )
+
+    def test_not_on_async(self):
+        from sqlalchemy.dialects.sqlite import aiosqlite
+
+        with expect_raises_message(
+            exc.ArgumentError,
+            "serialize_writes is not supported by the aiosqlite driver",
+        ):
+            aiosqlite.dialect(serialize_writes=True)
+
+
+class AiosqliteCursorTest(fixtures.TestBase):
+    """test the aiosqlite cursor against a stand-in for the aiosqlite
+    connection, which runs each job of its worker queue immediately."""
+
+    __requires__ = ("greenlet",)
+
+    @testing.fixture
+    def aiosqlite_connection(self):
+        class WorkerQueue:
+            def __init__(self):
+                self.jobs = []
+
+            def put_nowait(self, job):
+                future, fn = job
+                self.jobs.append(fn)
+                try:
+                    future.set_result(fn())
+                except Exception as err:
+                    future.set_exception(err)
+
+        sqlite_conn = sqlite3.connect(":memory:")
+        sqlite_conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, x)")
+
+        connection = mock.Mock(
+            _conn=sqlite_conn, _connection=sqlite_conn, _tx=WorkerQueue()
+        )
+        yield connection
+        sqlite_conn.close()
+
+    @testing.fixture
+    def adapt_connection(self, aiosqlite_connection):
+        from sqlalchemy.dialects.sqlite import aiosqlite
+
+        dbapi = aiosqlite.AsyncAdapt_aiosqlite_dbapi(mock.Mock(), sqlite3)
+        return aiosqlite.AsyncAdapt_aiosqlite_connection(
+            dbapi, aiosqlite_connection
+        )
+
+    @async_test
+    async def test_execute_fetch_single_job(
+        self, adapt_connection, aiosqlite_connection
+    ):
+        def go():
+            cursor = adapt_connection.cursor()
+            cursor.execute("INSERT INTO t (x) VALUES (?)", (5,))
+            cursor.execute("INSERT INTO t (x) VALUES (?)", (6,))
+            cursor.execute("SELECT id, x FROM t ORDER BY id")
+            return cursor.fetchone(), cursor.fetchall()
+
+        eq_(await greenlet_spawn(go), ((1, 5), [(2, 6)]))
+        eq_(len(aiosqlite_connection._tx.jobs), 3)
+
+    @async_test
+    async def test_executemany_single_job(
+        self, adapt_connection, aiosqlite_connection
+    ):
+        def go():
+            cursor = adapt_connection.cursor()
+            cursor.executemany(
+                "INSERT INTO t (x) VALUES (?)", [(5,), (6,), (7,)]
+            )
+            rowcount = cursor.rowcount
+            cursor.execute("SELECT x FROM t ORDER BY id")
+            return rowcount, cursor.fetchall()
+
+        eq_(await greenlet_spawn(go), (3, [(5,), (6,), (7,)]))
+        eq_(len(aiosqlite_connection._tx.jobs), 2)
+
+    @async_test
+    async def test_cursor_attributes(self, adapt_connection):
+        def go():
+            cursor = adapt_connection.cursor()
+            before = (
+                cursor.description,
+                cursor.rowcount,
+                cursor.lastrowid,
+                cursor.arraysize,
+            )
+
+            cursor.execute("INSERT INTO t (x) VALUES (?)", (5,))
+            after_insert = (
+                cursor.description,
+                cursor.rowcount,
+                cursor.lastrowid,
+            )
+
+            cursor.arraysize = 2
+            cursor.execute("SELECT x FROM t")
+            after_select = ([d[0] for d in cursor.description],)
+            return before, after_insert, after_select, cursor.arraysize
+
+        eq_(
+            await greenlet_spawn(go),
+            ((None, -1, None, 1), (None, 1, 1), (["x"],), 2),
+        )
+
+    @async_test
+    async def test_arraysize_fetchmany(self, adapt_connection):
+        def go():
+            cursor = adapt_connection.cursor()
+            cursor.arraysize = 2
+            cursor.executemany(
+                "INSERT INTO t (x) VALUES (?)", [(5,), (6,), (7,)]
+            )
+            cursor.execute("SELECT x FROM t ORDER BY id")
+            return cursor.fetchmany(), cursor.fetchmany()
+
+        eq_(await greenlet_spawn(go), ([(5,), (6,)], [(7,)]))
+
+    @async_test
+    async def test_closed_connection(
+        self, adapt_connection, aiosqlite_connection
+    ):
+        aiosqlite_connection._connection = None
+
+        def go():
+            adapt_connection.cursor().execute("SELECT 1")
+
+        with expect_raises_message(
+            sqlite3.OperationalError, "Connection closed"
+        ):
+            await greenlet_spawn(go)
+        eq_(aiosqlite_connection._tx.jobs, [])
+
+
 class AttachedDBTest(fixtures.TablesTest):
     __only_on__ = "sqlite"
     __backend__ = True
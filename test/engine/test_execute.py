@@ -1055,6 +1055,206 @@ class ConvenienceExecuteTest(fixtures.TablesTest):
         self._assert_fn(5, value=8)
 
 
+class BulkLoadTest(fixtures.RemovesEvents, fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "bulk_load",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("data", String(50)),
+        )
+
+    def _rows(self, num):
+        return ({"id": i, "data": "d%d" % i} for i in range(1, num + 1))
+
+    def _assert_rows(self, num):
+        t = self.tables.bulk_load
+        with testing.db.connect() as conn:
+            eq_(
+                conn.execute(select(t).order_by(t.c.id)).all(),
+                [(i, "d%d" % i) for i in range(1, num + 1)],
+            )
+
+    def test_single_worker(self):
+        t = self.tables.bulk_load
+
+        canary = Mock()
+        self.event_listen(testing.db, "commit", canary.commit)
+
+        eq_(testing.db.bulk_load(t, self._rows(250), page_size=100), 250)
+
+        # one transaction per page
+        eq_(canary.commit.call_count, 3)
+        self._assert_rows(250)
+
+    @testing.requires.independent_connections
+    def test_empty(self):
+        t = self.tables.bulk_load
+
+        eq_(testing.db.bulk_load(t, [], workers=3), 0)
+        self._assert_rows(0)
+
+    def test_invalid_workers(self):
+        t = self.tables.bulk_load
+
+        with expect_raises_message(
+            tsa.exc.ArgumentError, "workers must be at least 1"
+        ):
+            testing.db.bulk_load(t, self._rows(10), workers=0)
+
+    def test_execute_stream(self, connection):
+        t = self.tables.bulk_load
+
+        consumed = []
+
+        def rows():
+            for row in self._rows(250):
+                consumed.append(row)
+                yield row
+
+        executed = []
+
+        @event.listens_for(connection, "before_execute")
+        def before_execute(
+            conn, clauseelement, multiparams, params, execution_options
+        ):
+            executed.append((len(multiparams), len(consumed)))
+
+        eq_(connection.execute_stream(t.insert(), rows(), page_size=100), 250)
+
+        # each page is executed before the next one is read
+        eq_(executed, [(100, 100), (100, 200), (50, 250)])
+
+        eq_(
+            connection.execute(select(t).order_by(t.c.id)).all(),
+            [(i, "d%d" % i) for i in range(1, 251)],
+        )
+
+    def test_execute_stream_update(self, connection):
+        t = self.tables.bulk_load
+
+        connection.execute(t.insert(), list(self._rows(10)))
+
+        eq_(
+            connection.execute_stream(
+                t.update()
+                .where(t.c.id == bindparam("b_id"))
+                .values(data=bindparam("b_data")),
+                ({"b_id": i, "b_data": "u%d" % i} for i in range(1, 11)),
+                page_size=3,
+            ),
+            10,
+        )
+        eq_(
+            connection.execute(select(t.c.data).order_by(t.c.id)).all(),
+            [("u%d" % i,) for i in range(1, 11)],
+        )
+
+    @testing.combinations(
+        (lambda t: select(t),),
+        (lambda t: t.insert().returning(t.c.id),),
+        argnames="stmt",
+    )
+    def test_execute_stream_invalid(self, connection, stmt):
+        t = self.tables.bulk_load
+
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "execute_stream\\(\\) accepts only INSERT, UPDATE or DELETE",
+        ):
+            connection.execute_stream(testing.resolve_lambda(stmt, t=t), [])
+
+    @testing.requires.independent_connections
+    def test_multiple_workers(self):
+        t = self.tables.bulk_load
+
+        eq_(
+            testing.db.bulk_load(
+                t, self._rows(1050), workers=3, page_size=100
+            ),
+            1050,
+        )
+        self._assert_rows(1050)
+
+    def _mock_connection_fixture(self, execute):
+        connections = []
+
+        def connection_cls(engine):
+            conn = mock.MagicMock()
+            conn.__enter__.return_value = conn
+            conn.execute.side_effect = execute
+            connections.append(conn)
+            return conn
+
+        engine = engines.testing_engine()
+        return engine, connections, connection_cls
+
+    def test_multiple_workers_mock(self):
+        t = self.tables.bulk_load
+
+        pages = []
+        mutex = threading.Lock()
+
+        def execute(stmt, page):
+            with mutex:
+                pages.append(page)
+
+        engine, connections, connection_cls = self._mock_connection_fixture(
+            execute
+        )
+
+        with mock.patch.object(engine, "_connection_cls", connection_cls):
+            eq_(
+                engine.bulk_load(
+                    t, self._rows(1050), workers=3, page_size=100
+                ),
+                1050,
+            )
+
+        # each worker uses its own connection
+        eq_(len(connections), 3)
+
+        eq_(
+            sorted(len(page) for page in pages),
+            [50] + [100] * 10,
+        )
+        eq_(
+            sorted(row["id"] for page in pages for row in page),
+            list(range(1, 1051)),
+        )
+
+        # each page is committed in its own transaction
+        eq_(sum(conn.begin.call_count for conn in connections), len(pages))
+
+    def test_multiple_workers_error(self):
+        t = self.tables.bulk_load
+
+        def execute(stmt, page):
+            if page[0]["id"] == 1:
+                raise SomeException("breakage")
+
+        engine, connections, connection_cls = self._mock_connection_fixture(
+            execute
+        )
+
+        consumed = []
+
+        def rows():
+            for row in self._rows(100000):
+                consumed.append(row)
+                yield row
+
+        with mock.patch.object(engine, "_connection_cls", connection_cls):
+            with expect_raises_message(SomeException, "breakage"):
+                engine.bulk_load(t, rows(), workers=3, page_size=100)
+
+        # no further pages are started once a page has failed
+        is_true(len(consumed) < 100000)
+
+
 class CompiledCacheTest(fixtures.TestBase):
     __backend__ = True
 
@@ -1,8 +1,10 @@
 import datetime
+import decimal
 import re
 from types import MappingProxyType
 
 from sqlalchemy import exc
+from sqlalchemy import testing
 from sqlalchemy.engine import processors
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import combinations
@@ -140,6 +142,57 @@ class CyDateProcessorTest(_DateProcessorTest):
         cls.module = _processors_cy
 
 
+class ColumnProcessorTest(fixtures.TestBase):
+    @combinations(
+        (processors.int_to_boolean, (0, 1, 12, None), (False, True, True)),
+        (processors.to_str, (5, "x", None), ("5", "x")),
+        (processors.to_float, (5, "2.5", None), (5.0, 2.5)),
+        (
+            processors.str_to_datetime,
+            ("2022-04-03 17:12:34.353", None),
+            (datetime.datetime(2022, 4, 3, 17, 12, 34, 353000),),
+        ),
+        (
+            processors.str_to_time,
+            ("17:12:34", None),
+            (datetime.time(17, 12, 34),),
+        ),
+        (
+            processors.str_to_date,
+            ("2022-04-03", None),
+            (datetime.date(2022, 4, 3),),
+        ),
+        (
+            processors.to_decimal_processor_factory(decimal.Decimal, 2),
+            (1.5, 2, None),
+            (decimal.Decimal("1.50"), decimal.Decimal("2.00")),
+        ),
+        (str.upper, ("a", "b"), ("A", "B")),
+        argnames="processor, values, expected",
+    )
+    @testing.variation("with_none", [True, False])
+    def test_column_processor(self, processor, values, expected, with_none):
+        if not with_none:
+            values = tuple(value for value in values if value is not None)
+
+        process = processors.to_column_processor(processor)
+        result = list(process(values))
+
+        eq_(result, [processor(value) for value in values])
+        if with_none:
+            eq_(result, list(expected) + [None] * values.count(None))
+        else:
+            eq_(result, list(expected))
+
+    def test_column_processor_raises(self):
+        process = processors.to_column_processor(processors.str_to_datetime)
+
+        with expect_raises_message(
+            ValueError, "Invalid isoformat string: '5:a'"
+        ):
+            list(process(("2022-04-03", "5:a")))
+
+
 class _DistillArgsTest(fixtures.TestBase):
     def test_distill_20_none(self):
         eq_(self.module._distill_params_20(None), ())
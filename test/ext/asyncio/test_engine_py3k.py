@@ -686,6 +686,26 @@ class AsyncEngineTest(EngineFixture):
         async with async_engine.connect() as conn:
             eq_(await conn.scalar(select(func.count(users.c.user_id))), 0)
 
+    @async_test
+    async def test_execute_stream(self, async_engine):
+        users = self.tables.users
+
+        async with async_engine.begin() as conn:
+            eq_(
+                await conn.execute_stream(
+                    users.insert(),
+                    (
+                        {"user_id": i, "user_name": "name%d" % i}
+                        for i in range(20, 45)
+                    ),
+                    page_size=10,
+                ),
+                25,
+            )
+
+        async with async_engine.connect() as conn:
+            eq_(await conn.scalar(select(func.count(users.c.user_id))), 44)
+
     @async_test
     async def test_savepoint_rollback_noctx(self, async_engine):
         users = self.tables.users
@@ -13,6 +13,7 @@ from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import select
 from sqlalchemy import Sequence
+from sqlalchemy import StaticPool
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
@@ -31,10 +32,12 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.unitofwork import UOWTransaction
 from sqlalchemy.testing import async_test
 from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
@@ -845,6 +848,111 @@ class AsyncORMBehaviorsTest(AsyncFixture):
             )
 
 
+class AsyncParallelFlushTest(_AsyncFixture, fixtures.MappedTest):
+    __only_on__ = "sqlite+aiosqlite"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "t1",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(30)),
+        )
+        Table(
+            "t2",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(30)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class A(cls.Basic):
+            pass
+
+        class B(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        cls.mapper_registry.map_imperatively(cls.classes.A, cls.tables.t1)
+        cls.mapper_registry.map_imperatively(cls.classes.B, cls.tables.t2)
+
+    @testing.fixture
+    def two_async_engines(self):
+        engs = []
+        for tname in ("t1", "t2"):
+            eng = engines.testing_engine(
+                url="sqlite+aiosqlite://",
+                options={"poolclass": StaticPool},
+                asyncio=True,
+            )
+            self.tables[tname].create(eng.sync_engine)
+            engs.append(eng)
+        return engs
+
+    @async_test
+    async def test_flush(self, two_async_engines):
+        A, B = self.classes("A", "B")
+        e1, e2 = two_async_engines
+
+        statements = []
+        for eng in (e1, e2):
+
+            @event.listens_for(eng.sync_engine, "before_cursor_execute")
+            def go(conn, cursor, statement, parameters, context, executemany):
+                statements.append((conn.engine, statement))
+
+        with mock.patch.object(
+            UOWTransaction,
+            "_run_concurrently",
+            autospec=True,
+            side_effect=UOWTransaction._run_concurrently,
+        ) as run_concurrently:
+            async with AsyncSession(
+                binds={A: e1, B: e2}, parallel_flush=True
+            ) as session:
+                session.add_all([A(id=1, data="a1"), B(id=1, data="b1")])
+                await session.commit()
+
+        is_true(run_concurrently.called)
+        eq_(
+            sorted(
+                (engine is e1.sync_engine, statement.split(" ")[2])
+                for engine, statement in statements
+            ),
+            [(False, "t2"), (True, "t1")],
+        )
+
+        async with e1.connect() as conn:
+            eq_(
+                (await conn.execute(select(self.tables.t1))).all(), [(1, "a1")]
+            )
+        async with e2.connect() as conn:
+            eq_(
+                (await conn.execute(select(self.tables.t2))).all(), [(1, "b1")]
+            )
+
+    @async_test
+    async def test_error_propagates(self, two_async_engines):
+        A, B = self.classes("A", "B")
+        e1, e2 = two_async_engines
+
+        async with AsyncSession(
+            binds={A: e1, B: e2}, parallel_flush=True
+        ) as session:
+            session.add_all([A(id=1, data="a1"), B(id=1, data="b1")])
+            await session.commit()
+
+            session.add_all([A(id=2, data="a2"), B(id=1, data="b1")])
+            with expect_raises(exc.IntegrityError):
+                await session.flush()
+
+            await session.rollback()
+            eq_((await session.scalars(select(A.id))).all(), [1])
+
+
 class AsyncEventTest(AsyncFixture):
     """The engine events all run in their normal synchronous context.
 
@@ -20,6 +20,7 @@ from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
+from sqlalchemy.testing import mock
 from sqlalchemy.testing import not_in
 from sqlalchemy.testing.assertions import assert_warns
 from sqlalchemy.testing.entities import BasicEntity
@@ -3466,6 +3467,54 @@ class ListenerTest(fixtures.ORMTest):
         f1.barset.add(b1)
         assert f1.barset.pop().data == "some bar appended"
 
+    def test_listener_added_after_simple_set(self):
+        """test that an attribute which was set without listeners
+        present begins to use them once they're established."""
+
+        canary = Mock()
+
+        class Foo:
+            pass
+
+        instrumentation.register_class(Foo)
+        _register_attribute(Foo, "data", uselist=False, useobject=False)
+
+        f1 = Foo()
+        f1.data = "d1"
+        eq_(
+            Foo.data.impl._simple_set_generation,
+            attributes._simple_set_generation,
+        )
+        f1.data = "d2"
+        eq_(
+            attributes.instance_state(f1).committed_state,
+            {"data": attributes.NO_VALUE},
+        )
+
+        event.listen(Foo.data, "set", canary.set)
+        f1.data = "d3"
+        eq_(
+            canary.mock_calls,
+            [call.set(f1, "d3", "d2", Foo.data.impl._replace_token)],
+        )
+
+    def test_active_history_set_after_simple_set(self):
+        class Foo:
+            pass
+
+        instrumentation.register_class(Foo)
+        _register_attribute(Foo, "data", uselist=False, useobject=False)
+
+        f1 = Foo()
+        f1.data = "d1"
+
+        Foo.data.impl.active_history = True
+        with mock.patch.object(
+            attributes.ScalarAttributeImpl, "get", return_value="d1"
+        ) as get:
+            f1.data = "d2"
+        eq_(len(get.mock_calls), 1)
+
     def test_named(self):
         canary = Mock()
 
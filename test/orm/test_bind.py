@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import Mock
 
 import sqlalchemy as sa
@@ -23,9 +24,11 @@ from sqlalchemy.orm.query import Query
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import mock
+from sqlalchemy.testing import ne_
 from sqlalchemy.testing.fixtures import fixture_session
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
@@ -649,6 +652,118 @@ class SessionBindTest(fixtures.MappedTest):
         )
 
 
+class ParallelFlushTest(fixtures.RemovesEvents, fixtures.MappedTest):
+    __only_on__ = "sqlite+pysqlite"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "t1",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(30)),
+        )
+        Table(
+            "t2",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(30)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class A(cls.Basic):
+            pass
+
+        class B(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        cls.mapper_registry.map_imperatively(cls.classes.A, cls.tables.t1)
+        cls.mapper_registry.map_imperatively(cls.classes.B, cls.tables.t2)
+
+    @testing.fixture
+    def two_engines(self, metadata):
+        engs = []
+        for tname in ("t1", "t2"):
+            eng = engines.testing_engine(
+                url="sqlite://",
+                options={
+                    "poolclass": sa.pool.StaticPool,
+                    "connect_args": {"check_same_thread": False},
+                },
+            )
+            self.tables[tname].create(eng)
+            engs.append(eng)
+        return engs
+
+    def _thread_ids(self, engine):
+        idents = []
+
+        def go(conn, cursor, statement, parameters, context, executemany):
+            idents.append(threading.get_ident())
+
+        self.event_listen(engine, "before_cursor_execute", go)
+        return idents
+
+    @testing.variation("parallel", [True, False])
+    def test_flush(self, two_engines, parallel):
+        A, B = self.classes("A", "B")
+        e1, e2 = two_engines
+
+        e1_idents = self._thread_ids(e1)
+        e2_idents = self._thread_ids(e2)
+
+        sess = Session(binds={A: e1, B: e2}, parallel_flush=bool(parallel))
+        sess.add_all([A(id=1, data="a1"), B(id=1, data="b1")])
+        sess.flush()
+
+        eq_(len(e1_idents), 1)
+        eq_(len(e2_idents), 1)
+        if parallel:
+            ne_(e1_idents[0], threading.get_ident())
+            ne_(e2_idents[0], threading.get_ident())
+            ne_(e1_idents[0], e2_idents[0])
+        else:
+            eq_(e1_idents + e2_idents, [threading.get_ident()] * 2)
+
+        sess.commit()
+
+        with e1.connect() as conn:
+            eq_(conn.execute(select(self.tables.t1)).all(), [(1, "a1")])
+        with e2.connect() as conn:
+            eq_(conn.execute(select(self.tables.t2)).all(), [(1, "b1")])
+
+    def test_single_connection_not_parallel(self):
+        A, B = self.classes("A", "B")
+
+        idents = self._thread_ids(testing.db)
+
+        sess = Session(testing.db, parallel_flush=True)
+        sess.add_all([A(id=1, data="a1"), B(id=1, data="b1")])
+        sess.flush()
+
+        eq_(idents, [threading.get_ident()] * 2)
+        sess.close()
+
+    def test_error_propagates(self, two_engines):
+        A, B = self.classes("A", "B")
+        e1, e2 = two_engines
+
+        sess = Session(binds={A: e1, B: e2}, parallel_flush=True)
+        sess.add_all([A(id=1, data="a1"), B(id=1, data="b1")])
+        sess.commit()
+
+        sess.add_all([A(id=2, data="a2"), B(id=1, data="b1")])
+        with expect_raises(sa.exc.IntegrityError):
+            sess.flush()
+
+        sess.rollback()
+        eq_(sess.scalars(select(A.id).order_by(A.id)).all(), [1])
+        sess.close()
+
+
 class GetBindTest(fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
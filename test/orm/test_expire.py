@@ -10,6 +10,7 @@ from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import testing
+from sqlalchemy import util
 from sqlalchemy.orm import attributes
 from sqlalchemy.orm import contains_eager
 from sqlalchemy.orm import defer
@@ -30,6 +31,7 @@ from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_not
 from sqlalchemy.testing.assertions import expect_raises_message
 from sqlalchemy.testing.assertsql import CountStatements
 from sqlalchemy.testing.fixtures import fixture_session
@@ -91,6 +93,49 @@ class ExpireTest(_fixtures.FixtureTest):
 
         self.assert_sql_count(testing.db, go, 0)
 
+    def test_expired_attributes_allocated_on_demand(self):
+        users, User = self.tables.users, self.classes.User
+
+        self.mapper_registry.map_imperatively(User, users)
+
+        sess = fixture_session()
+        u = sess.get(User, 7)
+        state = attributes.instance_state(u)
+
+        # no per-state collection for an object that was never expired
+        assert "_expired_attributes" not in state.__dict__
+        eq_(state._expired_attributes, set())
+
+        sess.expire(u)
+        assert "_expired_attributes" in state.__dict__
+        eq_(state.expired_attributes, {"id", "name"})
+
+        # refreshing all attributes releases the collection
+        eq_(u.name, "jack")
+        assert "_expired_attributes" not in state.__dict__
+
+        sess.expire(u, ["name"])
+        eq_(state.expired_attributes, {"name"})
+        sess.refresh(u)
+        assert "_expired_attributes" not in state.__dict__
+
+    def test_expired_attributes_mutate_in_place(self):
+        users, User = self.tables.users, self.classes.User
+
+        self.mapper_registry.map_imperatively(User, users)
+
+        sess = fixture_session()
+        u1, u2 = sess.get(User, 7), sess.get(User, 8)
+        s1, s2 = attributes.instance_state(u1), attributes.instance_state(u2)
+
+        # the public collection is allocated per-state on access and
+        # may be mutated in place
+        s1.expired_attributes.add("name")
+        eq_(s1.expired_attributes, {"name"})
+        eq_(s2.expired_attributes, set())
+        is_not(s1.expired_attributes, s2.expired_attributes)
+        eq_(util.EMPTY_SET, frozenset())
+
     def test_expire_autoflush(self):
         User, users = self.classes.User, self.tables.users
         Address, addresses = self.classes.Address, self.tables.addresses
@@ -7,8 +7,13 @@ from sqlalchemy import select
 from sqlalchemy import testing
 from sqlalchemy import text
 from sqlalchemy import update
+from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import loading
 from sqlalchemy.orm import relationship
+from sqlalchemy.testing import expect_raises
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
@@ -213,6 +218,150 @@ class InstancesTest(_fixtures.FixtureTest):
         )
 
 
+class ReadonlyLoadTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def test_readonly_objects(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        stmt = select(User).order_by(User.id).execution_options(readonly=True)
+        result = s.scalars(stmt).all()
+
+        eq_(
+            [(u.id, u.name) for u in result],
+            [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")],
+        )
+        for u in result:
+            assert isinstance(u, User)
+            assert "_sa_instance_state" not in u.__dict__
+            eq_(set(u.__dict__), {"id", "name"})
+
+        eq_(len(s.identity_map), 0)
+
+    def test_readonly_distinct_from_identity_map(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        u7 = s.get(User, 7)
+
+        ro_u7 = s.scalars(
+            select(User).where(User.id == 7).execution_options(readonly=True)
+        ).one()
+
+        is_not(ro_u7, u7)
+        eq_(ro_u7.name, "jack")
+        eq_(list(s.identity_map.values()), [u7])
+
+    def test_readonly_mixed_with_columns(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        rows = s.execute(
+            select(User, Address.email_address)
+            .join(User.addresses)
+            .where(User.id == 8)
+            .order_by(Address.id),
+            execution_options={"readonly": True},
+        ).all()
+
+        eq_(
+            [(u.id, email) for u, email in rows],
+            [
+                (8, "ed@wood.com"),
+                (8, "ed@bettyboop.com"),
+                (8, "ed@lala.com"),
+            ],
+        )
+
+        # rows with the same identity within a result share one object
+        eq_(len({id(u) for u, email in rows}), 1)
+
+    def test_readonly_joined_eager_unique(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        result = (
+            s.scalars(
+                select(User)
+                .options(joinedload(User.addresses))
+                .where(User.id == 8)
+                .execution_options(readonly=True)
+            )
+            .unique()
+            .all()
+        )
+
+        eq_(len(result), 1)
+        eq_(result[0].name, "ed")
+
+    def test_readonly_unique_per_result(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        stmt = (
+            select(User).where(User.id == 7).execution_options(readonly=True)
+        )
+        u1 = s.scalars(stmt).one()
+        u2 = s.scalars(stmt).one()
+
+        is_not(u1, u2)
+
+    @testing.combinations("set", "delete", argnames="op")
+    def test_readonly_modify_raises(self, op):
+        User = self.classes.User
+        s = fixture_session()
+
+        u7 = s.scalars(
+            select(User).where(User.id == 7).execution_options(readonly=True)
+        ).one()
+
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Can't modify attribute 'name' on .*User object; it has no "
+            "ORM instance state.  Objects loaded using the 'readonly' "
+            "execution option",
+        ):
+            if op == "set":
+                u7.name = "newname"
+            else:
+                del u7.name
+
+        eq_(u7.name, "jack")
+
+    def test_readonly_no_relationships(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        u7 = s.scalars(
+            select(User).where(User.id == 7).execution_options(readonly=True)
+        ).one()
+
+        with expect_raises(orm_exc.UnmappedInstanceError):
+            u7.addresses
+
+    def test_readonly_no_outer_join_null_entity(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        rows = s.execute(
+            select(User, Address)
+            .outerjoin(User.addresses)
+            .where(User.id == 10)
+            .execution_options(readonly=True)
+        ).all()
+
+        eq_(len(rows), 1)
+        eq_(rows[0][0].name, "chuck")
+        is_(rows[0][1], None)
+
+
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
     run_inserts = "once"
@@ -4,6 +4,7 @@ import re
 
 import sqlalchemy as sa
 from sqlalchemy import column
+from sqlalchemy import event
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import inspect
@@ -30,6 +31,7 @@ from sqlalchemy.orm import deferred
 from sqlalchemy.orm import dynamic_loader
 from sqlalchemy.orm import Load
 from sqlalchemy.orm import load_only
+from sqlalchemy.orm import Mapper
 from sqlalchemy.orm import reconstructor
 from sqlalchemy.orm import registry
 from sqlalchemy.orm import relationship
@@ -38,6 +40,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm import synonym
 from sqlalchemy.orm.base import _is_aliased_class
 from sqlalchemy.orm.base import _is_mapped_class
+from sqlalchemy.orm.mapper import _unconfigured_relationship_graph
 from sqlalchemy.orm.persistence import _sort_states
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
@@ -50,6 +53,7 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
+from sqlalchemy.testing import mock
 from sqlalchemy.testing import ne_
 from sqlalchemy.testing.entities import ComparableEntity
 from sqlalchemy.testing.entities import ComparableMixin
@@ -3404,6 +3408,156 @@ class RegistryConfigDisposeTest(fixtures.TestBase):
                 reg3.dispose()
 
 
+class IncrementalConfigureTest(fixtures.TestBase):
+    """test registry(incremental_configure=True)"""
+
+    @testing.fixture
+    def incremental_fixture(self):
+        reg = registry(incremental_configure=True)
+
+        @reg.mapped
+        class A:
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+            type = Column(String(20))
+            bs = relationship("B")
+
+            __mapper_args__ = {
+                "polymorphic_on": type,
+                "polymorphic_identity": "a",
+            }
+
+        class ASub(A):
+            __mapper_args__ = {"polymorphic_identity": "asub"}
+
+        reg.mapped(ASub)
+
+        @reg.mapped
+        class B:
+            __tablename__ = "b"
+            id = Column(Integer, primary_key=True)
+            a_id = Column(ForeignKey("a.id"))
+
+        @reg.mapped
+        class D:
+            __tablename__ = "d"
+            id = Column(Integer, primary_key=True)
+            a_id = Column(ForeignKey("a.id"))
+            a = relationship("A", backref="ds")
+
+        @reg.mapped
+        class X:
+            __tablename__ = "x"
+            id = Column(Integer, primary_key=True)
+            ys = relationship("Y")
+
+        @reg.mapped
+        class Y:
+            __tablename__ = "y"
+            id = Column(Integer, primary_key=True)
+            x_id = Column(ForeignKey("x.id"))
+
+        yield reg
+
+        clear_mappers()
+
+    def test_configures_reachable_only(self, incremental_fixture):
+        reg = incremental_fixture
+        cr = reg._class_registry
+        A, ASub, B, D, X, Y = (
+            cr[name] for name in ("A", "ASub", "B", "D", "X", "Y")
+        )
+
+        inspect(A).attrs
+
+        for cls in (A, ASub, B, D):
+            is_true(cls.__mapper__.configured)
+        for cls in (X, Y):
+            is_false(cls.__mapper__.configured)
+
+        # backref established by D is present
+        is_true(inspect(A).has_property("ds"))
+        is_(reg._new_mappers, True)
+
+        # Y does not refer to X
+        inspect(Y).attrs
+        is_true(Y.__mapper__.configured)
+        is_false(X.__mapper__.configured)
+        is_(reg._new_mappers, True)
+
+        inspect(X).attrs
+        is_true(X.__mapper__.configured)
+        is_(reg._new_mappers, False)
+
+    def test_registry_configure_configures_all(self, incremental_fixture):
+        reg = incremental_fixture
+        reg.configure()
+
+        is_(reg._new_mappers, False)
+        for mapper in reg.mappers:
+            is_true(mapper.configured)
+
+    def test_events_per_pass(self, incremental_fixture):
+        reg = incremental_fixture
+        cr = reg._class_registry
+
+        canary = mock.Mock()
+        event.listen(Mapper, "after_configured", canary.after_configured)
+        event.listen(Mapper, "mapper_configured", canary.mapper_configured)
+
+        inspect(cr["A"]).attrs
+        inspect(cr["B"]).attrs
+        inspect(cr["X"]).attrs
+
+        eq_(canary.after_configured.mock_calls, [mock.call(), mock.call()])
+        eq_(
+            {c.args[1] for c in canary.mapper_configured.mock_calls},
+            {cr[name] for name in ("A", "ASub", "B", "D", "X", "Y")},
+        )
+
+    def test_new_backref_onto_configured(self, incremental_fixture):
+        reg = incremental_fixture
+        A = reg._class_registry["A"]
+
+        inspect(A).attrs
+        is_false(inspect(A).has_property("es"))
+
+        @reg.mapped
+        class E:
+            __tablename__ = "e"
+            id = Column(Integer, primary_key=True)
+            a_id = Column(ForeignKey("a.id"))
+            a = relationship("A", backref="es")
+
+        A()
+        is_true(E.__mapper__.configured)
+        is_true(inspect(A).has_property("es"))
+        is_false(reg._class_registry["X"].__mapper__.configured)
+
+    def test_graph_collected_once_per_generation(self, incremental_fixture):
+        reg = incremental_fixture
+        cr = reg._class_registry
+
+        with mock.patch(
+            "sqlalchemy.orm.mapper._unconfigured_relationship_graph",
+            wraps=_unconfigured_relationship_graph,
+        ) as collect:
+            inspect(cr["A"]).attrs
+            inspect(cr["Y"]).attrs
+            eq_(collect.call_count, 1)
+
+            @reg.mapped
+            class E:
+                __tablename__ = "e"
+                id = Column(Integer, primary_key=True)
+
+            inspect(E).attrs
+            inspect(cr["X"]).attrs
+            eq_(collect.call_count, 2)
+
+        is_(reg._new_mappers, False)
+
+
 class ConfigureOrNotConfigureTest(_fixtures.FixtureTest, AssertsCompiledSQL):
     __dialect__ = "default"
 
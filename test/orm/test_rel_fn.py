@@ -22,6 +22,8 @@ from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import expect_raises_message
 
@@ -1233,6 +1235,40 @@ class AdaptedJoinTest(_JoinFixtures, fixtures.TestBase, AssertsCompiledSQL):
         self.assert_compile(pj, "lft.id = pj.lid")
         self.assert_compile(pj, "lft.id = pj.lid")
 
+    def test_join_targets_o2m_left_aliased_extra_criteria(self):
+        """unrelated expressions in extra_criteria are excluded from
+        adaptation by identity; expressions against the parent or target
+        mapper are adapted"""
+
+        joincond = self._join_fixture_o2m()
+        left = select(joincond.parent_persist_selectable).alias("pj")
+        parent_y = self.left.c.y._annotate(
+            {"parentmapper": joincond.prop.parent}
+        )
+        pj, sj, sec, adapter, ds = joincond.join_targets(
+            left,
+            joincond.child_persist_selectable,
+            True,
+            extra_criteria=(self.left.c.x == 5, parent_y == 7),
+        )
+        self.assert_compile(
+            pj, "pj.id = rgt.lid AND lft.x = :x_1 AND pj.y = :y_1"
+        )
+
+    def test_col_in_annotations_exclude_ids(self):
+        c1, c2 = self.left.c.x, self.left.c.y
+        exclude = relationships._ColInAnnotations(
+            "local", exclude_ids=frozenset([id(c1)])
+        )
+
+        is_true(exclude(c1))
+        is_false(exclude(c2))
+        is_true(exclude(c2._annotate({"local": True})))
+
+        # identity based; an annotated copy of an excluded element
+        # is not excluded
+        is_false(exclude(c1._annotate({"remote": True})))
+
     def test_join_targets_o2m_composite_selfref(self):
         joincond = self._join_fixture_o2m_composite_selfref()
         right = select(joincond.child_persist_selectable).alias("pj")
@@ -13,6 +13,7 @@ from sqlalchemy import exc as sa_exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import insert
+from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import literal_column
 from sqlalchemy import orm
@@ -42,6 +43,8 @@ from sqlalchemy.orm.decl_api import declared_attr
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not
 from sqlalchemy.testing.assertions import expect_raises
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.fixtures import fixture_session
@@ -611,6 +614,39 @@ class LoaderCriteriaTest(_Fixtures, testing.AssertsCompiledSQL):
             "ON users.id = addresses.user_id AND addresses.id = anon_1.id",
         )
 
+    @testing.combinations(
+        (lambda Address: Address.email_address != "name", False),
+        (
+            lambda Address: Address.id.in_(
+                select(Address.id).where(Address.email_address != "name")
+            ),
+            True,
+        ),
+        (
+            lambda Address: Address.id
+            == select(Address.id).where(Address.id == 8).subquery().c.id,
+            True,
+        ),
+        argnames="crit, annotated",
+    )
+    def test_resolve_where_criteria_annotation(
+        self, user_address_fixture, crit, annotated
+    ):
+        """criteria that refers to no SELECT is used as is, without
+        the per-compile deep annotation used to detect recursion"""
+
+        User, Address = user_address_fixture
+
+        crit = resolve_lambda(crit, Address=Address)
+        opt = with_loader_criteria(Address, crit)
+
+        resolved = opt._resolve_where_criteria(inspect(Address))
+        if annotated:
+            is_not(resolved, opt.where_criteria)
+            is_(resolved._annotations["for_loader_criteria"], opt)
+        else:
+            is_(resolved, opt.where_criteria)
+
     def test_select_mapper_columns_mapper_criteria(self, user_address_fixture):
         User, Address = user_address_fixture
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect as _py_inspect
 import pickle
 from typing import TYPE_CHECKING
@@ -24,6 +25,7 @@ from sqlalchemy.orm import backref
 from sqlalchemy.orm import close_all_sessions
 from sqlalchemy.orm import exc as orm_exc
 from sqlalchemy.orm import immediateload
+from sqlalchemy.orm import LRUInstanceDict
 from sqlalchemy.orm import make_transient
 from sqlalchemy.orm import make_transient_to_detached
 from sqlalchemy.orm import object_session
@@ -1849,6 +1851,100 @@ class WeakIdentityMapTest(_fixtures.FixtureTest):
         assert not sess.identity_map.contains_state(u2._sa_instance_state)
 
 
+class LRUIdentityMapTest(_fixtures.FixtureTest):
+    run_inserts = "each"
+
+    @testing.fixture
+    def lru_session(self):
+        users, User = self.tables.users, self.classes.User
+        self.mapper_registry.map_imperatively(User, users)
+
+        sess = fixture_session(
+            identity_map_cls=functools.partial(
+                LRUInstanceDict, size=2, threshold=0
+            )
+        )
+        yield sess
+        sess.close()
+
+    def test_map_cls(self, lru_session):
+        is_true(isinstance(lru_session.identity_map, LRUInstanceDict))
+        eq_(lru_session.identity_map.size, 2)
+
+        lru_session.close()
+        is_true(isinstance(lru_session.identity_map, LRUInstanceDict))
+
+    def test_strong_refs_bounded(self, lru_session):
+        User = self.classes.User
+
+        for id_ in (7, 8, 9):
+            lru_session.get(User, id_)
+        gc_collect()
+
+        # the two most recently used objects are still present
+        eq_(
+            sorted(key[1] for key in lru_session.identity_map.keys()),
+            [(8,), (9,)],
+        )
+        eq_(
+            sorted(u.id for u in lru_session.identity_map.values()),
+            [8, 9],
+        )
+
+    def test_lookup_refreshes_lru(self, lru_session):
+        User = self.classes.User
+
+        lru_session.get(User, 7)
+        lru_session.get(User, 8)
+        lru_session.get(User, 7)
+        lru_session.get(User, 9)
+        gc_collect()
+
+        eq_(
+            sorted(u.id for u in lru_session.identity_map.values()),
+            [7, 9],
+        )
+
+    def test_hits_misses(self, lru_session):
+        User = self.classes.User
+
+        imap = lru_session.identity_map
+
+        # one miss when checking the identity map, one miss when
+        # processing the loaded row
+        lru_session.get(User, 7)
+        eq_((imap.hits, imap.misses), (0, 2))
+
+        lru_session.get(User, 7)
+        eq_((imap.hits, imap.misses), (1, 2))
+
+        lru_session.scalars(select(User).order_by(User.id)).all()
+        eq_((imap.hits, imap.misses), (2, 5))
+
+        imap.reset_stats()
+        eq_((imap.hits, imap.misses), (0, 0))
+
+    def test_expunge_releases_ref(self, lru_session):
+        User = self.classes.User
+
+        u1 = lru_session.get(User, 7)
+        lru_session.expunge(u1)
+        del u1
+        gc_collect()
+
+        eq_(len(lru_session.identity_map._strong_refs), 0)
+        eq_(len(lru_session.identity_map), 0)
+
+    def test_close_releases_refs(self, lru_session):
+        User = self.classes.User
+
+        lru_session.get(User, 7)
+        imap = lru_session.identity_map
+        lru_session.close()
+
+        eq_(len(imap._strong_refs), 0)
+
+
 class IsModifiedTest(_fixtures.FixtureTest):
     run_inserts = None
 
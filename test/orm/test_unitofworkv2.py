@@ -2306,6 +2306,70 @@ class LoadersUsingCommittedTest(UOWTest):
             pass
 
 
+class WideTableUpdateTest(fixtures.MappedTest):
+    """test that UPDATE collection for a wide table only considers
+    the attributes that were actually modified."""
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "wide",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            *[Column("col%d" % i, Integer) for i in range(50)],
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Wide(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        cls.mapper_registry.map_imperatively(cls.classes.Wide, cls.tables.wide)
+
+    def test_update_modified_only(self):
+        Wide = self.classes.Wide
+
+        sess = fixture_session()
+        w1 = Wide(id=1, **{"col%d" % i: i for i in range(50)})
+        sess.add(w1)
+        sess.flush()
+
+        w1.col7 = 70
+        w1.col42 = 420
+
+        # set to the same value; no net change
+        w1.col13 = 13
+
+        eq_(
+            set(attributes.instance_state(w1).committed_state),
+            {"col7", "col42", "col13"},
+        )
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE wide SET col7=:col7, col42=:col42 "
+                "WHERE wide.id = :wide_id",
+                [{"col7": 70, "col42": 420, "wide_id": 1}],
+            ),
+        )
+
+    def test_no_net_change_no_update(self):
+        Wide = self.classes.Wide
+
+        sess = fixture_session()
+        w1 = Wide(id=1, col3=3)
+        sess.add(w1)
+        sess.flush()
+
+        w1.col3 = 3
+
+        self.assert_sql_count(testing.db, sess.flush, 0)
+
+
 class NoAttrEventInFlushTest(fixtures.MappedTest):
     """test [ticket:3167].
 
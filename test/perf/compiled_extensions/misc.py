@@ -296,3 +296,77 @@ class PrefixAnonMap(Case):
     @test_case
     def test_apply_p(self):
         self.name.apply_map(self.impl_w_present)
+
+
+class EventDispatch(Case):
+    NUMBER = 2_000_000
+
+    @staticmethod
+    def python():
+        from sqlalchemy.event import _attr_cy
+
+        py_attr = load_uncompiled_module(_attr_cy)
+        assert not py_attr._is_compiled()
+        return py_attr
+
+    @staticmethod
+    def cython():
+        from sqlalchemy.event import _attr_cy
+
+        assert _attr_cy._is_compiled()
+        return _attr_cy
+
+    IMPLEMENTATIONS = {
+        "python": python.__func__,
+        "cython": cython.__func__,
+    }
+
+    def init_objects(self):
+        impl = self.impl
+
+        def listener(target, value, oldvalue, initiator):
+            pass
+
+        class Empty:
+            __call__ = impl._empty_listener_call
+            __bool__ = impl._empty_listener_bool
+
+            def __init__(self, parent_listeners):
+                self.parent_listeners = parent_listeners
+
+        class Compound:
+            __call__ = impl._compound_listener_call
+            __bool__ = impl._compound_listener_bool
+
+            def __init__(self, parent_listeners, listeners):
+                self.parent_listeners = parent_listeners
+                self.listeners = listeners
+
+        self.empty_none = Empty(())
+        self.empty_three = Empty([listener] * 3)
+        self.compound_none = Compound((), ())
+        self.compound_three = Compound([listener] * 2, [listener])
+
+    @classmethod
+    def update_results(cls, results):
+        cls._divide_results(results, "cython", "python", "cy / py")
+
+    @test_case
+    def empty_no_listeners_bool(self):
+        bool(self.empty_none)
+
+    @test_case
+    def empty_three_listeners_call(self):
+        self.empty_three(1, 2, 3, 4)
+
+    @test_case
+    def compound_no_listeners_bool(self):
+        bool(self.compound_none)
+
+    @test_case
+    def compound_no_listeners_call(self):
+        self.compound_none(1, 2, 3, 4)
+
+    @test_case
+    def compound_three_listeners_call(self):
+        self.compound_three(1, 2, 3, 4)
@@ -87,6 +87,7 @@ from sqlalchemy.sql import label
 from sqlalchemy.sql import operators
 from sqlalchemy.sql import table
 from sqlalchemy.sql import util as sql_util
+from sqlalchemy.sql import visitors
 from sqlalchemy.sql.elements import BooleanClauseList
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.elements import CompilerColumnElement
@@ -3605,6 +3606,28 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
 class BindParameterTest(AssertsCompiledSQL, fixtures.TestBase):
     __dialect__ = "default"
 
+    @testing.variation("cloned", [True, False])
+    def test_override_binds(self, cloned):
+        """the bindparams an _OverrideBinds replaces are located by key,
+        or by lineage when the nested element has been cloned with new
+        bindparam keys"""
+
+        expr = table1.c.myid == bindparam("p", 5, unique=True)
+        orig = expr.right
+
+        if cloned:
+            expr = visitors.cloned_traverse(expr, {}, {})
+            ne_(expr.right.key, orig.key)
+
+        override = elements._OverrideBinds(
+            expr, [orig._with_value(10, maintain_key=True)], [orig]
+        )
+        self.assert_compile(
+            select(table1.c.myid).where(override),
+            "SELECT mytable.myid FROM mytable WHERE mytable.myid = :p_1",
+            checkparams={"p_1": 10},
+        )
+
     def test_binds(self):
         for (
             stmt,
@@ -7614,6 +7637,67 @@ class ResultMapTest(fixtures.TestBase):
             },
         )
 
+    @testing.combinations(
+        lambda t: select(t).where(t.c.a == bindparam("p")),
+        lambda t: select(t.c.a, t.c.b, t.c.a),
+        lambda t: select(t.c.b, literal_column("q"), t.c.a.label("x")),
+        lambda t: select(t.c.a, func.count(t.c.b)).group_by(t.c.a),
+        lambda t: select(t).set_label_style(LABEL_STYLE_TABLENAME_PLUS_COL),
+        lambda t: select(t.c.c, t.c.a).union(select(t.c.a, t.c.b)),
+        lambda t: select(t.c.a).where(
+            t.c.b.in_(select(t.c.b).scalar_subquery())
+        ),
+        lambda t: select(select(t).subquery()),
+        lambda t: select(t.alias(), t),
+        argnames="fn",
+    )
+    def test_plain_column_rendering_matches_labeled(self, fn):
+        """test that columns rendered directly by _label_select_columns
+        come out the same as when passed through _label_select_column"""
+
+        class MyType(types.TypeDecorator):
+            impl = String
+            cache_ok = True
+
+            def column_expression(self, col):
+                return func.lower(col)
+
+        t = Table(
+            "t",
+            MetaData(),
+            Column("a", Integer),
+            Column("b", String),
+            Column("c", MyType),
+        )
+
+        class GenericCompiler(compiler.SQLCompiler):
+            def _label_select_column(self, *arg, **kw):
+                return super()._label_select_column(*arg, **kw)
+
+        stmt = fn(t)
+        dialect = default.DefaultDialect()
+        comp = compiler.SQLCompiler(dialect, stmt)
+        generic = GenericCompiler(dialect, stmt)
+
+        def result_columns(comp):
+            # labels and column expressions are generated per compile
+            return [
+                (
+                    keyname,
+                    name,
+                    tuple(
+                        obj
+                        for obj in objects
+                        if isinstance(obj, (str, ColumnClause))
+                    ),
+                    type(type_),
+                )
+                for keyname, name, objects, type_ in comp._result_columns
+            ]
+
+        eq_(comp.string, generic.string)
+        eq_(result_columns(comp), result_columns(generic))
+
     def test_label_conflict_union(self):
         t1 = Table(
             "t1", MetaData(), Column("a", Integer), Column("b", Integer)
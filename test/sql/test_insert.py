@@ -1981,3 +1981,97 @@ class MultirowTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             "SQL expression is required",
             table.insert().values(values).compile,
         )
+
+
+class InsertManyValuesBulkParamsTest(fixtures.TestBase):
+    """test the eligibility of an insertmanyvalues INSERT for dialects
+    that send its rows in bulk rather than as INSERT..VALUES, such as
+    the LOAD DATA and OPENJSON modes of the MySQL and SQL Server dialects.
+
+    """
+
+    @testing.fixture
+    def table_fixture(self):
+        return Table(
+            "some_table",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            Column("created", Integer, default=func.now()),
+        )
+
+    def _compile(self, stmt, **kw):
+        dialect = sqlite.dialect()
+        dialect.use_insertmanyvalues_wo_returning = True
+        return stmt.compile(
+            dialect=dialect,
+            column_keys=["id", "data"],
+            for_executemany=True,
+            **kw,
+        )
+
+    def test_params(self, table_fixture):
+        t = table_fixture
+        compiled = self._compile(t.insert())
+
+        eq_(
+            compiled._insertmanyvalues_bulk_params(),
+            [
+                (t.c.id, "id", "?", "id"),
+                (t.c.data, "data", "?", "data"),
+                (t.c.created, "created", "CURRENT_TIMESTAMP", None),
+            ],
+        )
+
+    def test_escaped_bind_name(self):
+        t = Table(
+            "some_table",
+            MetaData(),
+            Column("some.id", Integer, primary_key=True),
+        )
+        compiled = t.insert().compile(
+            dialect=postgresql.dialect(paramstyle="pyformat"),
+            column_keys=["some.id"],
+            for_executemany=True,
+        )
+
+        eq_(
+            compiled._insertmanyvalues_bulk_params(),
+            [(t.c["some.id"], '"some.id"', "%(some_id)s", "some.id")],
+        )
+
+    @testing.combinations(
+        (lambda t: t.insert().prefix_with("OR IGNORE"),),
+        (lambda t: t.insert().returning(t.c.id),),
+        (lambda t: t.insert().values(data=func.lower(bindparam("data"))),),
+        (
+            lambda t: t.insert().values(
+                data=func.lower(bindparam("data", expanding=True))
+            ),
+        ),
+        (
+            lambda t: sqlite.insert(t).on_conflict_do_update(
+                index_elements=[t.c.id], set_={"data": "x"}
+            ),
+        ),
+        argnames="stmt_fn",
+    )
+    def test_not_eligible(self, table_fixture, stmt_fn):
+        compiled = self._compile(
+            testing.resolve_lambda(stmt_fn, t=table_fixture)
+        )
+
+        eq_(compiled._insertmanyvalues_bulk_params(), None)
+
+    def test_not_eligible_schema_translate(self, table_fixture):
+        compiled = self._compile(
+            table_fixture.insert(),
+            schema_translate_map={None: "other"},
+        )
+
+        eq_(compiled._insertmanyvalues_bulk_params(), None)
+
+    def test_not_insertmanyvalues(self, table_fixture):
+        compiled = table_fixture.insert().compile(dialect=sqlite.dialect())
+
+        eq_(compiled._insertmanyvalues_bulk_params(), None)
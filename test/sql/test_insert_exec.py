@@ -36,6 +36,8 @@ from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_true
+from sqlalchemy.testing import le_
 from sqlalchemy.testing import mock
 from sqlalchemy.testing import provision
 from sqlalchemy.testing.fixtures import insertmanyvalues_fixture
@@ -1199,6 +1201,85 @@ class InsertManyValuesTest(fixtures.RemovesEvents, fixtures.TablesTest):
             + (1 if totalnum % assert_batchsize else 0),
         )
 
+    @testing.variation("row_width", ["narrow", "wide"])
+    def test_max_statement_size(self, connection, row_width):
+        t = self.tables.data
+
+        if row_width.narrow:
+            data = [{"x": "x%d" % i, "y": "y%d" % i} for i in range(250)]
+        else:
+            data = [
+                {"x": "x%d" % i + "x" * 40, "y": "y%d" % i + "y" * 40}
+                for i in range(250)
+            ]
+
+        max_statement_size = 4000
+        batches = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT"):
+                batches.append(
+                    (
+                        statement,
+                        parameters,
+                        context.insertmanyvalues_batch,
+                    )
+                )
+
+        with mock.patch.object(
+            connection.dialect,
+            "insertmanyvalues_max_statement_size",
+            max_statement_size,
+        ):
+            connection.execute(
+                t.insert()
+                .returning(t.c.id)
+                .execution_options(insertmanyvalues_page_size=50),
+                data,
+            )
+
+        eq_(
+            connection.execute(select(t.c.x).order_by(t.c.id)).all(),
+            [(row["x"],) for row in data],
+        )
+
+        eq_(
+            [imv_batch.batchnum for _, _, imv_batch in batches],
+            list(range(1, len(batches) + 1)),
+        )
+        eq_(
+            {imv_batch.total_batches for _, _, imv_batch in batches},
+            {len(batches)},
+        )
+        eq_(
+            sum(imv_batch.current_batch_size for _, _, imv_batch in batches),
+            len(data),
+        )
+
+        if row_width.narrow:
+            # narrow rows fit within the size at the full page size
+            eq_(
+                [imv_batch.current_batch_size for _, _, imv_batch in batches],
+                [50] * 5,
+            )
+        else:
+            # wide rows are split into smaller batches that stay within
+            # the size
+            for statement, parameters, imv_batch in batches:
+                is_true(imv_batch.current_batch_size < 50)
+
+                param_values = (
+                    parameters.values()
+                    if isinstance(parameters, dict)
+                    else parameters
+                )
+                size = len(statement) + sum(
+                    len(value) if isinstance(value, str) else 32
+                    for value in param_values
+                )
+                le_(size, max_statement_size)
+
     def test_disabled(self, testing_engine):
         e = testing_engine(
             options={"use_insertmanyvalues": False},
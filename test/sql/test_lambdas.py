@@ -701,6 +701,57 @@ class LambdaElementTest(
 
         eq_(params, {"x_1": 10, "x_2": 12, "y_1": 14})
 
+    @testing.variation("access", ["direct", "attribute"])
+    def test_stmt_lambda_bindparam_extractors(self, access):
+        class Thing:
+            def __init__(self, value):
+                self.value = value
+
+        c1 = column("x")
+
+        def go(x, y):
+            if access.direct:
+                return lambdas.lambda_stmt(
+                    lambda: select(c1).where(c1 == x, c1 < y)
+                )
+            else:
+                thing = Thing(x)
+                return lambdas.lambda_stmt(
+                    lambda: select(c1).where(c1 == thing.value, c1 < y),
+                    track_closure_variables=False,
+                )
+
+        s1 = go(5, 8)
+        s2 = go(10, 12)
+
+        if access.direct:
+            # bound values that are closure variables are copied into
+            # the parameters directly
+            eq_(len(s2._rec.bindparam_extractors), 2)
+        else:
+            is_(s2._rec.bindparam_extractors, None)
+
+        s1key = s1._generate_cache_key()
+        s2key = s2._generate_cache_key()
+
+        eq_(s1key.key, s2key.key)
+        eq_([b.value for b in s1key.bindparams], [5, 8])
+        eq_([b.value for b in s2key.bindparams], [10, 12])
+
+        self.assert_compile(
+            s2,
+            (
+                "SELECT x WHERE x = :x_1 AND x < :y_1"
+                if access.direct
+                else "SELECT x WHERE x = :value_1 AND x < :y_1"
+            ),
+            checkparams=(
+                {"x_1": 10, "y_1": 12}
+                if access.direct
+                else {"value_1": 10, "y_1": 12}
+            ),
+        )
+
     def test_stmt_lambda_w_atonce_whereclause_novalue(self):
         def go(col_expr, whereclause):
             stmt = lambdas.lambda_stmt(lambda: select(col_expr))
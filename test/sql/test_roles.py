@@ -25,17 +25,21 @@ from sqlalchemy.sql import true
 from sqlalchemy.sql import True_
 from sqlalchemy.sql.coercions import expect
 from sqlalchemy.sql.elements import _truncated_label
+from sqlalchemy.sql.elements import BindParameter
 from sqlalchemy.sql.elements import Null
+from sqlalchemy.sql.lambdas import LambdaElement
 from sqlalchemy.sql.selectable import FromGrouping
 from sqlalchemy.sql.selectable import ScalarSelect
 from sqlalchemy.sql.selectable import SelectStatementGrouping
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_instance_of
 from sqlalchemy.testing import is_true
+from sqlalchemy.testing import not_in
 
 m = MetaData()
 
@@ -366,6 +370,91 @@ class RoleTest(fixtures.TestBase):
         self._test_role_neg_comparisons(roles.ColumnsClauseRole)
 
 
+class ResolutionCacheTest(fixtures.TestBase):
+    """test the per-(role, type) resolution cache used by expect()"""
+
+    @testing.fixture
+    def clear_cache(self):
+        existing = dict(coercions._resolution_cache)
+        coercions._resolution_cache.clear()
+        yield
+        coercions._resolution_cache.clear()
+        coercions._resolution_cache.update(existing)
+
+    @testing.combinations(
+        (roles.WhereHavingRole, lambda: t.c.q == 5, "as_role"),
+        (roles.ColumnsClauseRole, lambda: t.c.q, "as_role"),
+        (roles.OrderByRole, lambda: t.c.q, "as_role"),
+        (roles.ExpressionElementRole, lambda: 5, "literal"),
+        (roles.ExpressionElementRole, lambda: "some string", "literal"),
+        (roles.ConstExprRole, lambda: None, "literal"),
+        (roles.FromClauseRole, lambda: t, "as_role"),
+        (roles.LabeledColumnExprRole, lambda: t.c.q == 5, "implicit"),
+        argnames="role, fixture, resolution",
+    )
+    def test_cached_resolution(self, clear_cache, role, fixture, resolution):
+        resolutions = {
+            "as_role": coercions._RESOLVE_AS_ROLE,
+            "implicit": coercions._RESOLVE_IMPLICIT,
+            "literal": coercions._RESOLVE_LITERAL,
+        }
+
+        element = fixture()
+        uncached = expect(role, element)
+
+        eq_(
+            coercions._resolution_cache[(role, type(element))],
+            resolutions[resolution],
+        )
+
+        cached = expect(role, fixture())
+        is_(type(cached), type(uncached))
+        is_true(cached.compare(uncached))
+
+    def test_not_cached_for_arbitrary_literal(self, clear_cache):
+        class MyInt(int):
+            pass
+
+        is_instance_of(
+            expect(roles.ExpressionElementRole, MyInt(5)), BindParameter
+        )
+        not_in(
+            (roles.ExpressionElementRole, MyInt), coercions._resolution_cache
+        )
+
+    def test_not_cached_for_clause_element_attr(self, clear_cache):
+        class HasClauseElement:
+            def __clause_element__(self):
+                return t.c.q
+
+        is_(expect(roles.ColumnsClauseRole, HasClauseElement()), t.c.q)
+        not_in(
+            (roles.ColumnsClauseRole, HasClauseElement),
+            coercions._resolution_cache,
+        )
+
+    def test_not_cached_for_callable_type(self, clear_cache):
+        fn = lambda: t.c.q == 5  # noqa: E731
+
+        is_instance_of(expect(roles.WhereHavingRole, fn), LambdaElement)
+        not_in((roles.WhereHavingRole, type(fn)), coercions._resolution_cache)
+
+    def test_neg_resolution_is_cached(self, clear_cache):
+        for i in range(2):
+            assert_raises_message(
+                exc.ArgumentError,
+                r"SQL expression for WHERE/HAVING role expected, "
+                r"got .*NotAThing2",
+                expect,
+                roles.WhereHavingRole,
+                not_a_thing2,
+            )
+        eq_(
+            coercions._resolution_cache[(roles.WhereHavingRole, NotAThing2)],
+            coercions._RESOLVE_IMPLICIT,
+        )
+
+
 class SubqueryCoercionsTest(fixtures.TestBase, AssertsCompiledSQL):
     __dialect__ = "default"
 